@@ -0,0 +1,185 @@
+from functools import partial
+
+from promise import Promise, is_thenable
+
+from .execution.scope import get_current_scope
+
+
+class DataLoader(object):
+    '''
+    Coalesces the keys loaded while executing a query into calls of
+    ``batch_load_fn(keys)``, that has to return the list of values
+    (or a promise of it) in the same order as the keys.
+
+    Within an execution the keys are collected until the execution waits
+    for its results, then they are loaded in batches of up to
+    ``max_batch_size`` keys (or one by one if ``batch`` is False).
+    Outside of an execution the keys of each ``load`` or ``load_many``
+    call are loaded right away.
+
+    The promises of the loaded values are memoized in ``cache_map`` by
+    the key returned by ``get_cache_key``. Any object with ``get``,
+    ``__setitem__``, ``__delitem__`` and ``clear`` can be used, like an
+    ``LRUCache``.
+    '''
+
+    batch = True
+    max_batch_size = None
+    cache = True
+
+    def __init__(self, batch_load_fn=None, batch=None, max_batch_size=None,
+                 cache=None, get_cache_key=None, cache_map=None):
+        if batch_load_fn is not None:
+            self.batch_load_fn = batch_load_fn
+        assert callable(getattr(self, 'batch_load_fn', None)), (
+            'DataLoader needs a batch_load_fn, received "{}".'
+        ).format(batch_load_fn)
+        if batch is not None:
+            self.batch = batch
+        if max_batch_size is not None:
+            self.max_batch_size = max_batch_size
+        assert self.max_batch_size is None or self.max_batch_size > 0, (
+            'The max_batch_size has to be greater than 0, received "{}".'
+        ).format(self.max_batch_size)
+        if cache is not None:
+            self.cache = cache
+        if get_cache_key is not None:
+            self.get_cache_key = get_cache_key
+        self.cache_map = cache_map if cache_map is not None else {}
+        self._queue = []
+        self._scheduled = False
+
+    def get_cache_key(self, key):
+        return key
+
+    def load(self, key):
+        '''
+        Returns a promise of the value of the key.
+        '''
+        promise = self.enqueue(key)
+        self.schedule_dispatch()
+        return promise
+
+    def load_many(self, keys):
+        '''
+        Returns a promise of the list of values of the keys.
+        '''
+        promises = [self.enqueue(key) for key in keys]
+        self.schedule_dispatch()
+        return Promise.all(promises)
+
+    def enqueue(self, key):
+        assert key is not None, 'The key to load can not be None.'
+        if self.cache:
+            cache_key = self.get_cache_key(key)
+            cached = self.cache_map.get(cache_key)
+            if cached is not None:
+                return cached
+
+        promise = Promise()
+        if self.cache:
+            self.cache_map[cache_key] = promise
+        self._queue.append((key, promise))
+        return promise
+
+    def schedule_dispatch(self):
+        if not self._queue or self._scheduled:
+            return
+        scope = get_current_scope()
+        if scope is None or not self.batch:
+            self.dispatch()
+        else:
+            self._scheduled = True
+            scope.defer(self.dispatch)
+
+    def prime(self, key, value):
+        '''
+        Caches the value of the key, unless it is already cached.
+        '''
+        if self.cache:
+            cache_key = self.get_cache_key(key)
+            if self.cache_map.get(cache_key) is None:
+                if isinstance(value, Exception):
+                    promise = Promise.reject(value)
+                else:
+                    promise = Promise.resolve(value)
+                self.cache_map[cache_key] = promise
+        return self
+
+    def clear(self, key):
+        try:
+            del self.cache_map[self.get_cache_key(key)]
+        except KeyError:
+            pass
+        return self
+
+    def clear_all(self):
+        self.cache_map.clear()
+        return self
+
+    def dispatch(self):
+        queue, self._queue = self._queue, []
+        self._scheduled = False
+        if not queue:
+            return
+        size = self.max_batch_size or len(queue)
+        if not self.batch:
+            size = 1
+        for start in range(0, len(queue), size):
+            self.dispatch_batch(queue[start:start + size])
+
+    def dispatch_batch(self, batch):
+        keys = [key for key, _ in batch]
+        try:
+            values = self.batch_load_fn(keys)
+        except Exception as e:
+            return self.fail(batch, e)
+        if is_thenable(values):
+            return Promise.resolve(values).then(
+                partial(self.resolve_batch, batch),
+                partial(self.fail, batch)
+            )
+        self.resolve_batch(batch, values)
+
+    def resolve_batch(self, batch, values):
+        values = list(values)
+        if len(values) != len(batch):
+            return self.fail(batch, Exception((
+                'DataLoader must be constructed with a function which accepts a list of keys '
+                'and returns a list of values of the same length, received {} values for {} keys.'
+            ).format(len(values), len(batch))))
+        for (key, promise), value in zip(batch, values):
+            if isinstance(value, Exception):
+                # The errors are not cached, so the key can be loaded again
+                self.clear(key)
+                promise.do_reject(value)
+            else:
+                promise.do_resolve(value)
+
+    def fail(self, batch, error):
+        for key, promise in batch:
+            self.clear(key)
+            promise.do_reject(error)
+
+
+def get_loader(loader, *args, **options):
+    '''
+    Returns the DataLoader of the current execution for the given
+    DataLoader subclass (and positional arguments) or batch load function,
+    so its cache lasts for a single request. The keyword options are only
+    used for creating it. Outside of an execution a new loader is returned.
+    '''
+    if isinstance(loader, type) and issubclass(loader, DataLoader):
+        create = partial(loader, *args, **options)
+    else:
+        create = partial(DataLoader, loader, *args, **options)
+
+    scope = get_current_scope()
+    if scope is None:
+        return create()
+    key = (loader, ) + args if args else loader
+    with scope.lock:
+        instance = scope.loaders.get(key)
+        if instance is None:
+            instance = scope.loaders[key] = create()
+    return instance
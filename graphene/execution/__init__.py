@@ -0,0 +1,40 @@
+from .batching import BatchResolver
+from .cache import CachedResolver, CachePolicy, LocalCache
+from .cache_control import PRIVATE, PUBLIC, CacheControl
+from .compiler import CompiledQuery
+from .cost import CostAnalysis
+from .document_cache import DocumentCache, parse_and_validate
+from .executors import ThreadPoolExecutor
+from .limits import QueryLimits, query_limits
+from .metrics import ResolverMetrics
+from .offload import OffloadResolver, get_process_pool
+from .persisted import PersistedQueryRegistry, get_query_hash
+from .response_cache import ResponseCache
+from .scope import ExecutionScope, get_current_scope
+from .tracing import TracingMiddleware
+
+__all__ = [
+    'BatchResolver',
+    'CachedResolver',
+    'CachePolicy',
+    'LocalCache',
+    'CacheControl',
+    'PUBLIC',
+    'PRIVATE',
+    'CompiledQuery',
+    'CostAnalysis',
+    'DocumentCache',
+    'parse_and_validate',
+    'ThreadPoolExecutor',
+    'QueryLimits',
+    'query_limits',
+    'ResolverMetrics',
+    'OffloadResolver',
+    'get_process_pool',
+    'PersistedQueryRegistry',
+    'get_query_hash',
+    'ResponseCache',
+    'ExecutionScope',
+    'get_current_scope',
+    'TracingMiddleware',
+]
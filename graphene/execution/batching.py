@@ -0,0 +1,120 @@
+from promise import Promise, is_thenable
+
+from .scope import get_current_scope
+
+
+def check_batch_results(results, roots, info):
+    results = list(results)
+    if len(results) != len(roots):
+        raise Exception((
+            'The batch resolver of {}.{} has to return a result for each root, '
+            'received {} results for {} roots.'
+        ).format(info.parent_type, info.field_name, len(results), len(roots)))
+    return results
+
+
+def resolve_each(resolver, roots, args, context, info):
+    '''
+    Batch function resolving each root with a resolver of single roots,
+    like the default resolvers of the batched fields.
+    '''
+    return [resolver(root, args, context, info) for root in roots]
+
+
+class Batch(object):
+    '''
+    The roots of a batched field waiting to be resolved together.
+    '''
+
+    __slots__ = ('resolver', 'args', 'context', 'info', 'roots', 'promises')
+
+    def __init__(self, resolver, args, context, info):
+        self.resolver = resolver
+        self.args = args
+        self.context = context
+        self.info = info
+        self.roots = []
+        self.promises = []
+
+    def add(self, root):
+        promise = Promise()
+        self.roots.append(root)
+        self.promises.append(promise)
+        return promise
+
+    def dispatch(self):
+        try:
+            results = self.resolver.batch_fn(self.roots, self.args, self.context, self.info)
+        except Exception as e:
+            return self.reject(e)
+        if is_thenable(results):
+            return Promise.resolve(results).then(self.resolve, self.reject)
+        self.resolve(results)
+
+    def resolve(self, results):
+        try:
+            results = check_batch_results(results, self.roots, self.info)
+        except Exception as e:
+            return self.reject(e)
+        for promise, result in zip(self.promises, results):
+            if isinstance(result, Exception):
+                promise.do_reject(result)
+            else:
+                promise.do_resolve(result)
+
+    def reject(self, error):
+        for promise in self.promises:
+            promise.do_reject(error)
+
+
+class BatchResolver(object):
+    '''
+    Resolves a field for all the sibling roots at once, calling
+    ``batch_fn(roots, args, context, info)``, that has to return the list
+    of results (or a promise of it) in the same order as the roots.
+
+    Within an execution, the roots of the same field of the query are
+    collected until the execution waits for the results, so the field is
+    resolved with a single call per level of nesting. Outside of an
+    execution, the batch function is called with a single root.
+    '''
+
+    __slots__ = ('batch_fn', )
+
+    def __init__(self, batch_fn):
+        self.batch_fn = batch_fn
+
+    def __call__(self, root, args, context, info):
+        scope = get_current_scope()
+        if scope is None:
+            return self.resolve_single(root, args, context, info)
+
+        # All the roots of the same field node share the same arguments
+        key = self, id(info.field_asts[0])
+        with scope.lock:
+            batch = scope.batches.get(key)
+            created = batch is None
+            if created:
+                batch = scope.batches[key] = Batch(self, args, context, info)
+            promise = batch.add(root)
+        if created:
+            scope.defer(lambda: self.dispatch(scope, key))
+        return promise
+
+    def dispatch(self, scope, key):
+        with scope.lock:
+            batch = scope.batches.pop(key)
+        batch.dispatch()
+
+    def resolve_batch(self, roots, args, context, info):
+        '''
+        Returns the results for the given roots, waiting for them
+        if the batch function returns a promise.
+        '''
+        results = self.batch_fn(roots, args, context, info)
+        if is_thenable(results):
+            results = Promise.resolve(results).get()
+        return check_batch_results(results, roots, info)
+
+    def resolve_single(self, root, args, context, info):
+        return self.resolve_batch([root], args, context, info)[0]
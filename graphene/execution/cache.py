@@ -0,0 +1,150 @@
+import time
+from collections import Mapping
+
+from ..utils.lru_cache import LRUCache
+from ..utils.thenables import maybe_thenable
+
+MISSING = object()
+
+
+class LocalCache(LRUCache):
+    '''
+    An in-process ``LRUCache`` whose entries expire after the ``ttl``
+    seconds given when setting them.
+
+    Any object with the same ``get(key, default)``, ``set(key, value, ttl)``,
+    ``delete(key)`` and ``clear()`` methods can be used as the backend of
+    a ``CachePolicy``, like a client of a cache shared by many processes.
+    '''
+
+    timer = staticmethod(time.time)
+
+    def get(self, key, default=None):
+        entry = super(LocalCache, self).get(key, MISSING)
+        if entry is MISSING:
+            return default
+        value, expires = entry
+        if expires is not None and expires <= self.timer():
+            self.delete(key)
+            return default
+        return value
+
+    def set(self, key, value, ttl=None):
+        expires = self.timer() + ttl if ttl is not None else None
+        super(LocalCache, self).set(key, (value, expires))
+        return value
+
+
+def freeze(value):
+    if isinstance(value, Mapping):
+        return tuple(sorted((key, freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class CachePolicy(object):
+    '''
+    Memoizes the results of the resolver of a field for ``ttl`` seconds
+    (forever if None), keyed by the field, the key of its root (as
+    returned by ``key(root, args, context, info)``) and its arguments.
+
+    By default the root fields share their results and the rest are kept
+    by the ``id`` of their root (an attribute, or a key of dict roots).
+    The results of the roots without ``id`` are not cached.
+
+    By default the results are kept in a ``LocalCache`` of up to
+    ``max_entries`` entries, another backend can be given instead.
+
+    The ``on_hit`` and ``on_miss`` methods are called with the key of
+    each lookup, and the ``hits`` and ``misses`` are counted.
+    '''
+
+    def __init__(self, ttl=None, max_entries=1000, key=None, backend=None):
+        assert ttl is None or ttl > 0, 'The ttl has to be greater than 0, received "{}".'.format(ttl)
+        self.ttl = ttl
+        self.backend = backend if backend is not None else LocalCache(max_entries)
+        if key is not None:
+            self.get_parent_key = key
+        self.hits = 0
+        self.misses = 0
+
+    def get_parent_key(self, root, args, context, info):
+        if root is info.root_value:
+            return None
+        if isinstance(root, Mapping):
+            key = root.get('id')
+        else:
+            key = getattr(root, 'id', None)
+        # Keying by the root itself would keep the objects of each
+        # request alive in the cache, without ever hitting them
+        return MISSING if key is None else key
+
+    def get_key(self, root, args, context, info):
+        '''
+        Returns the key of the result, or None if it can't be cached.
+        '''
+        parent_key = self.get_parent_key(root, args, context, info)
+        if parent_key is MISSING:
+            return None
+        return (
+            info.parent_type.name,
+            info.field_name,
+            parent_key,
+            freeze(args),
+        )
+
+    @property
+    def hit_ratio(self):
+        lookups = self.hits + self.misses
+        return self.hits / float(lookups) if lookups else 0.0
+
+    def on_hit(self, key):
+        pass
+
+    def on_miss(self, key):
+        pass
+
+    def get(self, key):
+        value = self.backend.get(key, MISSING)
+        if value is MISSING:
+            self.misses += 1
+            self.on_miss(key)
+        else:
+            self.hits += 1
+            self.on_hit(key)
+        return value
+
+    def set(self, key, value):
+        self.backend.set(key, value, self.ttl)
+        return value
+
+    def clear(self):
+        self.backend.clear()
+
+
+class CachedResolver(object):
+    '''
+    Resolves a field with the cached results of its resolver, following
+    a ``CachePolicy``. The results of promises and awaitables are cached
+    once resolved, and the errors are not cached.
+    '''
+
+    def __init__(self, resolver, policy):
+        assert isinstance(policy, CachePolicy), (
+            'The cache of a field has to be a CachePolicy, received "{}".'
+        ).format(policy)
+        self.resolver = resolver
+        self.policy = policy
+
+    def __call__(self, root, args, context, info):
+        key = self.policy.get_key(root, args, context, info)
+        if key is None:
+            return self.resolver(root, args, context, info)
+        value = self.policy.get(key)
+        if value is not MISSING:
+            return value
+        return maybe_thenable(
+            self.resolver(root, args, context, info),
+            lambda value: self.policy.set(key, value)
+        )
@@ -0,0 +1,142 @@
+from collections import namedtuple
+
+from graphql.error import GraphQLError
+from graphql.language import ast
+from graphql.type.definition import get_named_type
+
+from ..utils.lru_cache import LRUCache
+from ..utils.thenables import maybe_thenable
+from .compiler import get_operation
+from .result import with_extensions
+
+PUBLIC = 'PUBLIC'
+PRIVATE = 'PRIVATE'
+CACHE_SCOPES = (PUBLIC, PRIVATE)
+
+CacheHints = namedtuple('CacheHints', ['max_age', 'scope'])
+
+
+def get_fragment_hints(schema, name, fragments, default_max_age, is_root, fragment_hints):
+    # The fragments are walked once, however many times they are spread
+    key = (name, is_root)
+    hints = fragment_hints.get(key)
+    if hints is None:
+        # Spreading a fragment within itself adds no hints (the cycles
+        # are reported by the validation)
+        fragment_hints[key] = (None, False)
+        fragment = fragments[name]
+        hints = fragment_hints[key] = get_cache_hints(
+            schema, schema.get_type(fragment.type_condition.name.value), fragment.selection_set,
+            fragments, default_max_age, is_root, fragment_hints
+        )
+    return hints
+
+
+def get_cache_hints(schema, parent_type, selection_set, fragments, default_max_age, is_root=False,
+                    fragment_hints=None):
+    '''
+    Returns the minimum ``max_age`` hinted by the fields of the selection
+    set (or None if none of them has a hint) and whether any of them is
+    private.
+
+    The root fields and the fields of objects without hints have the
+    ``default_max_age``, while the rest of fields without hints inherit
+    the one of their parent.
+    '''
+    if fragment_hints is None:
+        fragment_hints = {}
+    max_age = None
+    private = False
+    for selection in selection_set.selections:
+        if isinstance(selection, ast.Field):
+            name = selection.name.value
+            if name.startswith('__'):
+                continue
+            field_def = parent_type.fields[name]
+            ages = [getattr(field_def, 'max_age', None)]
+            if ages[0] is None and (is_root or selection.selection_set):
+                ages[0] = default_max_age
+            private = private or getattr(field_def, 'cache_scope', None) == PRIVATE
+            if selection.selection_set:
+                age, selection_private = get_cache_hints(
+                    schema, get_named_type(field_def.type), selection.selection_set,
+                    fragments, default_max_age, fragment_hints=fragment_hints
+                )
+                ages.append(age)
+                private = private or selection_private
+        else:
+            if isinstance(selection, ast.FragmentSpread):
+                age, selection_private = get_fragment_hints(
+                    schema, selection.name.value, fragments, default_max_age, is_root, fragment_hints
+                )
+            else:
+                selection_type = parent_type
+                if selection.type_condition:
+                    selection_type = schema.get_type(selection.type_condition.name.value)
+                age, selection_private = get_cache_hints(
+                    schema, selection_type, selection.selection_set, fragments,
+                    default_max_age, is_root, fragment_hints
+                )
+            ages = [age]
+            private = private or selection_private
+        for age in ages:
+            if age is not None and (max_age is None or age < max_age):
+                max_age = age
+    return max_age, private
+
+
+class CacheControl(object):
+    '''
+    Computes the cache hints of the operations executed by a schema from
+    the ``max_age`` and ``cache_scope`` of their fields (or the types
+    they return), remembering the ones of the last ``max_entries``
+    documents.
+
+    The hints are the minimum max age of the selected fields (0 for
+    mutations and subscriptions), and the ``PRIVATE`` scope if any of
+    them is private (``PUBLIC`` otherwise).
+    '''
+
+    def __init__(self, schema, default_max_age=0, max_entries=1000):
+        self.schema = schema
+        self.default_max_age = default_max_age
+        self.hints = LRUCache(max_entries)
+
+    def get_hints(self, document_ast, operation_name=None):
+        key = (document_ast, operation_name)
+        hints = self.hints.get(key)
+        if hints is None:
+            hints = self.hints.set(key, self.compute_hints(document_ast, operation_name))
+        return hints
+
+    def compute_hints(self, document_ast, operation_name):
+        operation, fragments = get_operation(document_ast, operation_name)
+        if operation.operation != 'query':
+            return CacheHints(max_age=0, scope=PUBLIC)
+        max_age, private = get_cache_hints(
+            self.schema, self.schema.get_query_type(), operation.selection_set,
+            fragments, self.default_max_age, is_root=True
+        )
+        return CacheHints(
+            max_age=self.default_max_age if max_age is None else max_age,
+            scope=PRIVATE if private else PUBLIC
+        )
+
+    def add_hints(self, result, document_ast, operation_name=None):
+        '''
+        Adds the cache hints of the operation to the ``extensions`` of
+        its result (or promise of it).
+        '''
+        try:
+            hints = self.get_hints(document_ast, operation_name)
+        except GraphQLError:
+            return result
+
+        def add(result):
+            if result.invalid:
+                return result
+            # The responses with errors should not be cached
+            max_age = 0 if result.errors else hints.max_age
+            return with_extensions(result, cacheControl={'maxAge': max_age, 'scope': hints.scope})
+
+        return maybe_thenable(result, add)
@@ -0,0 +1,587 @@
+import logging
+import sys
+from collections import Iterable, OrderedDict
+
+import six
+
+from graphql.error import GraphQLError, GraphQLLocatedError
+from graphql.execution.base import (ResolveInfo, collect_fields,
+                                    default_resolve_fn, get_field_def,
+                                    get_operation_root_type)
+from graphql.execution.executor import get_default_resolve_type_fn
+from graphql.execution.values import get_argument_values, get_variable_values
+from graphql.language import ast
+from graphql.pyutils.default_ordered_dict import DefaultOrderedDict
+from graphql.type import (GraphQLEnumType, GraphQLInterfaceType,
+                          GraphQLList, GraphQLNonNull, GraphQLObjectType,
+                          GraphQLScalarType, GraphQLUnionType)
+from graphql.type.directives import (GraphQLIncludeDirective,
+                                     GraphQLSkipDirective)
+from promise import Promise, is_thenable
+
+from ..types.resolver import AttributeResolver, DictResolver
+from .batching import BatchResolver
+from .result import ExecutionResult
+
+logger = logging.getLogger(__name__)
+
+# Values of these types can be serialized without checking whether
+# they are promises or errors first.
+plain_types = frozenset(six.integer_types + six.string_types + (six.text_type, float, bool))
+
+
+def get_operation(document_ast, operation_name=None):
+    '''
+    Returns the operation to execute in the document together with
+    the fragments defined in it, by name.
+    '''
+    operation = None
+    fragments = {}
+    for definition in document_ast.definitions:
+        if isinstance(definition, ast.OperationDefinition):
+            if not operation_name and operation:
+                raise GraphQLError('Must provide operation name if query contains multiple operations.')
+            if not operation_name or definition.name and definition.name.value == operation_name:
+                operation = definition
+        elif isinstance(definition, ast.FragmentDefinition):
+            fragments[definition.name.value] = definition
+        else:
+            raise GraphQLError(
+                u'GraphQL cannot execute a request containing a {}.'.format(definition.__class__.__name__),
+                definition
+            )
+
+    if not operation:
+        if operation_name:
+            raise GraphQLError(u'Unknown operation named "{}".'.format(operation_name))
+        raise GraphQLError('Must provide an operation.')
+
+    return operation, fragments
+
+
+def has_variables(value_ast):
+    if isinstance(value_ast, ast.Variable):
+        return True
+    if isinstance(value_ast, ast.ListValue):
+        return any(has_variables(value) for value in value_ast.values)
+    if isinstance(value_ast, ast.ObjectValue):
+        return any(has_variables(field.value) for field in value_ast.fields)
+    return False
+
+
+def get_directive_variables(selection_set, fragments, visited=None):
+    '''
+    Returns the names of the variables used by the @skip and @include
+    directives of the selection set, as they change the fields to execute.
+    '''
+    visited = set() if visited is None else visited
+    names = set()
+    directive_names = (GraphQLSkipDirective.name, GraphQLIncludeDirective.name)
+    for selection in selection_set.selections:
+        for directive in selection.directives or ():
+            if directive.name.value not in directive_names:
+                continue
+            for argument in directive.arguments:
+                if isinstance(argument.value, ast.Variable):
+                    names.add(argument.value.name.value)
+        if isinstance(selection, ast.FragmentSpread):
+            fragment_name = selection.name.value
+            fragment = fragments.get(fragment_name)
+            if fragment_name in visited or not fragment:
+                continue
+            visited.add(fragment_name)
+            names |= get_directive_variables(fragment.selection_set, fragments, visited)
+        elif selection.selection_set:
+            names |= get_directive_variables(selection.selection_set, fragments, visited)
+    return names
+
+
+def resolve_thenable(result):
+    return Promise.resolve(result).get()
+
+
+class CollectContext(object):
+    '''
+    The part of the graphql ExecutionContext needed for collecting
+    the fields of a selection set.
+    '''
+
+    __slots__ = ('schema', 'fragments', 'variable_values')
+
+    def __init__(self, schema, fragments, variable_values):
+        self.schema = schema
+        self.fragments = fragments
+        self.variable_values = variable_values
+
+
+class CompiledExecution(object):
+    '''
+    The state of a single execution of a compiled query.
+    '''
+
+    __slots__ = ('query', 'root_value', 'context_value', 'variable_values', 'errors', 'infos', 'args',
+                 'batched')
+
+    def __init__(self, query, root_value, context_value, variable_values):
+        self.query = query
+        self.root_value = root_value
+        self.context_value = context_value
+        self.variable_values = variable_values
+        self.errors = []
+        self.infos = {}
+        self.args = {}
+        self.batched = {}
+
+    def get_info(self, field):
+        info = self.infos.get(field)
+        if info is None:
+            info = self.infos[field] = ResolveInfo(
+                field.field_name,
+                field.field_asts,
+                field.return_type,
+                field.parent_type,
+                schema=self.query.schema,
+                fragments=self.query.fragments,
+                root_value=self.root_value,
+                operation=self.query.operation,
+                variable_values=self.variable_values,
+            )
+        return info
+
+    def get_batched_result(self, field, root):
+        # The results of batched fields are kept by root, along with the
+        # root itself so a different object with the same id is not mistaken.
+        entry = self.batched.get(field, {}).get(id(root))
+        if entry is not None and entry[0] is root:
+            return entry
+        return None
+
+    def get_args(self, field):
+        args = self.args.get(field)
+        if args is None:
+            args = self.args[field] = get_argument_values(
+                field.field_def.args,
+                field.field_asts[0].arguments,
+                self.variable_values
+            )
+        return args
+
+
+class CompiledField(object):
+    '''
+    The definition of a field of the query, bound at compile time.
+    '''
+
+    __slots__ = ('response_name', 'field_name', 'field_asts', 'field_def', 'return_type', 'parent_type')
+
+    def __init__(self, parent_type, response_name, field_asts, field_def):
+        self.response_name = response_name
+        self.field_name = field_asts[0].name.value
+        self.field_asts = field_asts
+        self.field_def = field_def
+        self.return_type = field_def.type
+        self.parent_type = parent_type
+
+
+class QueryCompiler(object):
+    '''
+    Compiles the selection sets of an operation into a tree of closures,
+    resolving at compile time the field definitions, resolvers, arguments
+    without variables, and the completion of each type.
+    '''
+
+    def __init__(self, schema, fragments, variable_values):
+        self.schema = schema
+        self.collect_context = CollectContext(schema, fragments, variable_values)
+        self._object_fields = {}
+
+    def compile_selection_sets(self, parent_type, field_asts):
+        fields = DefaultOrderedDict(list)
+        visited_fragment_names = set()
+        for field_ast in field_asts:
+            if field_ast.selection_set:
+                fields = collect_fields(
+                    self.collect_context, parent_type, field_ast.selection_set,
+                    fields, visited_fragment_names
+                )
+        return self.compile_fields(parent_type, fields)
+
+    def compile_fields(self, parent_type, fields):
+        compiled_fields = []
+        batched_fields = []
+        for response_name, field_asts in fields.items():
+            field_def = get_field_def(self.schema, parent_type, field_asts[0].name.value)
+            if not field_def:
+                continue
+            field = CompiledField(parent_type, response_name, field_asts, field_def)
+            compiled_fields.append((response_name, self.compile_field(field)))
+            if isinstance(field_def.resolver, BatchResolver):
+                batched_fields.append(self.compile_batch_prefetch(field))
+
+        def execute_fields(execution, root):
+            results = OrderedDict()
+            for response_name, resolve_field in compiled_fields:
+                results[response_name] = resolve_field(execution, root)
+            return results
+
+        def prefetch_fields(execution, items):
+            roots = [
+                item for item in items
+                if item is not None and not is_thenable(item) and not isinstance(item, Exception)
+            ]
+            if not roots:
+                return
+            for prefetch in batched_fields:
+                prefetch(execution, roots)
+
+        # Lists of this type resolve the batched fields for all their items
+        # before completing them.
+        execute_fields.prefetch = prefetch_fields if batched_fields else None
+        return execute_fields
+
+    def get_static_args(self, field):
+        arguments = field.field_asts[0].arguments
+        if not any(has_variables(argument.value) for argument in arguments):
+            # The arguments without variables are the same on every execution
+            return get_argument_values(field.field_def.args, arguments, {})
+        return None
+
+    def compile_field(self, field):
+        resolver = field.field_def.resolver or default_resolve_fn
+        static_args = self.get_static_args(field)
+        complete = self.compile_value(field.return_type, field.field_asts)
+        nullable = not isinstance(field.return_type, GraphQLNonNull)
+
+        if type(resolver) in (AttributeResolver, DictResolver):
+            return self.compile_default_field(field, resolver, complete, nullable)
+        if isinstance(resolver, BatchResolver):
+            return self.compile_batch_field(field, resolver, static_args, complete, nullable)
+
+        def resolve_field(execution, root):
+            info = execution.infos.get(field) or execution.get_info(field)
+            args = static_args
+            if args is None:
+                args = execution.get_args(field)
+            try:
+                result = resolver(root, args, execution.context_value, info)
+            except Exception as e:
+                logger.exception("An error occurred while resolving field {}.{}".format(
+                    info.parent_type.name, info.field_name
+                ))
+                e.stack = sys.exc_info()[2]
+                result = e
+            if not nullable:
+                return complete(execution, info, result)
+            try:
+                return complete(execution, info, result)
+            except Exception as e:
+                execution.errors.append(e)
+                return None
+
+        return resolve_field
+
+    def compile_default_field(self, field, resolver, complete, nullable):
+        # The default resolvers are inlined, reading the attribute (or key)
+        # of the root object without calling the resolver.
+        attname = resolver.attname
+        default_value = resolver.default_value
+        from_dict = isinstance(resolver, DictResolver)
+
+        def resolve_default_field(execution, root):
+            info = execution.infos.get(field) or execution.get_info(field)
+            try:
+                if from_dict:
+                    result = root.get(attname, default_value)
+                else:
+                    result = getattr(root, attname, default_value)
+            except Exception as e:
+                e.stack = sys.exc_info()[2]
+                result = e
+            if not nullable:
+                return complete(execution, info, result)
+            try:
+                return complete(execution, info, result)
+            except Exception as e:
+                execution.errors.append(e)
+                return None
+
+        return resolve_default_field
+
+    def compile_batch_field(self, field, resolver, static_args, complete, nullable):
+        # The roots in a list are resolved together when completing the
+        # list, any other root is resolved on its own.
+        def resolve_batch_field(execution, root):
+            info = execution.infos.get(field) or execution.get_info(field)
+            entry = execution.get_batched_result(field, root)
+            if entry is not None:
+                result = entry[1]
+            else:
+                args = static_args
+                if args is None:
+                    args = execution.get_args(field)
+                try:
+                    result = resolver.resolve_single(root, args, execution.context_value, info)
+                except Exception as e:
+                    logger.exception("An error occurred while resolving field {}.{}".format(
+                        info.parent_type.name, info.field_name
+                    ))
+                    e.stack = sys.exc_info()[2]
+                    result = e
+            if not nullable:
+                return complete(execution, info, result)
+            try:
+                return complete(execution, info, result)
+            except Exception as e:
+                execution.errors.append(e)
+                return None
+
+        return resolve_batch_field
+
+    def compile_batch_prefetch(self, field):
+        resolver = field.field_def.resolver
+        static_args = self.get_static_args(field)
+
+        def prefetch_field(execution, roots):
+            info = execution.infos.get(field) or execution.get_info(field)
+            args = static_args
+            if args is None:
+                args = execution.get_args(field)
+            try:
+                results = resolver.resolve_batch(roots, args, execution.context_value, info)
+            except Exception as e:
+                logger.exception("An error occurred while resolving field {}.{}".format(
+                    info.parent_type.name, info.field_name
+                ))
+                e.stack = sys.exc_info()[2]
+                results = [e] * len(roots)
+            execution.batched[field] = dict(
+                (id(root), (root, result)) for root, result in zip(roots, results)
+            )
+
+        return prefetch_field
+
+    def compile_value(self, return_type, field_asts):
+        is_leaf = isinstance(return_type, (GraphQLScalarType, GraphQLEnumType))
+        if isinstance(return_type, GraphQLNonNull):
+            complete = self.compile_nonnull_value(return_type, field_asts)
+        elif isinstance(return_type, GraphQLList):
+            complete = self.compile_list_value(return_type, field_asts)
+        elif is_leaf:
+            complete = self.compile_leaf_value(return_type)
+        elif isinstance(return_type, (GraphQLInterfaceType, GraphQLUnionType)):
+            complete = self.compile_abstract_value(return_type, field_asts)
+        elif isinstance(return_type, GraphQLObjectType):
+            complete = self.compile_object_value(return_type, field_asts)
+        else:
+            assert False, u'Cannot complete value of unexpected type "{}".'.format(return_type)
+
+        nullable = not isinstance(return_type, GraphQLNonNull)
+
+        def complete_value(execution, info, result):
+            if is_thenable(result):
+                try:
+                    result = resolve_thenable(result)
+                except Exception as e:
+                    raise GraphQLLocatedError(field_asts, original_error=e)
+            if isinstance(result, Exception):
+                raise GraphQLLocatedError(field_asts, original_error=result)
+            if nullable and result is None:
+                return None
+            return complete(execution, info, result)
+
+        if not is_leaf:
+            return complete_value
+
+        serialize = return_type.serialize
+
+        # Leaves are the most common values, so the plain ones skip
+        # the extra calls of the generic completion.
+        def complete_leaf_value(execution, info, result):
+            if type(result) in plain_types:
+                return serialize(result)
+            if result is None:
+                return None
+            if is_thenable(result) or isinstance(result, Exception):
+                return complete_value(execution, info, result)
+            return serialize(result)
+
+        return complete_leaf_value
+
+    def compile_nonnull_value(self, return_type, field_asts):
+        complete = self.compile_value(return_type.of_type, field_asts)
+
+        def complete_nonnull_value(execution, info, result):
+            completed = complete(execution, info, result)
+            if completed is None:
+                raise GraphQLError(
+                    'Cannot return null for non-nullable field {}.{}.'.format(info.parent_type, info.field_name),
+                    field_asts
+                )
+            return completed
+
+        return complete_nonnull_value
+
+    def compile_list_value(self, return_type, field_asts):
+        item_type = return_type.of_type
+        complete_item = self.compile_value(item_type, field_asts)
+        nullable = not isinstance(item_type, GraphQLNonNull)
+        prefetch = self.get_prefetch(item_type, field_asts)
+
+        def complete_list_value(execution, info, result):
+            assert isinstance(result, Iterable), \
+                ('User Error: expected iterable, but did not find one ' +
+                 'for field {}.{}.').format(info.parent_type, info.field_name)
+            if prefetch is not None:
+                result = list(result)
+                prefetch(execution, result)
+            if not nullable:
+                return [complete_item(execution, info, item) for item in result]
+            completed_results = []
+            for item in result:
+                try:
+                    completed = complete_item(execution, info, item)
+                except Exception as e:
+                    execution.errors.append(e)
+                    completed = None
+                completed_results.append(completed)
+            return completed_results
+
+        return complete_list_value
+
+    def get_prefetch(self, item_type, field_asts):
+        if isinstance(item_type, GraphQLNonNull):
+            item_type = item_type.of_type
+        if not isinstance(item_type, GraphQLObjectType):
+            return None
+        return self.get_object_fields(item_type, field_asts).prefetch
+
+    def compile_leaf_value(self, return_type):
+        serialize = return_type.serialize
+
+        def complete_leaf_value(execution, info, result):
+            return serialize(result)
+
+        return complete_leaf_value
+
+    def compile_object_value(self, return_type, field_asts):
+        execute_fields = self.get_object_fields(return_type, field_asts)
+        is_type_of = return_type.is_type_of
+
+        def complete_object_value(execution, info, result):
+            if is_type_of and not is_type_of(result, execution.context_value, info):
+                raise GraphQLError(
+                    u'Expected value of type "{}" but got: {}.'.format(return_type, type(result).__name__),
+                    field_asts
+                )
+            return execute_fields(execution, result)
+
+        return complete_object_value
+
+    def compile_abstract_value(self, return_type, field_asts):
+        schema = self.schema
+
+        def complete_abstract_value(execution, info, result):
+            if return_type.resolve_type:
+                runtime_type = return_type.resolve_type(result, execution.context_value, info)
+            else:
+                runtime_type = get_default_resolve_type_fn(result, execution.context_value, info, return_type)
+
+            if not isinstance(runtime_type, GraphQLObjectType):
+                raise GraphQLError(
+                    ('Abstract type {} must resolve to an Object type at runtime ' +
+                     'for field {}.{} with value "{}", received "{}".').format(
+                         return_type,
+                         info.parent_type,
+                         info.field_name,
+                         result,
+                         runtime_type,
+                    ),
+                    field_asts
+                )
+
+            if not schema.is_possible_type(return_type, runtime_type):
+                raise GraphQLError(
+                    u'Runtime Object type "{}" is not a possible type for "{}".'.format(runtime_type, return_type),
+                    field_asts
+                )
+
+            execute_fields = self.get_object_fields(runtime_type, field_asts)
+            return execute_fields(execution, result)
+
+        return complete_abstract_value
+
+    def get_object_fields(self, object_type, field_asts):
+        # The fields of abstract types are compiled on first use of each
+        # runtime type, so only the types actually returned get compiled.
+        key = object_type, tuple(field_asts)
+        execute_fields = self._object_fields.get(key)
+        if execute_fields is None:
+            execute_fields = self._object_fields[key] = self.compile_selection_sets(object_type, field_asts)
+        return execute_fields
+
+
+class CompiledQuery(object):
+    '''
+    An operation compiled ahead of time by ``Schema.compile``.
+
+    Executing it returns the same ``ExecutionResult`` as ``Schema.execute``,
+    but without walking the document or looking up the field definitions,
+    resolvers and serializers on every execution.
+
+    Compiled queries are executed synchronously: promises returned by
+    resolvers are waited for as soon as they are returned, and middleware
+    is not supported.
+    '''
+
+    def __init__(self, schema, document_ast, operation_name=None):
+        self.schema = schema
+        self.document_ast = document_ast
+        self.operation, self.fragments = get_operation(document_ast, operation_name)
+        self.root_type = get_operation_root_type(schema, self.operation)
+        self.directive_variables = tuple(sorted(
+            get_directive_variables(self.operation.selection_set, self.fragments)
+        ))
+        self._compiled = {}
+        if not self.directive_variables:
+            self._compiled[()] = self.compile({})
+
+    def compile(self, variable_values):
+        compiler = QueryCompiler(self.schema, self.fragments, variable_values)
+        fields = collect_fields(
+            compiler.collect_context,
+            self.root_type,
+            self.operation.selection_set,
+            DefaultOrderedDict(list),
+            set()
+        )
+        return compiler.compile_fields(self.root_type, fields)
+
+    def get_execute_fields(self, variable_values):
+        # Each combination of the variables used by @skip and @include
+        # selects different fields, so each one is compiled separately.
+        key = tuple(variable_values.get(name) for name in self.directive_variables)
+        execute_fields = self._compiled.get(key)
+        if execute_fields is None:
+            execute_fields = self._compiled[key] = self.compile(variable_values)
+        return execute_fields
+
+    def execute(self, root_value=None, context_value=None, variable_values=None):
+        try:
+            variable_values = get_variable_values(
+                self.schema,
+                self.operation.variable_definitions or [],
+                variable_values or {}
+            )
+            execute_fields = self.get_execute_fields(variable_values)
+        except Exception as e:
+            return ExecutionResult(errors=[e], invalid=True)
+
+        execution = CompiledExecution(self, root_value, context_value, variable_values)
+        try:
+            data = execute_fields(execution, root_value)
+        except Exception as e:
+            execution.errors.append(e)
+            data = None
+        return ExecutionResult(data=data, errors=execution.errors)
+
+    __call__ = execute
@@ -0,0 +1,135 @@
+from graphql.error import GraphQLError
+from graphql.language import ast
+from graphql.type.definition import get_named_type
+
+from .compiler import get_operation
+
+
+class CostAnalysis(object):
+    '''
+    Computes the cost of an operation before executing it, from the
+    ``cost`` of its fields (``default_cost`` for the fields without one)
+    and their ``multipliers``: the arguments whose value is the number
+    of items the field returns, like the ``first`` and ``last`` of the
+    connection fields.
+
+    The cost of a field is its own plus the cost of its selection set
+    times the greatest of its multipliers (or ``default_multiplier`` if
+    none of them is given, and 0 if they are negative). All the fields
+    selected are counted (the ones of the fragments each time they are
+    spread), so the cost is an upper bound of the one of the execution.
+    '''
+
+    def __init__(self, schema, max_cost=None, default_cost=1, default_multiplier=1):
+        self.schema = schema
+        self.max_cost = max_cost
+        self.default_cost = default_cost
+        self.default_multiplier = default_multiplier
+
+    def get_cost(self, document_ast, operation_name=None, variable_values=None, max_cost=None):
+        '''
+        Returns the cost of the operation. With ``max_cost``, the fields
+        are not walked anymore once the cost is above it, so the cost
+        returned is then only a lower bound (still above ``max_cost``).
+        '''
+        operation, fragments = get_operation(document_ast, operation_name)
+        if operation.operation == 'mutation':
+            root_type = self.schema.get_mutation_type()
+        elif operation.operation == 'subscription':
+            root_type = self.schema.get_subscription_type()
+        else:
+            root_type = self.schema.get_query_type()
+        variables = {}
+        for definition in operation.variable_definitions or ():
+            if definition.default_value is not None:
+                variables[definition.variable.name.value] = self.get_value(definition.default_value, {})
+        variables.update(variable_values or {})
+        return self.get_selection_set_cost(
+            root_type, operation.selection_set, fragments, variables, {}, max_cost
+        )
+
+    def get_fragment_cost(self, name, fragments, variables, fragment_costs, max_cost):
+        # The fragments are walked once, however many times they are spread
+        cost = fragment_costs.get(name)
+        if cost is None:
+            # Spreading a fragment within itself costs nothing (the
+            # cycles are reported by the validation)
+            fragment_costs[name] = 0
+            fragment = fragments[name]
+            cost = fragment_costs[name] = self.get_selection_set_cost(
+                self.schema.get_type(fragment.type_condition.name.value),
+                fragment.selection_set, fragments, variables, fragment_costs, max_cost
+            )
+        return cost
+
+    def get_selection_set_cost(self, parent_type, selection_set, fragments, variables,
+                               fragment_costs, max_cost=None):
+        cost = 0
+        for selection in selection_set.selections:
+            if max_cost is not None and cost > max_cost:
+                break
+            if isinstance(selection, ast.Field):
+                name = selection.name.value
+                if name.startswith('__'):
+                    continue
+                field_def = parent_type.fields[name]
+                field_cost = getattr(field_def, 'cost', None)
+                cost += self.default_cost if field_cost is None else field_cost
+                if selection.selection_set:
+                    multiplier = self.get_multiplier(field_def, selection, variables)
+                    cost += multiplier * self.get_selection_set_cost(
+                        get_named_type(field_def.type), selection.selection_set,
+                        fragments, variables, fragment_costs, max_cost
+                    )
+            elif isinstance(selection, ast.FragmentSpread):
+                cost += self.get_fragment_cost(
+                    selection.name.value, fragments, variables, fragment_costs, max_cost
+                )
+            else:
+                selection_type = parent_type
+                if selection.type_condition:
+                    selection_type = self.schema.get_type(selection.type_condition.name.value)
+                cost += self.get_selection_set_cost(
+                    selection_type, selection.selection_set, fragments, variables, fragment_costs, max_cost
+                )
+        return cost
+
+    def get_multiplier(self, field_def, field_ast, variables):
+        multipliers = getattr(field_def, 'multipliers', None)
+        if not multipliers:
+            return 1
+        values = [
+            self.get_value(argument.value, variables)
+            for argument in field_ast.arguments or ()
+            if argument.name.value in multipliers
+        ]
+        values = [value for value in values if isinstance(value, int)]
+        if not values:
+            return self.default_multiplier
+        # Negative page sizes would lower the cost of the rest of the query
+        return max(max(values), 0)
+
+    def get_value(self, value_ast, variables):
+        if isinstance(value_ast, ast.Variable):
+            return variables.get(value_ast.name.value)
+        if isinstance(value_ast, ast.IntValue):
+            return int(value_ast.value)
+        return None
+
+    def check(self, document_ast, operation_name=None, variable_values=None):
+        '''
+        Returns the errors of the operation if its cost is above
+        ``max_cost``, before executing it.
+        '''
+        if self.max_cost is None:
+            return []
+        try:
+            cost = self.get_cost(document_ast, operation_name, variable_values, self.max_cost)
+        except GraphQLError:
+            # The execution reports the operations that can't be executed
+            return []
+        if cost > self.max_cost:
+            return [GraphQLError(
+                'The query has a cost of at least {}, above the maximum cost of {}.'.format(cost, self.max_cost)
+            )]
+        return []
@@ -0,0 +1,48 @@
+import six
+
+from graphql import Source, parse, validate
+from graphql.error import GraphQLError
+from graphql.validation.rules import specified_rules
+
+from ..utils.lru_cache import LRUCache
+
+
+def parse_and_validate(schema, request_string):
+    '''
+    Parses the request string and validates the resulting document
+    against the schema (with its ``validation_rules``, if any), returning
+    a ``(document_ast, errors)`` tuple.
+    '''
+    try:
+        document_ast = parse(Source(request_string, 'GraphQL request'))
+    except GraphQLError as e:
+        return None, [e]
+    return document_ast, validate(
+        schema, document_ast, getattr(schema, 'validation_rules', specified_rules)
+    )
+
+
+class DocumentCache(LRUCache):
+    '''
+    Keeps the parsed and validated documents of the most recently executed
+    queries, so repeated queries skip lexing, parsing and validation.
+
+    The entries are keyed by the schema and the query text, and their size
+    is the length in bytes of the query text.
+    '''
+
+    def __init__(self, max_entries=1000, max_bytes=None):
+        super(DocumentCache, self).__init__(max_entries=max_entries, max_size=max_bytes)
+
+    def get_size(self, key, value):
+        _, request_string = key
+        if isinstance(request_string, six.text_type):
+            request_string = request_string.encode('utf-8')
+        return len(request_string)
+
+    def get_document(self, schema, request_string):
+        key = (schema, request_string)
+        cached = self.get(key)
+        if cached is None:
+            cached = self.set(key, parse_and_validate(schema, request_string))
+        return cached
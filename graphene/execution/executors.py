@@ -0,0 +1,152 @@
+from collections import deque
+from multiprocessing.pool import ThreadPool
+from threading import Lock, RLock
+
+from promise import Promise
+from six.moves.queue import Queue
+
+
+class ThreadPoolExecutor(object):
+    '''
+    Runs the resolvers in a pool of up to ``max_workers`` threads, so the
+    blocking resolvers of sibling fields run in parallel.
+
+    The pool is shared by all the executions using the executor (like the
+    ones of a ``Schema(executor=...)``), each one running up to
+    ``max_concurrency`` resolvers at the same time, if given.
+    '''
+
+    def __init__(self, max_workers=None, max_concurrency=None):
+        assert max_workers is None or max_workers > 0, (
+            'The max_workers has to be greater than 0, received "{}".'
+        ).format(max_workers)
+        assert max_concurrency is None or max_concurrency > 0, (
+            'The max_concurrency has to be greater than 0, received "{}".'
+        ).format(max_concurrency)
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
+        self._pool = None
+        self._lock = Lock()
+        self._execution = None
+
+    @property
+    def pool(self):
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPool(processes=self.max_workers)
+        return self._pool
+
+    def for_execution(self):
+        '''
+        Returns the executor of a single execution, that runs its
+        resolvers in the pool.
+        '''
+        return ThreadPoolExecution(self)
+
+    def execute(self, fn, *args, **kwargs):
+        # Used directly as the executor of an execution
+        if self._execution is None:
+            self._execution = self.for_execution()
+        return self._execution.execute(fn, *args, **kwargs)
+
+    def wait_until_finished(self):
+        if self._execution is not None:
+            self._execution.wait_until_finished()
+
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+
+class ThreadPoolExecution(object):
+    '''
+    Executor of a single execution in a ``ThreadPoolExecutor``.
+
+    Only the resolvers run in the pool: their results are settled in
+    the thread waiting for the execution, as the callbacks of the promises
+    can't run in many threads at the same time. When nobody waits for
+    the execution (with ``return_promise``) they are settled by the
+    threads of the pool instead, one at a time.
+    '''
+
+    def __init__(self, executor):
+        self.executor = executor
+        self.pending = 0
+        self.running = 0
+        self.queue = deque()
+        self.results = Queue()
+        # Reentrant, as the callbacks of the results can execute more
+        # resolvers while they are being settled
+        self.lock = RLock()
+        self.eager = False
+        self.when_finished = []
+
+    def execute(self, fn, *args, **kwargs):
+        promise = Promise()
+        with self.lock:
+            self.pending += 1
+            max_concurrency = self.executor.max_concurrency
+            if max_concurrency is not None and self.running >= max_concurrency:
+                self.queue.append((promise, fn, args, kwargs))
+            else:
+                self.submit(promise, fn, args, kwargs)
+        return promise
+
+    def submit(self, promise, fn, args, kwargs):
+        self.running += 1
+        self.executor.pool.apply_async(self.run, (promise, fn, args, kwargs))
+
+    def run(self, promise, fn, args, kwargs):
+        try:
+            self.results.put((promise, True, fn(*args, **kwargs)))
+        except Exception as e:
+            self.results.put((promise, False, e))
+        if self.eager:
+            self.settle_finished()
+
+    def settle(self, promise, fulfilled, value):
+        with self.lock:
+            self.running -= 1
+            self.pending -= 1
+            if self.queue:
+                self.submit(*self.queue.popleft())
+            if fulfilled:
+                promise.do_resolve(value)
+            else:
+                promise.do_reject(value)
+
+    def settle_finished(self):
+        with self.lock:
+            while not self.results.empty():
+                self.settle(*self.results.get())
+            if not self.pending:
+                when_finished, self.when_finished = self.when_finished, []
+                for fn in when_finished:
+                    fn()
+
+    def settle_eagerly(self):
+        '''
+        Settles the results as soon as the resolvers finish from now on,
+        for the executions that are not waited for.
+        '''
+        self.eager = True
+        self.settle_finished()
+
+    def call_when_finished(self, fn):
+        '''
+        Calls fn once the running resolvers are finished and settled, like
+        the deferred work of the scope, so the work they defer is batched.
+        '''
+        with self.lock:
+            if self.pending:
+                self.when_finished.append(fn)
+                return
+            fn()
+
+    def wait_until_finished(self):
+        while self.pending:
+            self.settle(*self.results.get())
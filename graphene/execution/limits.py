@@ -0,0 +1,98 @@
+from graphql.error import GraphQLError
+from graphql.language import ast
+from graphql.validation.rules.base import ValidationRule
+
+
+class QueryLimits(ValidationRule):
+    '''
+    Validation rule reporting the operations nested more than
+    ``max_depth`` fields deep, with more than ``max_aliases`` aliases
+    or selecting more than ``max_fields`` fields.
+
+    The fields of the fragments are counted each time they are spread,
+    and the introspection fields are not counted.
+    '''
+
+    max_depth = None
+    max_aliases = None
+    max_fields = None
+
+    def __init__(self, context):
+        super(QueryLimits, self).__init__(context)
+        self.fragment_measures = {}
+
+    def enter_OperationDefinition(self, node, key, parent, path, ancestors):
+        depth, aliases, fields = self.measure(node.selection_set, set())
+        name = node.name.value if node.name else 'anonymous'
+        if self.max_depth is not None and depth > self.max_depth:
+            self.report(node, 'The operation "{}" has a depth of {}, above the maximum depth of {}.'.format(
+                name, depth, self.max_depth
+            ))
+        if self.max_aliases is not None and aliases > self.max_aliases:
+            self.report(node, 'The operation "{}" has {} aliases, above the maximum of {}.'.format(
+                name, aliases, self.max_aliases
+            ))
+        if self.max_fields is not None and fields > self.max_fields:
+            self.report(node, 'The operation "{}" selects {} fields, above the maximum of {}.'.format(
+                name, fields, self.max_fields
+            ))
+        return False
+
+    def measure_fragment(self, name, spread_fragments):
+        # The fragments are measured once, however many times they are spread
+        measures = self.fragment_measures.get(name)
+        if measures is None:
+            fragment = self.context.get_fragment(name)
+            # The cycles of fragments are reported by NoFragmentCycles
+            if fragment is None or name in spread_fragments:
+                return 0, 0, 0
+            measures = self.fragment_measures[name] = self.measure(
+                fragment.selection_set, spread_fragments | {name}
+            )
+        return measures
+
+    def report(self, node, message):
+        self.context.report_error(GraphQLError(message, [node]))
+
+    def measure(self, selection_set, spread_fragments):
+        '''
+        Returns the depth, aliases and fields of the selection set.
+        '''
+        depth = aliases = fields = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, ast.Field):
+                if selection.name.value.startswith('__'):
+                    continue
+                selection_depth = 1
+                fields += 1
+                if selection.alias:
+                    aliases += 1
+                if selection.selection_set:
+                    child_depth, child_aliases, child_fields = self.measure(
+                        selection.selection_set, spread_fragments
+                    )
+                    selection_depth += child_depth
+                    aliases += child_aliases
+                    fields += child_fields
+                depth = max(depth, selection_depth)
+                continue
+
+            if isinstance(selection, ast.FragmentSpread):
+                measures = self.measure_fragment(selection.name.value, spread_fragments)
+            else:
+                measures = self.measure(selection.selection_set, spread_fragments)
+            depth = max(depth, measures[0])
+            aliases += measures[1]
+            fields += measures[2]
+        return depth, aliases, fields
+
+
+def query_limits(max_depth=None, max_aliases=None, max_fields=None):
+    '''
+    Returns a ``QueryLimits`` validation rule with the given limits.
+    '''
+    return type('QueryLimits', (QueryLimits, ), {
+        'max_depth': max_depth,
+        'max_aliases': max_aliases,
+        'max_fields': max_fields,
+    })
@@ -0,0 +1,159 @@
+from bisect import bisect_left
+from collections import namedtuple
+from threading import Lock, current_thread, local
+from weakref import ref
+
+from promise import Promise
+
+from .tracing import timer
+
+# The default buckets of the Prometheus clients, in seconds
+DEFAULT_BUCKETS = (.005, .01, .025, .05, .075, .1, .25, .5, .75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+FieldMetrics = namedtuple('FieldMetrics', ['calls', 'errors', 'duration', 'buckets'])
+
+
+def merge_entries(totals, buffer):
+    # Copied at once, as its thread can add fields meanwhile
+    for key, entry in list(buffer.items()):
+        total = totals.get(key)
+        if total is None:
+            totals[key] = list(entry)
+        else:
+            totals[key] = [a + b for a, b in zip(total, entry)]
+
+
+class ResolverMetrics(object):
+    '''
+    Middleware aggregating the calls, errors and latency histogram of
+    the resolvers of each field, by their parent type and field name.
+
+    Every thread records into its own buffer, so recording takes no
+    locks; ``snapshot`` merges the buffers of all the threads, folding
+    the ones of the threads that ended into a single total.
+    '''
+
+    def __init__(self, buckets=DEFAULT_BUCKETS, namespace='graphql'):
+        self.buckets = tuple(sorted(buckets))
+        self.namespace = namespace
+        self.local = local()
+        # The buffers of the running threads, with a weak reference to them
+        self.buffers = []
+        # The totals of the threads that ended
+        self.ended = {}
+        self.lock = Lock()
+
+    def get_buffer(self):
+        try:
+            return self.local.buffer
+        except AttributeError:
+            buffer = self.local.buffer = {}
+            with self.lock:
+                self.buffers.append((ref(current_thread()), buffer))
+            return buffer
+
+    def record(self, parent_type, field_name, duration, failed=False):
+        buffer = self.get_buffer()
+        key = (parent_type, field_name)
+        entry = buffer.get(key)
+        if entry is None:
+            # The calls, errors, total duration and count per bucket
+            # (the last one for the durations above all of them)
+            entry = buffer[key] = [0, 0, 0.0] + [0] * (len(self.buckets) + 1)
+        entry[0] += 1
+        if failed:
+            entry[1] += 1
+        entry[2] += duration
+        entry[3 + bisect_left(self.buckets, duration)] += 1
+
+    def resolve(self, next, root, args, context, info):
+        parent_type = info.parent_type.name
+        field_name = info.field_name
+        start = timer()
+        try:
+            promise = next(root, args, context, info)
+        except Exception:
+            self.record(parent_type, field_name, timer() - start, True)
+            raise
+        if not isinstance(promise, Promise):
+            promise = Promise.resolve(promise)
+
+        if promise.is_pending:
+            def on_resolve(value):
+                self.record(parent_type, field_name, timer() - start)
+                return value
+
+            def on_reject(error):
+                self.record(parent_type, field_name, timer() - start, True)
+                raise error
+
+            return promise.then(on_resolve, on_reject)
+        self.record(parent_type, field_name, timer() - start, promise.is_rejected)
+        return promise
+
+    def snapshot(self):
+        '''
+        Returns the ``FieldMetrics`` recorded so far by parent type and
+        field name, with the cumulative count of each bucket.
+        '''
+        with self.lock:
+            buffers = []
+            for thread_ref, buffer in self.buffers:
+                thread = thread_ref()
+                if thread is None or not thread.is_alive():
+                    # Threads that ended don't record anymore
+                    merge_entries(self.ended, buffer)
+                else:
+                    buffers.append((thread_ref, buffer))
+            self.buffers = buffers
+            totals = dict((key, list(total)) for key, total in self.ended.items())
+        for thread_ref, buffer in buffers:
+            merge_entries(totals, buffer)
+
+        metrics = {}
+        for key, total in totals.items():
+            buckets = []
+            count = 0
+            for bucket_count in total[3:]:
+                count += bucket_count
+                buckets.append(count)
+            metrics[key] = FieldMetrics(
+                calls=total[0],
+                errors=total[1],
+                duration=total[2],
+                buckets=tuple(zip(self.buckets + (float('inf'), ), buckets))
+            )
+        return metrics
+
+    def to_prometheus(self):
+        '''
+        Returns the metrics in the Prometheus text exposition format.
+        '''
+        name = self.namespace + '_resolver'
+        metrics = sorted(self.snapshot().items())
+        lines = [
+            '# HELP {}_calls_total Calls of the resolvers.'.format(name),
+            '# TYPE {}_calls_total counter'.format(name),
+        ]
+        for (parent_type, field_name), field_metrics in metrics:
+            labels = 'parent_type="{}",field="{}"'.format(parent_type, field_name)
+            lines.append('{}_calls_total{{{}}} {}'.format(name, labels, field_metrics.calls))
+        lines += [
+            '# HELP {}_errors_total Errors raised by the resolvers.'.format(name),
+            '# TYPE {}_errors_total counter'.format(name),
+        ]
+        for (parent_type, field_name), field_metrics in metrics:
+            labels = 'parent_type="{}",field="{}"'.format(parent_type, field_name)
+            lines.append('{}_errors_total{{{}}} {}'.format(name, labels, field_metrics.errors))
+        lines += [
+            '# HELP {}_duration_seconds Duration of the resolvers.'.format(name),
+            '# TYPE {}_duration_seconds histogram'.format(name),
+        ]
+        for (parent_type, field_name), field_metrics in metrics:
+            labels = 'parent_type="{}",field="{}"'.format(parent_type, field_name)
+            for bound, count in field_metrics.buckets:
+                le = '+Inf' if bound == float('inf') else repr(float(bound))
+                lines.append('{}_duration_seconds_bucket{{{},le="{}"}} {}'.format(name, labels, le, count))
+            lines.append('{}_duration_seconds_sum{{{}}} {!r}'.format(name, labels, field_metrics.duration))
+            lines.append('{}_duration_seconds_count{{{}}} {}'.format(name, labels, field_metrics.calls))
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,125 @@
+from collections import Mapping
+from functools import partial
+from threading import Lock
+
+import six
+from promise import Promise
+
+from .scope import get_current_scope
+
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:  # pragma: no cover
+    # Python 2 needs the futures backport
+    ProcessPoolExecutor = None
+
+_pool = None
+_pool_lock = Lock()
+
+
+def get_process_pool():
+    '''
+    Returns the pool of processes shared by the fields offloaded
+    with ``offload='process'``, with a process per CPU.
+    '''
+    global _pool
+    if _pool is None:
+        assert ProcessPoolExecutor, 'Offloading resolvers to processes requires concurrent.futures.'
+        with _pool_lock:
+            if _pool is None:
+                _pool = ProcessPoolExecutor()
+    return _pool
+
+
+def call_resolver(resolver, root, args):
+    return resolver(root, args, None, None)
+
+
+class ProjectedRoot(object):
+    '''
+    The attributes of a root projected by their names, sent to the
+    process instead of the root.
+    '''
+
+    def __init__(self, **attrs):
+        self.__dict__.update(attrs)
+
+    def __repr__(self):
+        return 'ProjectedRoot({})'.format(', '.join(
+            '{}={!r}'.format(name, value) for name, value in sorted(self.__dict__.items())
+        ))
+
+
+def project_attributes(names, root):
+    if isinstance(root, Mapping):
+        return dict((name, root.get(name)) for name in names)
+    return ProjectedRoot(**dict((name, getattr(root, name, None)) for name in names))
+
+
+class OffloadResolver(object):
+    '''
+    Calls the resolver in a pool of processes, the shared one of
+    ``get_process_pool`` or any executor with a ``submit`` method,
+    returning a promise of its value.
+
+    Only the projections of the root and the arguments are pickled and
+    sent to the process, where the resolver receives None as its context
+    and info. The root is projected by ``project``: a function returning
+    what to send for each root, or the names of the attributes (or keys)
+    of the root to send. Without it, the whole root is sent.
+    '''
+
+    def __init__(self, resolver, offload='process', project=None):
+        assert offload == 'process' or callable(getattr(offload, 'submit', None)), (
+            'A resolver can be offloaded to "process" or an executor with a submit method, '
+            'received "{}".'
+        ).format(offload)
+        if isinstance(project, six.string_types):
+            project = (project, )
+        assert project is None or callable(project) or isinstance(project, (list, tuple)), (
+            'The projection of the root has to be a function or a list of attribute names, '
+            'received "{}".'
+        ).format(project)
+        self.resolver = resolver
+        self.offload = offload
+        if isinstance(project, (list, tuple)):
+            project = partial(project_attributes, tuple(project))
+        self.project = project
+
+    @property
+    def pool(self):
+        if self.offload == 'process':
+            return get_process_pool()
+        return self.offload
+
+    def project_root(self, root):
+        if self.project is None:
+            return root
+        return self.project(root)
+
+    def project_args(self, args):
+        # The args of an execution are a plain dict of the input values
+        return dict(args)
+
+    def __call__(self, root, args, context, info):
+        future = self.pool.submit(
+            call_resolver, self.resolver, self.project_root(root), self.project_args(args)
+        )
+        promise = Promise()
+        scope = get_current_scope()
+        if scope is None:
+            settle_future(future, promise)
+        else:
+            # The result is waited for once the fields that can be resolved
+            # right away are done, so the offloaded resolvers run in parallel.
+            scope.defer(lambda: settle_future(future, promise))
+        return promise
+
+
+def settle_future(future, promise):
+    try:
+        value = future.result()
+    except Exception as e:
+        promise.do_reject(e)
+    else:
+        promise.do_resolve(value)
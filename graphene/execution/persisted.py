@@ -0,0 +1,82 @@
+import hashlib
+import json
+import os
+
+import six
+
+from .document_cache import parse_and_validate
+
+
+def get_query_hash(request_string):
+    '''
+    Returns the sha256 hex digest that identifies a persisted query.
+    '''
+    if isinstance(request_string, six.text_type):
+        request_string = request_string.encode('utf-8')
+    return hashlib.sha256(request_string).hexdigest()
+
+
+class PersistedQueryRegistry(object):
+    '''
+    Registry of the operations known in advance by the clients, indexed
+    by the sha256 hash of their text.
+
+    The documents are parsed and validated against the schema when they are
+    registered, so executing them later skips both steps.
+    '''
+
+    def __init__(self, schema):
+        self.schema = schema
+        self._documents = {}
+
+    def register(self, request_string, query_hash=None):
+        expected_hash = get_query_hash(request_string)
+        if query_hash is not None and query_hash != expected_hash:
+            raise Exception(
+                'The persisted query hash "{}" does not match its text (expected "{}").'.format(
+                    query_hash,
+                    expected_hash
+                )
+            )
+        document_ast, errors = parse_and_validate(self.schema, request_string)
+        if errors:
+            raise Exception(
+                'The persisted query "{}" is not valid: {}'.format(
+                    expected_hash,
+                    ' '.join(error.message for error in errors)
+                )
+            )
+        self._documents[expected_hash] = document_ast
+        return expected_hash
+
+    def load_manifest(self, path):
+        '''
+        Registers the queries of a JSON manifest, either a list of queries
+        or an object mapping each query hash to its text.
+        '''
+        with open(path) as manifest_file:
+            manifest = json.load(manifest_file)
+        if isinstance(manifest, dict):
+            return [self.register(query, query_hash) for query_hash, query in manifest.items()]
+        return [self.register(query) for query in manifest]
+
+    def load_directory(self, path, extension='.graphql'):
+        '''
+        Registers every query file with the given extension in the directory.
+        '''
+        query_hashes = []
+        for filename in sorted(os.listdir(path)):
+            if not filename.endswith(extension):
+                continue
+            with open(os.path.join(path, filename)) as query_file:
+                query_hashes.append(self.register(query_file.read()))
+        return query_hashes
+
+    def get(self, query_hash):
+        return self._documents.get(query_hash)
+
+    def __contains__(self, query_hash):
+        return query_hash in self._documents
+
+    def __len__(self):
+        return len(self._documents)
@@ -0,0 +1,112 @@
+import hashlib
+import json
+
+from graphql.error import GraphQLError, format_error
+from graphql.language.printer import print_ast
+
+from ..utils.lru_cache import LRUCache
+from .cache import MISSING, LocalCache
+from .cache_control import PRIVATE, CacheControl
+
+
+class ResponseCache(object):
+    '''
+    Caches the results of the queries executed with ``execute`` by their
+    normalized document, operation, variables and a ``scope`` given by the
+    caller (like the id of the user, or None for anonymous requests).
+
+    The results are kept in the ``backend`` (a ``LocalCache`` of up to
+    ``max_entries`` results by default) for the max age of the cache
+    hints of the query (see ``CacheControl``). The queries with a max age
+    of 0, private queries without a scope, mutations, subscriptions and
+    results with errors are not cached.
+
+    If ``serialize`` is True, the results are returned (and cached) as the
+    bytes of their JSON response.
+    '''
+
+    def __init__(self, schema, default_max_age=0, max_entries=1000, backend=None, serialize=False):
+        self.schema = schema
+        self.cache_control = CacheControl(schema, default_max_age, max_entries)
+        self.backend = backend if backend is not None else LocalCache(max_entries)
+        self.serialize = serialize
+        self.queries = LRUCache(max_entries)
+        self.hits = 0
+        self.misses = 0
+
+    def get_query(self, request_string, operation_name=None):
+        '''
+        Returns the normalized text and the cache hints of the operation,
+        or None if its results can't be cached.
+        '''
+        key = (request_string, operation_name)
+        query = self.queries.get(key, MISSING)
+        if query is MISSING:
+            query = self.queries.set(key, self.analyze(request_string, operation_name))
+        return query
+
+    def analyze(self, request_string, operation_name):
+        document_ast, errors = self.schema.get_document(request_string)
+        if errors:
+            return None
+        try:
+            hints = self.cache_control.get_hints(document_ast, operation_name)
+        except GraphQLError:
+            return None
+        if not hints.max_age:
+            return None
+        # Printing the document strips its comments and formatting. The order
+        # of the fields is kept, as it is the order of the response.
+        return print_ast(document_ast), hints
+
+    def get_key(self, normalized_query, operation_name, variable_values, scope):
+        key = json.dumps(
+            [normalized_query, operation_name, variable_values or {}, scope],
+            sort_keys=True,
+            default=str
+        )
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    def execute(self, request_string, variable_values=None, operation_name=None, scope=None,
+                **options):
+        '''
+        Returns the cached result of the query, executing it with the
+        given options (like ``context_value``) if it's not cached.
+        '''
+        assert not options.get('return_promise'), 'The cached results can not be promised.'
+        query = self.get_query(request_string, operation_name)
+        if query is None or (query[1].scope == PRIVATE and scope is None):
+            return self.get_response(self.schema.execute(
+                request_string, variable_values=variable_values,
+                operation_name=operation_name, **options
+            ))
+
+        normalized_query, hints = query
+        key = self.get_key(normalized_query, operation_name, variable_values, scope)
+        response = self.backend.get(key)
+        if response is not None:
+            self.hits += 1
+            return response
+
+        self.misses += 1
+        result = self.schema.execute(
+            request_string, variable_values=variable_values,
+            operation_name=operation_name, **options
+        )
+        response = self.get_response(result)
+        if not result.errors:
+            self.backend.set(key, response, hints.max_age)
+        return response
+
+    def get_response(self, result):
+        if not self.serialize:
+            return result
+        response = {}
+        if result.errors:
+            response['errors'] = [format_error(error) for error in result.errors]
+        if not result.invalid:
+            response['data'] = result.data
+        return json.dumps(response, separators=(',', ':')).encode('utf-8')
+
+    def clear(self):
+        self.backend.clear()
@@ -0,0 +1,29 @@
+from graphql.execution import ExecutionResult as BaseExecutionResult
+
+
+class ExecutionResult(BaseExecutionResult):
+    '''
+    An ExecutionResult carrying the ``extensions`` of the response,
+    like the cache control hints of the query (None without any).
+    '''
+
+    __slots__ = 'extensions',
+
+    def __init__(self, data=None, errors=None, invalid=False, extensions=None):
+        super(ExecutionResult, self).__init__(data=data, errors=errors, invalid=invalid)
+        self.extensions = extensions
+
+
+def with_extensions(result, **extensions):
+    '''
+    Returns the result with the given extensions added to the ones
+    it already has.
+    '''
+    merged = dict(getattr(result, 'extensions', None) or {})
+    merged.update(extensions)
+    return ExecutionResult(
+        data=result.data,
+        errors=result.errors,
+        invalid=result.invalid,
+        extensions=merged or None
+    )
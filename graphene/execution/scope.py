@@ -0,0 +1,158 @@
+from threading import Lock, local
+
+from graphql.execution.executors.sync import SyncExecutor
+from promise import Promise
+
+from ..utils.thenables import is_coroutine, run_within
+from .result import with_extensions
+
+try:
+    from contextvars import ContextVar
+except ImportError:  # pragma: no cover
+    # Context variables need Python 3.7+
+    ContextVar = None
+
+if ContextVar is not None:
+    # Unlike a thread local, the tasks of asyncio get their own copy
+    _current_scope = ContextVar('graphene_execution_scope', default=None)
+
+    def get_current_scope():
+        '''
+        Returns the scope of the execution running the current resolver,
+        if any.
+        '''
+        return _current_scope.get()
+
+    def set_current_scope(scope):
+        _current_scope.set(scope)
+else:  # pragma: no cover
+    _state = local()
+
+    def get_current_scope():
+        '''
+        Returns the scope of the execution running the current resolver,
+        if any.
+        '''
+        return getattr(_state, 'scope', None)
+
+    def set_current_scope(scope):
+        _state.scope = scope
+
+
+class ExecutionScope(object):
+    '''
+    Wraps the executor of a single execution, keeping the work that the
+    resolvers defer until the fields that can be resolved right away are
+    done (like collecting the roots of the batched fields).
+
+    The deferred work is dispatched when the execution waits for its
+    results. Dispatching it can defer new work, as happens with the
+    fields of nested lists, which is dispatched in turn.
+    '''
+
+    def __init__(self, executor=None):
+        if hasattr(executor, 'for_execution'):
+            # Executors shared by many executions, like ThreadPoolExecutor
+            executor = executor.for_execution()
+        self.executor = executor or SyncExecutor()
+        self.deferred = []
+        self.batches = {}
+        self.loaders = {}
+        # The extensions of the result by name, as objects whose
+        # get_extension() returns their value (None if left out).
+        self.extensions = {}
+        self.lock = Lock()
+        # Once the execution is not waited for (with return_promise)
+        # the work is dispatched as soon as the current callbacks end.
+        self.eager = False
+        self.previous = []
+        if type(self.executor) is SyncExecutor:
+            # The resolvers run right away in the thread of the execution,
+            # that is already within the scope.
+            self.execute = self.executor.execute
+
+    def __enter__(self):
+        self.previous.append(get_current_scope())
+        set_current_scope(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        set_current_scope(self.previous.pop())
+
+    def execute(self, fn, *args, **kwargs):
+        return self.executor.execute(self.run, fn, *args, **kwargs)
+
+    def run(self, fn, *args, **kwargs):
+        # Resolvers can run in other threads, so they keep the previous
+        # scope of their own thread.
+        previous = get_current_scope()
+        set_current_scope(self)
+        try:
+            result = fn(*args, **kwargs)
+        finally:
+            set_current_scope(previous)
+        if is_coroutine(result):
+            # The body of the coroutines runs later in the loop, where
+            # each of its steps is run within the scope again
+            return run_within(self, result)
+        return result
+
+    def defer(self, fn):
+        with self.lock:
+            self.deferred.append(fn)
+            schedule = self.eager and len(self.deferred) == 1
+        if not schedule:
+            return
+        loop = getattr(self.executor, 'loop', None)
+        if loop is not None:
+            # The coroutines of the sibling fields run in the same
+            # iteration of the asyncio loop, so their work is batched
+            loop.call_soon_threadsafe(self.dispatch)
+        elif hasattr(self.executor, 'call_when_finished'):
+            # The resolvers running in other threads at the same time
+            # defer their work before it is dispatched
+            self.executor.call_when_finished(self.dispatch)
+        else:
+            Promise.resolve(None).then(lambda _: self.dispatch())
+
+    def dispatch_eagerly(self):
+        '''
+        Dispatches the deferred work as soon as possible from now on, for
+        the executions that nobody waits for (with return_promise).
+        '''
+        self.eager = True
+        if hasattr(self.executor, 'settle_eagerly'):
+            # Like ThreadPoolExecution, that only settles its results
+            # while waited for otherwise
+            self.executor.settle_eagerly()
+            self.executor.call_when_finished(self.dispatch)
+        else:
+            self.dispatch()
+
+    def dispatch(self):
+        with self:
+            while self.deferred:
+                with self.lock:
+                    deferred, self.deferred = self.deferred, []
+                for fn in deferred:
+                    fn()
+
+    def add_extensions(self, result):
+        '''
+        Returns the result with the extensions added by the resolvers.
+        '''
+        extensions = {
+            name: extension.get_extension()
+            for name, extension in self.extensions.items()
+            if extension is not None
+        }
+        if result.invalid:
+            extensions = {}
+        return with_extensions(result, **extensions)
+
+    def wait_until_finished(self):
+        while True:
+            self.dispatch()
+            self.executor.wait_until_finished()
+            if not self.deferred:
+                break
@@ -0,0 +1,244 @@
+from collections import defaultdict
+
+from graphql.execution.executors.thread import ThreadExecutor
+from promise import Promise
+
+from ...relay import Connection, ConnectionField
+from ...types import Field, Int, List, ObjectType, Schema, String
+from ..batching import BatchResolver
+
+calls = defaultdict(list)
+
+
+def resolve_names(roots, args, context, info):
+    calls['name'].append([root.id for root in roots])
+    return ['{} {}'.format(args['greeting'], root.id) for root in roots]
+
+
+class Post(ObjectType):
+    title = String()
+
+
+class User(ObjectType):
+    id = Int()
+    name = String(batch=True, greeting=String(default_value='Hi'), resolver=resolve_names)
+    posts = List(Post)
+    friends = List(lambda: User)
+
+    def resolve_posts_batch(roots, args, context, info):
+        calls['posts'].append([root.id for root in roots])
+        return [
+            [Post(title='Post {} of {}'.format(i, root.id)) for i in range(2)]
+            for root in roots
+        ]
+
+    def resolve_friends(self, args, context, info):
+        return [User(id=self.id * 10 + i) for i in range(1, 3)]
+
+
+class UserConnection(Connection):
+
+    class Meta:
+        node = User
+
+    class Edge:
+
+        def resolve_node_batch(edges, args, context, info):
+            calls['node'].append([edge.node for edge in edges])
+            return Promise.resolve([User(id=edge.node) for edge in edges])
+
+
+class Query(ObjectType):
+    users = List(User)
+    user = Field(User)
+    user_connection = ConnectionField(UserConnection)
+
+    def resolve_users(self, args, context, info):
+        return [User(id=i) for i in range(1, 4)]
+
+    def resolve_user(self, args, context, info):
+        return User(id=1)
+
+    def resolve_user_connection(self, args, context, info):
+        return [1, 2, 3]
+
+
+schema = Schema(query=Query)
+
+
+def setup_function(function):
+    calls.clear()
+
+
+def test_batch_field_resolves_all_the_roots_at_once():
+    result = schema.execute('{ users { id name } }')
+    assert not result.errors
+    assert result.data == {'users': [
+        {'id': 1, 'name': 'Hi 1'},
+        {'id': 2, 'name': 'Hi 2'},
+        {'id': 3, 'name': 'Hi 3'},
+    ]}
+    assert calls['name'] == [[1, 2, 3]]
+
+
+def test_batch_field_receives_the_arguments():
+    result = schema.execute('{ users { name(greeting: "Hello") } }')
+    assert not result.errors
+    assert [user['name'] for user in result.data['users']] == ['Hello 1', 'Hello 2', 'Hello 3']
+    assert calls['name'] == [[1, 2, 3]]
+
+
+def test_batch_field_with_a_single_root():
+    result = schema.execute('{ user { name } }')
+    assert not result.errors
+    assert result.data == {'user': {'name': 'Hi 1'}}
+    assert calls['name'] == [[1]]
+
+
+def test_batch_resolver_method():
+    result = schema.execute('{ users { posts { title } } }')
+    assert not result.errors
+    assert result.data['users'][2] == {'posts': [{'title': 'Post 0 of 3'}, {'title': 'Post 1 of 3'}]}
+    assert calls['posts'] == [[1, 2, 3]]
+
+
+def test_batch_field_in_nested_lists():
+    result = schema.execute('{ users { friends { name friends { name } } } }')
+    assert not result.errors
+    assert result.data['users'][0]['friends'][1] == {
+        'name': 'Hi 12',
+        'friends': [{'name': 'Hi 121'}, {'name': 'Hi 122'}],
+    }
+    # Each level of nesting is resolved with a single call
+    assert calls['name'] == [
+        [11, 12, 21, 22, 31, 32],
+        [111, 112, 121, 122, 211, 212, 221, 222, 311, 312, 321, 322],
+    ]
+
+
+def test_batch_field_of_connection_edges():
+    result = schema.execute('{ userConnection { edges { node { id name } } } }')
+    assert not result.errors
+    assert result.data['userConnection']['edges'] == [
+        {'node': {'id': 1, 'name': 'Hi 1'}},
+        {'node': {'id': 2, 'name': 'Hi 2'}},
+        {'node': {'id': 3, 'name': 'Hi 3'}},
+    ]
+    assert calls['node'] == [[1, 2, 3]]
+    assert calls['name'] == [[1, 2, 3]]
+
+
+def test_batch_field_with_thread_executor():
+    result = schema.execute('{ users { id name } }', executor=ThreadExecutor())
+    assert not result.errors
+    assert [user['name'] for user in result.data['users']] == ['Hi 1', 'Hi 2', 'Hi 3']
+
+
+def test_batch_field_with_return_promise():
+    result = schema.execute('{ users { name } }', return_promise=True).get()
+    assert not result.errors
+    assert [user['name'] for user in result.data['users']] == ['Hi 1', 'Hi 2', 'Hi 3']
+    assert calls['name'] == [[1, 2, 3]]
+
+
+class Number(ObjectType):
+    value = Int()
+    double = Int(batch=True)
+    broken = Int(batch=True)
+    wrong_length = Int(batch=True)
+
+    def resolve_value(self, args, context, info):
+        return self
+
+    def resolve_double(roots, args, context, info):
+        return [ValueError('Odd') if root % 2 else root * 2 for root in roots]
+
+    def resolve_broken(roots, args, context, info):
+        raise Exception('Broken')
+
+    def resolve_wrong_length(roots, args, context, info):
+        return roots[1:]
+
+
+class NumbersQuery(ObjectType):
+    numbers = List(Number)
+
+    def resolve_numbers(self, args, context, info):
+        return [2, 3]
+
+
+numbers_schema = Schema(query=NumbersQuery)
+
+
+def test_batch_field_errors():
+    query = '{ numbers { value double broken wrongLength } }'
+    for result in (numbers_schema.execute(query), numbers_schema.compile(query).execute()):
+        assert result.data == {'numbers': [
+            {'value': 2, 'double': 4, 'broken': None, 'wrongLength': None},
+            {'value': 3, 'double': None, 'broken': None, 'wrongLength': None},
+        ]}
+        assert sorted(set(str(error) for error in result.errors)) == [
+            'Broken',
+            'Odd',
+            'The batch resolver of Number.wrongLength has to return a result '
+            'for each root, received 1 results for 2 roots.',
+        ]
+
+
+class Numbered(ObjectType):
+    number = Int(batch=True)
+
+
+class NumberedQuery(ObjectType):
+    numbered = List(Numbered)
+
+    def resolve_numbered(self, args, context, info):
+        return [Numbered(number=1), Numbered(number=2)]
+
+
+def test_batch_field_with_the_default_resolver():
+    schema = Schema(query=NumberedQuery)
+    query = '{ numbered { number } }'
+    for result in (schema.execute(query), schema.compile(query).execute()):
+        assert not result.errors
+        assert result.data == {'numbered': [{'number': 1}, {'number': 2}]}
+
+
+class Order(ObjectType):
+    item = String()
+    item_batch = String()
+
+    def resolve_item_batch(self, args, context, info):
+        return 'batch of {}'.format(self.item)
+
+
+class OrderQuery(ObjectType):
+    order = Field(Order)
+
+    def resolve_order(self, args, context, info):
+        return Order(item='x')
+
+
+def test_resolver_of_a_field_named_like_a_batch_resolver():
+    schema = Schema(query=OrderQuery)
+    result = schema.execute('{ order { item itemBatch } }')
+    assert not result.errors
+    assert result.data == {'order': {'item': 'x', 'itemBatch': 'batch of x'}}
+
+
+def test_compiled_query_batch_field():
+    query = schema.compile('{ users { id name posts { title } friends { name } } user { name } }')
+    result = query.execute()
+    assert not result.errors
+    assert result.data == schema.execute(
+        '{ users { id name posts { title } friends { name } } user { name } }'
+    ).data
+    calls.clear()
+    query.execute()
+    assert calls['name'] == [[1, 2, 3], [11, 12], [21, 22], [31, 32], [1]]
+    assert calls['posts'] == [[1, 2, 3]]
+
+
+def test_batch_resolver_outside_of_an_execution():
+    resolver = BatchResolver(resolve_names)
+    assert resolver(User(id=5), {'greeting': 'Hey'}, None, None) == 'Hey 5'
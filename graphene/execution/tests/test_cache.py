@@ -0,0 +1,208 @@
+import pytest
+from promise import Promise
+
+from ...types import Field, Int, List, ObjectType, Schema, String
+from ...types.resolver import DictResolver
+from ..cache import CachedResolver, CachePolicy, LocalCache
+
+calls = []
+
+
+class Clock(object):
+
+    def __init__(self):
+        self.now = 0
+
+    def __call__(self):
+        return self.now
+
+
+clock = Clock()
+
+
+class Backend(LocalCache):
+    timer = clock
+
+
+class CountingPolicy(CachePolicy):
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('backend', Backend(max_entries=2))
+        super(CountingPolicy, self).__init__(**kwargs)
+        self.lookups = []
+
+    def on_hit(self, key):
+        self.lookups.append(('hit', key[2:]))
+
+    def on_miss(self, key):
+        self.lookups.append(('miss', key[2:]))
+
+
+flags_policy = CountingPolicy(ttl=30)
+user_policy = CountingPolicy(key=lambda root, args, context, info: context['user'])
+
+
+class Category(ObjectType):
+    id = Int()
+    name = String(cache=CountingPolicy())
+
+    def resolve_name(self, args, context, info):
+        calls.append(('name', self.id))
+        return 'Category {}'.format(self.id)
+
+
+class Tag(ObjectType):
+
+    class Meta:
+        default_resolver = DictResolver
+
+    id = Int()
+    label = String(cache=CountingPolicy())
+
+    def resolve_label(self, args, context, info):
+        calls.append(('label', self.get('id')))
+        return 'Tag {}'.format(self.get('id'))
+
+
+class Anonymous(ObjectType):
+    name = String(cache=CountingPolicy())
+
+    def resolve_name(self, args, context, info):
+        calls.append(('anonymous', None))
+        return 'Anonymous'
+
+
+class Query(ObjectType):
+    flags = List(String, prefix=String(), cache=flags_policy)
+    greeting = String(cache=user_policy)
+    categories = List(Category)
+    promised = Int(cache=CountingPolicy())
+    tags = List(Tag)
+    anonymous = List(Anonymous)
+
+    def resolve_flags(self, args, context, info):
+        calls.append(('flags', args.get('prefix')))
+        return ['{}{}'.format(args.get('prefix', ''), flag) for flag in 'ab']
+
+    def resolve_greeting(self, args, context, info):
+        calls.append(('greeting', context['user']))
+        if context['user'] is None:
+            raise Exception('Anonymous')
+        return 'Hi {}'.format(context['user'])
+
+    def resolve_categories(self, args, context, info):
+        return [Category(id=1), Category(id=2), Category(id=1)]
+
+    def resolve_tags(self, args, context, info):
+        return [{'id': 1}, {'id': 2}, {'id': 1}, {}]
+
+    def resolve_anonymous(self, args, context, info):
+        return [Anonymous(), Anonymous()]
+
+    def resolve_promised(self, args, context, info):
+        calls.append(('promised', None))
+        return Promise.resolve(len(calls))
+
+
+schema = Schema(query=Query)
+
+
+def setup_function(function):
+    del calls[:]
+    clock.now = 0
+    for policy in (flags_policy, user_policy):
+        policy.clear()
+        policy.hits = policy.misses = 0
+        del policy.lookups[:]
+
+
+def execute(query, user='me'):
+    result = schema.execute(query, context_value={'user': user})
+    assert not result.errors
+    return result.data
+
+
+def test_results_are_cached_by_arguments():
+    assert execute('{ flags }') == {'flags': ['a', 'b']}
+    assert execute('{ flags }') == {'flags': ['a', 'b']}
+    assert execute('{ flags(prefix: "x") }') == {'flags': ['xa', 'xb']}
+    assert execute('{ flags(prefix: "x") }') == {'flags': ['xa', 'xb']}
+    assert calls == [('flags', None), ('flags', 'x')]
+    assert flags_policy.lookups == [
+        ('miss', (None, ())),
+        ('hit', (None, ())),
+        ('miss', (None, (('prefix', 'x'), ))),
+        ('hit', (None, (('prefix', 'x'), ))),
+    ]
+    assert flags_policy.hit_ratio == 0.5
+
+
+def test_results_expire_after_the_ttl():
+    execute('{ flags }')
+    clock.now = 29
+    execute('{ flags }')
+    clock.now = 30
+    execute('{ flags }')
+    assert calls == [('flags', None), ('flags', None)]
+
+
+def test_results_are_cached_by_the_key_of_the_root():
+    assert execute('{ categories { name } }') == {'categories': [
+        {'name': 'Category 1'}, {'name': 'Category 2'}, {'name': 'Category 1'},
+    ]}
+    assert calls == [('name', 1), ('name', 2)]
+
+
+def test_dict_roots_are_cached_by_their_id():
+    assert execute('{ tags { label } }') == {'tags': [
+        {'label': 'Tag 1'}, {'label': 'Tag 2'}, {'label': 'Tag 1'}, {'label': 'Tag None'},
+    ]}
+    assert calls == [('label', 1), ('label', 2), ('label', None)]
+
+
+def test_roots_without_id_are_not_cached():
+    execute('{ anonymous { name } }')
+    execute('{ anonymous { name } }')
+    assert calls == [('anonymous', None)] * 4
+    assert Anonymous._meta.fields['name'].cache.lookups == []
+
+
+def test_custom_parent_key():
+    assert execute('{ greeting }', user='me') == {'greeting': 'Hi me'}
+    assert execute('{ greeting }', user='you') == {'greeting': 'Hi you'}
+    assert execute('{ greeting }', user='me') == {'greeting': 'Hi me'}
+    assert calls == [('greeting', 'me'), ('greeting', 'you')]
+
+
+def test_errors_are_not_cached():
+    for i in range(2):
+        result = schema.execute('{ greeting }', context_value={'user': None})
+        assert [str(error) for error in result.errors] == ['Anonymous']
+    assert user_policy.hits == 0
+    assert calls == [('greeting', None), ('greeting', None)]
+
+
+def test_promised_results_are_cached_once_resolved():
+    assert execute('{ promised }') == {'promised': 1}
+    assert execute('{ promised }') == {'promised': 1}
+    assert calls == [('promised', None)]
+
+
+def test_local_cache_evicts_the_least_recently_used_results():
+    cache = LocalCache(max_entries=2)
+    cache.set('a', None)
+    cache.set('b', 2, ttl=10)
+    cache.get('a')
+    cache.set('c', 3)
+    assert cache.get('a', 'missing') is None
+    assert cache.get('b', 'missing') == 'missing'
+    assert cache.get('c') == 3
+
+
+def test_cache_needs_a_policy():
+    with pytest.raises(AssertionError):
+        CachedResolver(lambda *args: None, {'ttl': 10})
+    with pytest.raises(AssertionError):
+        CachePolicy(ttl=0)
+    with pytest.raises(AssertionError):
+        Field(Int, cache=CachePolicy(), batch=True)
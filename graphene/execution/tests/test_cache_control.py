@@ -0,0 +1,140 @@
+import pytest
+from promise import Promise
+
+from ...types import Field, Int, Interface, List, ObjectType, Schema, String
+from ..cache_control import PRIVATE, PUBLIC, CacheControl
+
+
+class Price(ObjectType):
+
+    class Meta:
+        max_age = 30
+
+    amount = Int()
+
+
+class Named(Interface):
+
+    class Meta:
+        max_age = 600
+
+    name = String()
+
+
+class Product(ObjectType):
+
+    class Meta:
+        interfaces = (Named, )
+
+    price = Field(Price)
+    cached_price = Field(Price, max_age=90)
+    stock = Int(max_age=5)
+
+
+class User(ObjectType):
+
+    class Meta:
+        cache_scope = PRIVATE
+
+    email = String()
+
+
+class Query(ObjectType):
+    products = List(Product, max_age=300)
+    named = Field(Named)
+    me = Field(User, max_age=60)
+    version = String()
+    promised = String(max_age=10)
+    broken = String(max_age=10)
+
+    def resolve_products(self, args, context, info):
+        return [Product(name='Product', price=Price(amount=1), stock=2)]
+
+    def resolve_me(self, args, context, info):
+        return User(email='me@example.com')
+
+    def resolve_version(self, args, context, info):
+        return '1.0'
+
+    def resolve_promised(self, args, context, info):
+        return Promise.resolve('promised')
+
+    def resolve_broken(self, args, context, info):
+        raise Exception('Broken')
+
+
+class Mutation(ObjectType):
+    touch = String()
+
+
+schema = Schema(query=Query, mutation=Mutation, types=[Product], cache_control=True, default_max_age=0)
+
+
+def get_hints(query, default_max_age=0):
+    document_ast, errors = schema.get_document(query)
+    assert not errors
+    return CacheControl(schema, default_max_age).get_hints(document_ast)
+
+
+def test_hints_are_the_minimum_of_the_fields():
+    assert get_hints('{ products { name } }') == (300, PUBLIC)
+    assert get_hints('{ products { name stock } }') == (5, PUBLIC)
+    assert get_hints('{ products { ...F } } fragment F on Product { stock }') == (5, PUBLIC)
+
+
+def test_fragments_are_walked_once():
+    # Each fragment spreads the next one twice
+    query = '{ products { ...F0 } } ' + ' '.join(
+        'fragment F{} on Product {{ name ...F{} ...F{} }}'.format(i, i + 1, i + 1) for i in range(60)
+    ) + ' fragment F60 on Product { stock }'
+    assert get_hints(query) == (5, PUBLIC)
+    assert get_hints('{ ...F } fragment F on Query { version products { name } }') == (0, PUBLIC)
+
+
+def test_fields_take_the_hints_of_their_types():
+    assert get_hints('{ products { price { amount } } }') == (30, PUBLIC)
+    assert get_hints('{ products { cachedPrice { amount } } }') == (90, PUBLIC)
+    assert get_hints('{ named { name } }') == (600, PUBLIC)
+    assert get_hints('{ me { email } }') == (60, PRIVATE)
+
+
+def test_root_fields_without_hints_have_the_default_max_age():
+    assert get_hints('{ version products { name } }') == (0, PUBLIC)
+    assert get_hints('{ version products { name } }', default_max_age=100) == (100, PUBLIC)
+    assert get_hints('{ __typename }', default_max_age=100) == (100, PUBLIC)
+    assert get_hints('mutation { touch }', default_max_age=100) == (0, PUBLIC)
+
+
+def test_hints_are_returned_in_the_extensions():
+    result = schema.execute('{ products { name } me { email } }')
+    assert not result.errors
+    assert result.extensions == {'cacheControl': {'maxAge': 60, 'scope': PRIVATE}}
+
+
+def test_hints_of_promised_results():
+    result = schema.execute('{ promised }', return_promise=True).get()
+    assert result.data == {'promised': 'promised'}
+    assert result.extensions == {'cacheControl': {'maxAge': 10, 'scope': PUBLIC}}
+
+
+def test_results_with_errors_are_not_cached():
+    result = schema.execute('{ promised broken }')
+    assert result.errors
+    assert result.extensions == {'cacheControl': {'maxAge': 0, 'scope': PUBLIC}}
+
+
+def test_schema_without_cache_control():
+    schema = Schema(query=Query)
+    for result in (
+        schema.execute('{ products { name } }'),
+        schema.execute('{ unknown }'),
+        schema.execute('{'),
+        schema.execute('{ products { name } }', return_promise=True).get(),
+        schema.compile('{ products { name } }').execute(),
+    ):
+        assert result.extensions is None
+
+
+def test_cache_scope_has_to_be_valid():
+    with pytest.raises(AssertionError):
+        Field(String, cache_scope='SHARED')
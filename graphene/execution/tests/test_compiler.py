@@ -0,0 +1,217 @@
+import pytest
+from promise import Promise
+
+from graphql.utils.introspection_query import introspection_query
+
+from ...types import (ID, Field, Int, Interface, List, Mutation, NonNull,
+                      ObjectType, Schema, String, Union)
+
+
+class Character(Interface):
+    name = String()
+
+
+class Human(ObjectType):
+
+    class Meta:
+        interfaces = (Character, )
+
+    home_planet = String()
+
+
+class Droid(ObjectType):
+
+    class Meta:
+        interfaces = (Character, )
+
+    primary_function = String()
+
+
+class SearchResult(Union):
+
+    class Meta:
+        types = (Human, Droid)
+
+
+luke = Human(name='Luke', home_planet='Tatooine')
+r2d2 = Droid(name='R2-D2', primary_function='Astromech')
+
+
+class Query(ObjectType):
+    hello = String(name=String(default_value='World'))
+    characters = List(Character)
+    search = List(SearchResult)
+    numbers = List(Int, first=Int())
+    error = String()
+    required_error = NonNull(String)
+    errors = List(NonNull(String))
+    promise = String()
+    rejected = String()
+    id = ID()
+
+    def resolve_hello(self, args, context, info):
+        return 'Hello {}'.format(args['name'])
+
+    def resolve_characters(self, args, context, info):
+        return [luke, r2d2]
+
+    def resolve_search(self, args, context, info):
+        return [r2d2, luke]
+
+    def resolve_numbers(self, args, context, info):
+        return list(range(args.get('first', 3)))
+
+    def resolve_error(self, args, context, info):
+        raise Exception('Failed')
+
+    def resolve_required_error(self, args, context, info):
+        return None
+
+    def resolve_errors(self, args, context, info):
+        return ['a', None]
+
+    def resolve_promise(self, args, context, info):
+        return Promise.resolve('Promised')
+
+    def resolve_rejected(self, args, context, info):
+        return Promise.reject(Exception('Rejected'))
+
+    def resolve_id(self, args, context, info):
+        return context['id']
+
+
+class CreateMessage(Mutation):
+
+    class Input:
+        text = String()
+
+    text = String()
+
+    def mutate(self, args, context, info):
+        return CreateMessage(text=args.get('text'))
+
+
+class Mutations(ObjectType):
+    create_message = CreateMessage.Field()
+
+
+schema = Schema(Query, mutation=Mutations, types=[Human, Droid])
+
+
+def assert_same_result(query, **kwargs):
+    compiled = schema.compile(query).execute(**kwargs)
+    executed = schema.execute(query, **kwargs)
+    assert compiled.data == executed.data
+    assert [str(e) for e in compiled.errors or []] == [str(e) for e in executed.errors or []]
+    assert compiled.invalid == executed.invalid
+    return compiled
+
+
+def test_compiled_query():
+    result = assert_same_result('{ hello }')
+    assert result.data == {'hello': 'Hello World'}
+
+
+def test_compiled_query_can_be_executed_many_times():
+    compiled = schema.compile('query Hello($name: String) { hello(name: $name) }')
+    assert compiled(variable_values={'name': 'Luke'}).data == {'hello': 'Hello Luke'}
+    assert compiled(variable_values={'name': 'Leia'}).data == {'hello': 'Hello Leia'}
+
+
+def test_compiled_query_arguments_and_aliases():
+    result = assert_same_result('{ a: hello(name: "A") b: hello(name: "B") numbers(first: 2) }')
+    assert result.data == {'a': 'Hello A', 'b': 'Hello B', 'numbers': [0, 1]}
+
+
+def test_compiled_query_interfaces_and_fragments():
+    result = assert_same_result('''
+        query {
+            characters {
+                __typename
+                name
+                ...HumanFragment
+                ... on Droid { primaryFunction }
+            }
+        }
+        fragment HumanFragment on Human { homePlanet }
+    ''')
+    assert result.data == {'characters': [
+        {'__typename': 'Human', 'name': 'Luke', 'homePlanet': 'Tatooine'},
+        {'__typename': 'Droid', 'name': 'R2-D2', 'primaryFunction': 'Astromech'},
+    ]}
+
+
+def test_compiled_query_unions():
+    assert_same_result('{ search { ... on Human { name } ... on Droid { primaryFunction } } }')
+
+
+def test_compiled_query_directives():
+    query = 'query Q($skip: Boolean!) { hello numbers @skip(if: $skip) }'
+    compiled = schema.compile(query)
+
+    assert compiled(variable_values={'skip': True}).data == {'hello': 'Hello World'}
+    assert compiled(variable_values={'skip': False}).data == {'hello': 'Hello World', 'numbers': [0, 1, 2]}
+    assert_same_result(query, variable_values={'skip': True})
+    assert_same_result('{ hello @include(if: false) numbers }')
+
+
+def test_compiled_query_errors():
+    result = assert_same_result('{ hello error errors }')
+    assert result.data == {'hello': 'Hello World', 'error': None, 'errors': None}
+    assert [e.message for e in result.errors] == [
+        'Failed',
+        'Cannot return null for non-nullable field Query.errors.',
+    ]
+
+
+def test_compiled_query_non_null_error():
+    result = assert_same_result('{ hello requiredError }')
+    assert result.data is None
+
+
+def test_compiled_query_promises():
+    result = assert_same_result('{ promise rejected }')
+    assert result.data == {'promise': 'Promised', 'rejected': None}
+    assert result.errors[0].message == 'Rejected'
+
+
+def test_compiled_query_context():
+    result = assert_same_result('{ id }', context_value={'id': 1})
+    assert result.data == {'id': '1'}
+
+
+def test_compiled_query_invalid_variables():
+    result = assert_same_result('query Q($first: Int) { numbers(first: $first) }', variable_values={'first': 'a'})
+    assert result.invalid
+
+
+def test_compiled_mutation():
+    result = assert_same_result('mutation { createMessage(text: "Hi") { text } }')
+    assert result.data == {'createMessage': {'text': 'Hi'}}
+
+
+def test_compiled_query_operation_name():
+    query = 'query A { hello } query B { numbers }'
+    assert schema.compile(query, 'B')().data == {'numbers': [0, 1, 2]}
+    with pytest.raises(Exception) as exc_info:
+        schema.compile(query)
+
+    assert str(exc_info.value) == 'Must provide operation name if query contains multiple operations.'
+
+
+def test_compiled_introspection_query():
+    assert_same_result(introspection_query)
+
+
+def test_compile_invalid_query():
+    with pytest.raises(Exception) as exc_info:
+        schema.compile('{ unknown }')
+
+    assert str(exc_info.value) == 'The query is not valid: Cannot query field "unknown" on type "Query".'
+
+
+def test_compiled_query_with_field_resolver():
+    class Query(ObjectType):
+        field = Field(String, resolver=lambda *_: 'resolved')
+
+    assert Schema(Query).compile('{ field }')().data == {'field': 'resolved'}
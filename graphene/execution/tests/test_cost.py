@@ -0,0 +1,138 @@
+from ...relay import Connection, ConnectionField
+from ...types import Field, Int, List, ObjectType, Schema, String
+from ..cost import CostAnalysis
+
+resolved = []
+
+
+class Ship(ObjectType):
+    name = String()
+    faction = Field(lambda: Faction)
+
+    def resolve_faction(self, args, context, info):
+        resolved.append('faction')
+        return Faction(name='Rebels')
+
+
+class ShipConnection(Connection):
+
+    class Meta:
+        node = Ship
+
+
+class Faction(ObjectType):
+    name = String()
+    ships = ConnectionField(ShipConnection)
+    report = String(cost=50)
+    fleet = List(Ship, size=Int(), multipliers=['size'])
+
+    def resolve_ships(self, args, context, info):
+        resolved.append('ships')
+        return [Ship(name='X-Wing')]
+
+
+class Query(ObjectType):
+    all_ships = ConnectionField(ShipConnection)
+    faction = Field(Faction)
+
+    def resolve_all_ships(self, args, context, info):
+        resolved.append('allShips')
+        return [Ship(name='X-Wing')]
+
+    def resolve_faction(self, args, context, info):
+        return Faction(name='Rebels')
+
+
+schema = Schema(query=Query, max_cost=1000)
+
+
+def get_cost(query, variable_values=None, **kwargs):
+    document_ast, errors = schema.get_document(query)
+    assert not errors
+    return CostAnalysis(schema, **kwargs).get_cost(document_ast, variable_values=variable_values)
+
+
+def test_each_field_costs_one_by_default():
+    assert get_cost('{ faction { name __typename } }') == 2
+    assert get_cost('{ faction { ... on Faction { name } ...F } } fragment F on Faction { name }') == 3
+
+
+def test_field_cost():
+    assert get_cost('{ faction { report } }') == 51
+    assert get_cost('{ faction { report } }', default_cost=0) == 50
+
+
+def test_connection_page_size_multiplies_the_cost():
+    # allShips + 10 * (edges + node + name)
+    assert get_cost('{ allShips(first: 10) { edges { node { name } } } }') == 31
+    assert get_cost('{ allShips(last: 5) { edges { node { name } } } }') == 16
+    assert get_cost('{ allShips { edges { node { name } } } }', default_multiplier=100) == 301
+
+
+def test_negative_multipliers_dont_lower_the_cost():
+    assert get_cost('{ allShips(first: -1000) { edges { node { name } } } }') == 1
+    query = '''{
+        a: allShips(first: -1000) { edges { node { name } } }
+        b: allShips(first: 100) { edges { node { name } } }
+    }'''
+    assert get_cost(query) == 302
+    assert get_cost('query ($first: Int) { allShips(first: $first) { edges { node { name } } } }', {'first': -5}) == 1
+
+
+def test_multipliers_from_variables():
+    query = 'query ($size: Int = 3) { faction { fleet(size: $size) { name } } }'
+    assert get_cost(query) == 5
+    assert get_cost(query, {'size': 10}) == 12
+
+
+def test_nested_connections_multiply():
+    query = '{ allShips(first: 10) { edges { node { faction { ships(first: 1000) { edges { node { name } } } } } } } }'
+    assert get_cost(query) == 1 + 10 * (2 + 1 + 1 + 1000 * 3)
+
+
+def get_fragment_chain(length):
+    return '{ faction { ...F0 } } ' + ' '.join(
+        'fragment F{} on Faction {{ name ...F{} ...F{} }}'.format(i, i + 1, i + 1) for i in range(length)
+    ) + ' fragment F{} on Faction {{ name }}'.format(length)
+
+
+def test_fragments_are_walked_once():
+    # Each fragment spreads the next one twice, doubling the cost
+    assert get_cost(get_fragment_chain(3)) == 1 + 2 ** 4 - 1
+    assert get_cost(get_fragment_chain(60)) == 1 + 2 ** 61 - 1
+
+
+def test_the_cost_is_not_walked_further_than_the_max_cost():
+    document_ast, errors = schema.get_document(
+        '{ faction { report } a: faction { report } b: faction { report } }'
+    )
+    assert CostAnalysis(schema).get_cost(document_ast, max_cost=10) == 51
+    assert CostAnalysis(schema).get_cost(document_ast) == 153
+
+
+def test_queries_above_the_max_cost_are_rejected_before_executing():
+    del resolved[:]
+    query = '{ allShips(first: 10) { edges { node { faction { ships(first: 1000) { edges { node { name } } } } } } } }'
+    result = schema.execute(query)
+    assert result.invalid
+    assert [str(error) for error in result.errors] == [
+        'The query has a cost of at least 30041, above the maximum cost of 1000.'
+    ]
+    assert resolved == []
+
+    result = schema.execute('{ allShips(first: 10) { edges { node { faction { name } } } } }')
+    assert not result.errors
+    assert resolved == ['allShips', 'faction']
+
+
+def test_cost_and_multipliers_arguments():
+    class ArgumentsQuery(ObjectType):
+        page = String(cost=Int(), multipliers=Int())
+
+        def resolve_page(self, args, context, info):
+            return '{cost} {multipliers}'.format(**args)
+
+    arguments_schema = Schema(query=ArgumentsQuery, max_cost=10)
+    result = arguments_schema.execute('{ page(cost: 100, multipliers: 20) }')
+    assert not result.errors
+    assert result.data == {'page': '100 20'}
@@ -0,0 +1,108 @@
+from graphql import parse
+
+from ...types import Int, List, ObjectType, Schema, String
+from ..document_cache import DocumentCache
+
+
+class Query(ObjectType):
+    hello = String()
+    all_ints = List(Int)
+
+    def resolve_hello(self, args, context, info):
+        return 'World'
+
+    def resolve_all_ints(self, args, context, info):
+        return [1, 2, 3]
+
+
+def test_document_cache_reuses_parsed_document():
+    schema = Schema(Query)
+    cache = DocumentCache()
+    document_ast, errors = cache.get_document(schema, '{ hello }')
+
+    assert not errors
+    assert cache.get_document(schema, '{ hello }') == (document_ast, errors)
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_document_cache_keys_by_schema():
+    schema = Schema(Query)
+    other_schema = Schema(Query)
+    cache = DocumentCache()
+    cache.get_document(schema, '{ hello }')
+    cache.get_document(other_schema, '{ hello }')
+
+    assert cache.misses == 2
+    assert len(cache) == 2
+
+
+def test_document_cache_keeps_syntax_errors():
+    schema = Schema(Query)
+    cache = DocumentCache()
+    document_ast, errors = cache.get_document(schema, '{ hello')
+
+    assert document_ast is None
+    assert len(errors) == 1
+    assert cache.get_document(schema, '{ hello') == (None, errors)
+
+
+def test_document_cache_max_bytes():
+    schema = Schema(Query)
+    cache = DocumentCache(max_bytes=20)
+    cache.get_document(schema, '{ hello }')
+    cache.get_document(schema, '{ allInts }')
+    cache.get_document(schema, '{ hello allInts }')
+
+    assert cache.size == len('{ hello allInts }')
+    assert len(cache) == 1
+
+
+def test_schema_execute_uses_document_cache():
+    schema = Schema(Query)
+    for _ in range(3):
+        executed = schema.execute('{ hello }')
+        assert not executed.errors
+        assert executed.data == {'hello': 'World'}
+
+    info = schema.document_cache.cache_info()
+    assert info.hits == 2
+    assert info.misses == 1
+    assert info.entries == 1
+
+
+def test_schema_execute_caches_validation_errors():
+    schema = Schema(Query)
+    executed = schema.execute('{ unknown }')
+    assert executed.invalid
+    assert executed.errors[0].message == 'Cannot query field "unknown" on type "Query".'
+
+    executed = schema.execute('{ unknown }')
+    assert executed.invalid
+    assert schema.document_cache.hits == 1
+
+
+def test_schema_execute_without_document_cache():
+    schema = Schema(Query, document_cache_size=0)
+    executed = schema.execute('{ hello }')
+
+    assert schema.document_cache is None
+    assert executed.data == {'hello': 'World'}
+
+
+def test_schema_execute_document_bypasses_cache():
+    schema = Schema(Query)
+    executed = schema.execute(parse('{ hello }'))
+
+    assert executed.data == {'hello': 'World'}
+    assert len(schema.document_cache) == 0
+
+
+def test_schema_document_cache_size():
+    schema = Schema(Query, document_cache_size=1, document_cache_max_bytes=100)
+    schema.execute('{ hello }')
+    schema.execute('{ allInts }')
+
+    assert schema.document_cache.max_size == 100
+    assert schema.document_cache.cache_info().entries == 1
+    assert schema.document_cache.evictions == 1
@@ -0,0 +1,194 @@
+import time
+from threading import Lock
+
+import pytest
+from promise import Promise
+
+from ...dataloader import get_loader
+from ...relay import ClientIDMutation, Connection, ConnectionField
+from ...types import Field, Int, List, ObjectType, Schema, String
+from ..executors import ThreadPoolExecutor
+
+DELAY = 0.1
+
+
+class Counter(object):
+
+    def __init__(self):
+        self.lock = Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def __call__(self, value):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(DELAY)
+        with self.lock:
+            self.running -= 1
+        return value
+
+
+loaded = []
+
+
+def load_names(keys):
+    loaded.append(list(keys))
+    return ['Item {}'.format(key) for key in keys]
+
+
+class Item(ObjectType):
+    value = Int()
+    name = String()
+    loaded_name = String()
+
+    def resolve_name(self, args, context, info):
+        return context['counter']('Item {}'.format(self.value))
+
+    def resolve_loaded_name(self, args, context, info):
+        return get_loader(load_names).load(self.value)
+
+
+class ItemConnection(Connection):
+
+    class Meta:
+        node = Item
+
+
+class AddItem(ClientIDMutation):
+
+    class Input:
+        value = Int()
+
+    item = Field(Item)
+
+    @staticmethod
+    def mutate_and_get_payload(args, context, info):
+        return Promise.resolve(AddItem(item=Item(value=args['value'])))
+
+
+class Query(ObjectType):
+    a = String()
+    b = String()
+    c = String()
+    items = List(Item)
+    item_connection = ConnectionField(ItemConnection)
+    error = String()
+
+    def resolve_a(self, args, context, info):
+        return context['counter']('a')
+
+    def resolve_b(self, args, context, info):
+        return context['counter']('b')
+
+    def resolve_c(self, args, context, info):
+        return context['counter']('c')
+
+    def resolve_items(self, args, context, info):
+        return [Item(value=i) for i in range(3)]
+
+    def resolve_item_connection(self, args, context, info):
+        return Promise.resolve(context['counter']([Item(value=i) for i in range(3)]))
+
+    def resolve_error(self, args, context, info):
+        raise Exception('Failed')
+
+
+class Mutation(ObjectType):
+    add_item = AddItem.Field()
+
+
+executor = ThreadPoolExecutor(max_workers=4)
+schema = Schema(query=Query, mutation=Mutation, executor=executor)
+
+
+def execute(query, schema=schema, **kwargs):
+    counter = Counter()
+    start = time.time()
+    result = schema.execute(query, context_value={'counter': counter}, **kwargs)
+    return result, counter, time.time() - start
+
+
+def test_sibling_fields_resolve_in_parallel():
+    result, counter, elapsed = execute('{ a b c }')
+    assert not result.errors
+    assert result.data == {'a': 'a', 'b': 'b', 'c': 'c'}
+    assert counter.max_running == 3
+    assert elapsed < DELAY * 2
+
+
+def test_list_items_resolve_in_parallel():
+    result, counter, elapsed = execute('{ items { name } a }')
+    assert not result.errors
+    assert result.data == {
+        'items': [{'name': 'Item 0'}, {'name': 'Item 1'}, {'name': 'Item 2'}],
+        'a': 'a',
+    }
+    assert counter.max_running == 4
+    assert elapsed < DELAY * 2
+
+
+def test_max_concurrency_limits_each_execution():
+    limited = Schema(query=Query, executor=ThreadPoolExecutor(max_workers=4, max_concurrency=2))
+    result, counter, elapsed = execute('{ a b c }', schema=limited)
+    assert result.data == {'a': 'a', 'b': 'b', 'c': 'c'}
+    assert counter.max_running == 2
+    assert elapsed >= DELAY * 2
+
+
+def test_errors():
+    result, counter, elapsed = execute('{ a error }')
+    assert result.data == {'a': 'a', 'error': None}
+    assert [str(error) for error in result.errors] == ['Failed']
+
+
+def test_relay_promises():
+    result, counter, elapsed = execute('{ itemConnection(first: 2) { edges { node { name } } } }')
+    assert not result.errors
+    assert result.data == {'itemConnection': {'edges': [
+        {'node': {'name': 'Item 0'}},
+        {'node': {'name': 'Item 1'}},
+    ]}}
+    result, counter, elapsed = execute('mutation { addItem(input: {value: 1}) { item { value } } }')
+    assert not result.errors
+    assert result.data == {'addItem': {'item': {'value': 1}}}
+
+
+def test_dataloaders_are_batched():
+    del loaded[:]
+    result, counter, elapsed = execute('{ items { loadedName } }')
+    assert not result.errors
+    assert result.data == {'items': [{'loadedName': 'Item 0'}, {'loadedName': 'Item 1'},
+                                     {'loadedName': 'Item 2'}]}
+    assert loaded == [[0, 1, 2]]
+
+
+def test_return_promise():
+    del loaded[:]
+    promise = schema.execute(
+        '{ a items { name loadedName } itemConnection(first: 1) { edges { node { name } } } }',
+        context_value={'counter': Counter()},
+        return_promise=True,
+    )
+    assert isinstance(promise, Promise)
+    result = promise.get(timeout=DELAY * 20)
+    assert not result.errors
+    assert result.data == {
+        'a': 'a',
+        'items': [{'name': 'Item {}'.format(i), 'loadedName': 'Item {}'.format(i)} for i in range(3)],
+        'itemConnection': {'edges': [{'node': {'name': 'Item 0'}}]},
+    }
+    assert loaded == [[0, 1, 2]]
+
+
+def test_the_executor_of_the_execution_is_used():
+    result, counter, elapsed = execute('{ a b }', executor=ThreadPoolExecutor(max_workers=1))
+    assert result.data == {'a': 'a', 'b': 'b'}
+    assert counter.max_running == 1
+
+
+def test_executor_arguments():
+    with pytest.raises(AssertionError):
+        ThreadPoolExecutor(max_workers=0)
+    with pytest.raises(AssertionError):
+        ThreadPoolExecutor(max_concurrency=0)
@@ -0,0 +1,82 @@
+from graphql.utils.introspection_query import introspection_query
+
+from ...types import Field, ObjectType, Schema, String
+from ..limits import QueryLimits, query_limits
+
+validations = []
+
+
+class Person(ObjectType):
+    name = String()
+    friend = Field(lambda: Person)
+
+    def resolve_friend(self, args, context, info):
+        return Person(name='Friend of {}'.format(self.name))
+
+
+class Query(ObjectType):
+    me = Field(Person)
+
+    def resolve_me(self, args, context, info):
+        return Person(name='Me')
+
+
+class CountedLimits(query_limits(max_depth=3, max_aliases=2, max_fields=8)):
+
+    def __init__(self, context):
+        super(CountedLimits, self).__init__(context)
+        validations.append(context)
+
+
+schema = Schema(query=Query, validation_rules=[CountedLimits])
+
+
+def get_errors(query):
+    result = schema.execute(query)
+    return [str(error) for error in result.errors or []]
+
+
+def test_queries_within_the_limits():
+    assert get_errors('{ me { name friend { name } } }') == []
+    assert get_errors(introspection_query) == []
+
+
+def test_max_depth():
+    assert get_errors('query Deep { me { friend { friend { name } } } }') == [
+        'The operation "Deep" has a depth of 4, above the maximum depth of 3.'
+    ]
+    assert get_errors('{ me { ...F } } fragment F on Person { friend { friend { name } } }') == [
+        'The operation "anonymous" has a depth of 4, above the maximum depth of 3.'
+    ]
+
+
+def test_max_aliases():
+    assert get_errors('{ a: me { name } b: me { name } c: me { name } }') == [
+        'The operation "anonymous" has 3 aliases, above the maximum of 2.'
+    ]
+
+
+def test_max_fields_counts_each_spread_of_the_fragments():
+    result = Schema(query=Query, validation_rules=[query_limits(max_fields=7)]).execute('''
+        { me { ...A friend { ...A } } }
+        fragment A on Person { name friend { ...B } }
+        fragment B on Person { name }
+    ''')
+    assert [str(error) for error in result.errors] == [
+        'The operation "anonymous" selects 8 fields, above the maximum of 7.'
+    ]
+
+
+def test_limits_are_validated_once_per_document():
+    del validations[:]
+    query = '{ me { name } }'
+    schema.execute(query)
+    schema.execute(query)
+    assert len(validations) == 1
+
+
+def test_limits_without_maximums():
+    assert QueryLimits.max_depth is None
+    rule = query_limits(max_depth=1)
+    assert (rule.max_depth, rule.max_aliases, rule.max_fields) == (1, None, None)
+    assert Schema(query=Query, validation_rules=[rule]).execute('{ me { name } }').errors
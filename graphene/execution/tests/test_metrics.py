@@ -0,0 +1,118 @@
+from threading import Thread
+
+from ...dataloader import get_loader
+from ...types import Field, List, ObjectType, Schema, String
+from ..metrics import FieldMetrics, ResolverMetrics
+
+
+def load_names(keys):
+    return ['Friend {}'.format(key) for key in keys]
+
+
+class Person(ObjectType):
+    name = String()
+    friends = List(lambda: Person)
+    loaded_name = String()
+    error = String()
+
+    def resolve_friends(self, args, context, info):
+        return [Person(name='{} {}'.format(self.name, i)) for i in range(3)]
+
+    def resolve_loaded_name(self, args, context, info):
+        return get_loader(load_names).load(self.name)
+
+    def resolve_error(self, args, context, info):
+        raise Exception('Failed')
+
+
+class Query(ObjectType):
+    me = Field(Person)
+
+    def resolve_me(self, args, context, info):
+        return Person(name='Me')
+
+
+def test_calls_and_errors_by_field():
+    metrics = ResolverMetrics()
+    schema = Schema(query=Query, middleware=[metrics])
+    schema.execute('{ me { friends { name loadedName } } }')
+    result = schema.execute('{ me { error } }')
+    assert result.errors
+    snapshot = metrics.snapshot()
+    assert {key: (value.calls, value.errors) for key, value in snapshot.items()} == {
+        ('Query', 'me'): (2, 0),
+        ('Person', 'friends'): (1, 0),
+        ('Person', 'name'): (3, 0),
+        ('Person', 'loadedName'): (3, 0),
+        ('Person', 'error'): (1, 1),
+    }
+
+
+def test_histogram_buckets():
+    metrics = ResolverMetrics(buckets=[1, 0.1])
+    for duration in [0.05, 0.1, 0.5, 2]:
+        metrics.record('Query', 'me', duration)
+    assert metrics.snapshot() == {
+        ('Query', 'me'): FieldMetrics(
+            calls=4,
+            errors=0,
+            duration=2.65,
+            buckets=((0.1, 2), (1, 3), (float('inf'), 4))
+        )
+    }
+
+
+def test_threads_record_into_their_own_buffers():
+    metrics = ResolverMetrics()
+    schema = Schema(query=Query, middleware=[metrics])
+
+    def execute():
+        for i in range(5):
+            assert not schema.execute('{ me { friends { name } } }').errors
+
+    # One after the other, as the promises can't be settled in many
+    # threads at the same time
+    threads = [Thread(target=execute) for i in range(3)]
+    for thread in threads:
+        thread.start()
+        thread.join()
+    assert len(metrics.buffers) == 3
+    snapshot = metrics.snapshot()
+    assert snapshot[('Query', 'me')].calls == 15
+    assert snapshot[('Person', 'name')].calls == 45
+
+
+def test_buffers_of_ended_threads_are_folded():
+    metrics = ResolverMetrics(buckets=[0.1])
+    threads = [Thread(target=metrics.record, args=('Query', 'me', 0.05)) for i in range(10)]
+    for thread in threads:
+        thread.start()
+        thread.join()
+    metrics.record('Query', 'me', 0.5)
+    assert len(metrics.buffers) == 11
+    for i in range(2):
+        assert metrics.snapshot()[('Query', 'me')] == FieldMetrics(
+            calls=11, errors=0, duration=1.0, buckets=((0.1, 10), (float('inf'), 11))
+        )
+        # Only the buffer of the current thread is kept
+        assert len(metrics.buffers) == 1
+
+
+def test_prometheus_format():
+    metrics = ResolverMetrics(buckets=[0.1])
+    metrics.record('Query', 'me', 0.05)
+    metrics.record('Query', 'me', 0.5, failed=True)
+    assert metrics.to_prometheus() == '\n'.join([
+        '# HELP graphql_resolver_calls_total Calls of the resolvers.',
+        '# TYPE graphql_resolver_calls_total counter',
+        'graphql_resolver_calls_total{parent_type="Query",field="me"} 2',
+        '# HELP graphql_resolver_errors_total Errors raised by the resolvers.',
+        '# TYPE graphql_resolver_errors_total counter',
+        'graphql_resolver_errors_total{parent_type="Query",field="me"} 1',
+        '# HELP graphql_resolver_duration_seconds Duration of the resolvers.',
+        '# TYPE graphql_resolver_duration_seconds histogram',
+        'graphql_resolver_duration_seconds_bucket{parent_type="Query",field="me",le="0.1"} 1',
+        'graphql_resolver_duration_seconds_bucket{parent_type="Query",field="me",le="+Inf"} 2',
+        'graphql_resolver_duration_seconds_sum{parent_type="Query",field="me"} 0.55',
+        'graphql_resolver_duration_seconds_count{parent_type="Query",field="me"} 2',
+    ]) + '\n'
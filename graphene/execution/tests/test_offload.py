@@ -0,0 +1,129 @@
+import os
+from threading import Lock
+
+import pytest
+
+from ...types import Field, Int, List, ObjectType, Schema, String
+from ..offload import OffloadResolver, get_process_pool
+
+
+def sum_of_squares(n):
+    return sum(i * i for i in range(n)) % 1000003
+
+
+def resolve_total(root, args, context, info):
+    return sum_of_squares(root.size * args.get('factor', 1))
+
+
+class Series(ObjectType):
+    size = Int()
+    total = Int(resolver=resolve_total, factor=Int())
+    offloaded_total = Int(resolver=resolve_total, offload='process', factor=Int())
+    projected_total = Int(resolver=resolve_total, offload='process', project=['size'])
+    mapped_total = Int(
+        resolver=resolve_total, offload='process', project=lambda root: Series(size=root.size * 2)
+    )
+    pid = Int(offload='process')
+    error = String(offload='process')
+
+    def resolve_pid(self, args, context, info):
+        assert context is None and info is None
+        return os.getpid()
+
+    def resolve_error(self, args, context, info):
+        raise Exception('Failed')
+
+
+class Query(ObjectType):
+    series = List(Series, sizes=List(Int))
+    locked_series = Field(Series, size=Int())
+
+    def resolve_series(self, args, context, info):
+        return [Series(size=size) for size in args['sizes']]
+
+    def resolve_locked_series(self, args, context, info):
+        series = Series(size=args['size'])
+        # The lock can't be pickled
+        series.lock = Lock()
+        return series
+
+
+schema = Schema(query=Query)
+
+
+def test_offloaded_resolvers_run_in_other_processes():
+    result = schema.execute('{ series(sizes: [10, 20]) { total offloadedTotal(factor: 2) pid } }')
+    assert not result.errors
+    assert result.data['series'][0]['total'] == sum_of_squares(10)
+    assert result.data['series'][0]['offloadedTotal'] == sum_of_squares(20)
+    assert result.data['series'][1]['offloadedTotal'] == sum_of_squares(40)
+    assert result.data['series'][0]['pid'] != os.getpid()
+
+
+def test_offloaded_roots_are_projected():
+    result = schema.execute('{ lockedSeries(size: 10) { projectedTotal mappedTotal } }')
+    assert not result.errors
+    assert result.data == {'lockedSeries': {'projectedTotal': sum_of_squares(10), 'mappedTotal': sum_of_squares(20)}}
+    result = schema.execute('{ lockedSeries(size: 10) { offloadedTotal } }')
+    assert result.errors
+    assert OffloadResolver(resolve_total, project='size').project_root({'size': 2, 'lock': Lock()}) == {'size': 2}
+
+
+def test_offloaded_errors():
+    result = schema.execute('{ series(sizes: [1]) { size error } }')
+    assert result.data == {'series': [{'size': 1, 'error': None}]}
+    assert [str(error) for error in result.errors] == ['Failed']
+
+
+def test_offload_outside_of_an_execution():
+    resolver = OffloadResolver(resolve_total)
+    promise = resolver(Series(size=3), {'factor': 2}, None, None)
+    assert promise.get() == sum_of_squares(6)
+
+
+def test_offload_to_a_given_executor():
+    class Executor(object):
+        def __init__(self):
+            self.calls = []
+
+        def submit(self, fn, *args):
+            self.calls.append(args)
+            return get_process_pool().submit(fn, *args)
+
+    executor = Executor()
+    resolver = Field(Int, offload=executor).get_resolver(resolve_total)
+    assert resolver(Series(size=2), {}, None, None).get() == sum_of_squares(2)
+    assert len(executor.calls) == 1
+    assert executor.calls[0][2] == {}
+
+
+def test_offload_needs_a_process_or_an_executor():
+    with pytest.raises(AssertionError):
+        OffloadResolver(resolve_total, offload='thread')
+    with pytest.raises(AssertionError):
+        Field(Int, offload='process', batch=True)
+    with pytest.raises(AssertionError):
+        Field(Int, project=['size'])
+    assert 'project' in Field(Int, project=String()).args
+    field = Field(Int, offload=Int())
+    assert 'offload' in field.args
+    assert field.offload is None
+
+
+SIZES = [200000] * 4
+HEAVY_QUERY = '{ series(sizes: %s) { %%s } }' % SIZES
+
+
+def execute_heavy(field):
+    result = schema.execute(HEAVY_QUERY % field)
+    assert not result.errors
+
+
+@pytest.mark.benchmark(group='offload')
+def test_inline_cpu_bound_benchmark(benchmark):
+    benchmark(execute_heavy, 'total')
+
+
+@pytest.mark.benchmark(group='offload')
+def test_offloaded_cpu_bound_benchmark(benchmark):
+    benchmark(execute_heavy, 'offloadedTotal')
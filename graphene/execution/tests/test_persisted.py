@@ -0,0 +1,102 @@
+import hashlib
+import json
+
+import pytest
+
+from ...types import Int, ObjectType, Schema, String
+from ..persisted import PersistedQueryRegistry, get_query_hash
+
+
+class Query(ObjectType):
+    hello = String(name=String())
+    number = Int()
+
+    def resolve_hello(self, args, context, info):
+        return 'Hello {}'.format(args.get('name', 'World'))
+
+    def resolve_number(self, args, context, info):
+        return 1
+
+
+hello_query = 'query Hello($name: String) { hello(name: $name) }'
+number_query = '{ number }'
+
+
+def test_get_query_hash():
+    assert get_query_hash(number_query) == hashlib.sha256(b'{ number }').hexdigest()
+
+
+def test_registry_register():
+    registry = PersistedQueryRegistry(Schema(Query))
+    query_hash = registry.register(number_query)
+
+    assert query_hash == get_query_hash(number_query)
+    assert query_hash in registry
+    assert len(registry) == 1
+    assert registry.get(query_hash).definitions
+
+
+def test_registry_register_invalid_query():
+    registry = PersistedQueryRegistry(Schema(Query))
+    with pytest.raises(Exception) as exc_info:
+        registry.register('{ unknown }')
+
+    assert 'Cannot query field "unknown" on type "Query".' in str(exc_info.value)
+    assert len(registry) == 0
+
+
+def test_registry_register_wrong_hash():
+    registry = PersistedQueryRegistry(Schema(Query))
+    with pytest.raises(Exception) as exc_info:
+        registry.register(number_query, 'abc')
+
+    assert 'does not match its text' in str(exc_info.value)
+
+
+def test_registry_load_manifest(tmpdir):
+    manifest = tmpdir.join('manifest.json')
+    manifest.write(json.dumps({
+        get_query_hash(hello_query): hello_query,
+        get_query_hash(number_query): number_query,
+    }))
+    registry = PersistedQueryRegistry(Schema(Query))
+    query_hashes = registry.load_manifest(str(manifest))
+
+    assert sorted(query_hashes) == sorted([get_query_hash(hello_query), get_query_hash(number_query)])
+    assert len(registry) == 2
+
+
+def test_registry_load_manifest_list(tmpdir):
+    manifest = tmpdir.join('manifest.json')
+    manifest.write(json.dumps([hello_query, number_query]))
+    registry = PersistedQueryRegistry(Schema(Query))
+
+    assert registry.load_manifest(str(manifest)) == [get_query_hash(hello_query), get_query_hash(number_query)]
+
+
+def test_registry_load_directory(tmpdir):
+    tmpdir.join('hello.graphql').write(hello_query)
+    tmpdir.join('number.graphql').write(number_query)
+    tmpdir.join('README').write('Not a query')
+    registry = PersistedQueryRegistry(Schema(Query))
+
+    assert registry.load_directory(str(tmpdir)) == [get_query_hash(hello_query), get_query_hash(number_query)]
+
+
+def test_schema_execute_persisted():
+    schema = Schema(Query)
+    query_hash = schema.persisted_queries.register(hello_query)
+
+    executed = schema.execute_persisted(query_hash, {'name': 'Persisted'})
+    assert not executed.errors
+    assert executed.data == {'hello': 'Hello Persisted'}
+    # The persisted documents are not parsed on execution
+    assert schema.document_cache.misses == 0
+
+
+def test_schema_execute_persisted_not_found():
+    schema = Schema(Query)
+    executed = schema.execute_persisted('abc')
+
+    assert executed.invalid
+    assert executed.errors[0].message == 'Persisted query "abc" not found.'
@@ -0,0 +1,137 @@
+import json
+
+from ...types import Field, Int, Interface, List, ObjectType, Schema, String
+from ..cache import LocalCache
+from ..response_cache import ResponseCache
+
+calls = []
+
+
+class Named(Interface):
+    name = String(max_age=60)
+
+
+class Product(ObjectType):
+
+    class Meta:
+        interfaces = (Named, )
+
+    price = Int(max_age=10)
+    stock = Int(max_age=0)
+
+
+class Query(ObjectType):
+    products = List(Product, max_age=300, category=String())
+    hello = String()
+    named = Field(Named)
+
+    def resolve_products(self, args, context, info):
+        calls.append(args.get('category'))
+        return [Product(name='Product {}'.format(i), price=i, stock=1) for i in range(2)]
+
+    def resolve_hello(self, args, context, info):
+        calls.append('hello')
+        return 'Hello'
+
+    def resolve_named(self, args, context, info):
+        return Product(name='Named')
+
+
+class Mutation(ObjectType):
+    touch = String()
+
+    def resolve_touch(self, args, context, info):
+        calls.append('touch')
+        return 'touched'
+
+
+schema = Schema(query=Query, mutation=Mutation, types=[Product])
+
+
+class Clock(object):
+    now = 0
+
+    def __call__(self):
+        return self.now
+
+
+clock = Clock()
+
+
+def get_cache(**kwargs):
+    backend = LocalCache()
+    backend.timer = clock
+    return ResponseCache(schema, backend=backend, **kwargs)
+
+
+def setup_function(function):
+    del calls[:]
+    clock.now = 0
+
+
+def test_results_are_cached_for_the_minimum_max_age():
+    cache = get_cache()
+    query = '{ products { name price } }'
+    assert cache.get_query(query) == ('{\n  products {\n    name\n    price\n  }\n}\n', (10, 'PUBLIC'))
+    first = cache.execute(query)
+    assert first.data == {'products': [{'name': 'Product 0', 'price': 0}, {'name': 'Product 1', 'price': 1}]}
+    assert cache.execute(query) is first
+    clock.now = 10
+    assert cache.execute(query) is not first
+    assert calls == [None, None]
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_queries_are_normalized():
+    cache = get_cache()
+    cache.execute('{ products { name } }')
+    cache.execute('''
+        # All the products
+        {
+            products {
+                name
+            }
+        }
+    ''')
+    assert calls == [None]
+
+
+def test_results_are_cached_by_variables_and_scope():
+    cache = get_cache()
+    query = 'query ($category: String) { products(category: $category) { name } }'
+    cache.execute(query, variable_values={'category': 'a'})
+    cache.execute(query, variable_values={'category': 'b'})
+    cache.execute(query, variable_values={'category': 'a'})
+    cache.execute(query, variable_values={'category': 'a'}, scope='user 1')
+    assert calls == ['a', 'b', 'a']
+
+
+def test_fields_without_hints_use_the_default_max_age():
+    assert get_cache().get_query('{ hello products { name } }') is None
+    assert get_cache(default_max_age=5).get_query('{ hello products { name } }')[1].max_age == 5
+    assert get_cache(default_max_age=5).get_query('{ __typename }')[1].max_age == 5
+
+
+def test_fragments_hints():
+    cache = get_cache(default_max_age=120)
+    assert cache.get_query('{ named { name } }')[1].max_age == 60
+    assert cache.get_query('{ named { ... on Product { price } } }')[1].max_age == 10
+    assert cache.get_query('{ named { ...Fields } } fragment Fields on Product { name }')[1].max_age == 60
+    assert cache.get_query('{ products { stock } }') is None
+
+
+def test_uncacheable_operations_are_executed():
+    cache = get_cache(default_max_age=60)
+    cache.execute('mutation { touch }')
+    cache.execute('mutation { touch }')
+    assert calls == ['touch', 'touch']
+    result = cache.execute('{ unknown }')
+    assert result.invalid
+
+
+def test_serialized_responses():
+    cache = get_cache(serialize=True)
+    response = cache.execute('{ products { price } }')
+    assert json.loads(response.decode('utf-8')) == {'data': {'products': [{'price': 0}, {'price': 1}]}}
+    assert cache.execute('{ products { price } }') is response
+    assert json.loads(cache.execute('{ unknown }').decode('utf-8'))['errors']
@@ -0,0 +1,125 @@
+import time
+
+from promise import Promise
+
+from ...dataloader import get_loader
+from ...types import Field, List, ObjectType, Schema, String
+from ..executors import ThreadPoolExecutor
+from ..tracing import TracingMiddleware
+
+
+def load_names(keys):
+    return ['Friend {}'.format(key) for key in keys]
+
+
+class Person(ObjectType):
+    name = String()
+    friends = List(lambda: Person)
+    loaded_name = String()
+    slow_name = String()
+    error = String()
+
+    def resolve_friends(self, args, context, info):
+        return [Person(name='{} {}'.format(self.name, i)) for i in range(2)]
+
+    def resolve_loaded_name(self, args, context, info):
+        return get_loader(load_names).load(self.name)
+
+    def resolve_slow_name(self, args, context, info):
+        time.sleep(0.05)
+        return self.name
+
+    def resolve_error(self, args, context, info):
+        raise Exception('Failed')
+
+
+class Query(ObjectType):
+    me = Field(Person)
+    promised = Field(Person)
+
+    def resolve_me(self, args, context, info):
+        return Person(name='Me')
+
+    def resolve_promised(self, args, context, info):
+        return Promise.resolve(Person(name='Promised'))
+
+
+tracing = TracingMiddleware()
+schema = Schema(query=Query, middleware=[tracing])
+
+
+def get_resolvers(result):
+    return {
+        tuple(resolver['path']): resolver
+        for resolver in result.extensions['tracing']['execution']['resolvers']
+    }
+
+
+def test_tracing_extension():
+    result = schema.execute('{ me { name friends { name } } promised { alias: name } }')
+    assert not result.errors
+    tracing = result.extensions['tracing']
+    assert tracing['version'] == 1
+    assert tracing['startTime'].endswith('Z') and tracing['endTime'].endswith('Z')
+    assert tracing['duration'] > 0
+    resolvers = get_resolvers(result)
+    assert sorted(resolvers) == sorted([
+        ('me', ),
+        ('me', 'name'),
+        ('me', 'friends'),
+        ('me', 'friends', 0, 'name'),
+        ('me', 'friends', 1, 'name'),
+        ('promised', ),
+        ('promised', 'alias'),
+    ])
+    assert resolvers[('me', 'friends')] == dict(
+        resolvers[('me', 'friends')],
+        parentType='Person',
+        fieldName='friends',
+        returnType='[Person]',
+    )
+    assert resolvers[('promised', 'alias')]['fieldName'] == 'name'
+    for resolver in resolvers.values():
+        assert 0 <= resolver['startOffset'] <= tracing['duration']
+        assert resolver['duration'] >= 0
+
+
+def test_deferred_resolvers_are_timed_until_resolved():
+    result = schema.execute('{ me { friends { loadedName } } }')
+    assert result.data == {'me': {'friends': [{'loadedName': 'Friend Me 0'}, {'loadedName': 'Friend Me 1'}]}}
+    resolvers = get_resolvers(result)
+    assert ('me', 'friends', 1, 'loadedName') in resolvers
+
+
+def test_resolvers_running_in_threads():
+    result = schema.execute(
+        '{ me { friends { slowName } } }',
+        executor=ThreadPoolExecutor(max_workers=2)
+    )
+    assert not result.errors
+    resolver = get_resolvers(result)[('me', 'friends', 0, 'slowName')]
+    assert resolver['duration'] >= 0.05 * 1e9
+
+
+def test_failed_resolvers_are_traced():
+    result = schema.execute('{ me { error } }')
+    assert [str(error) for error in result.errors] == ['Failed']
+    assert ('me', 'error') in get_resolvers(result)
+
+
+def test_sampling():
+    schema = Schema(query=Query, middleware=[TracingMiddleware(sample_rate=0)])
+    result = schema.execute('{ me { name } }')
+    assert result.data == {'me': {'name': 'Me'}}
+    assert not getattr(result, 'extensions', None)
+
+
+def test_middleware_given_to_execute():
+    result = Schema(query=Query).execute('{ me { name } }', middleware=[TracingMiddleware()])
+    assert ('me', 'name') in get_resolvers(result)
+
+
+def test_promised_results():
+    result = schema.execute('{ promised { name } }', return_promise=True).get()
+    assert result.data == {'promised': {'name': 'Promised'}}
+    assert ('promised', 'name') in get_resolvers(result)
@@ -0,0 +1,146 @@
+import random
+import time
+from datetime import datetime, timedelta
+
+from graphql.type.definition import get_named_type, is_leaf_type
+from promise import Promise
+
+from .scope import get_current_scope
+
+# The most precise clock available (perf_counter needs Python 3.3+)
+timer = getattr(time, 'perf_counter', time.time)
+
+
+def to_nanoseconds(seconds):
+    return int(seconds * 1e9)
+
+
+def format_datetime(value):
+    return value.isoformat() + 'Z'
+
+
+class Trace(object):
+    '''
+    The timings of the resolvers of a single execution.
+
+    graphql-core doesn't give the path of the fields to the resolvers,
+    so it is rebuilt from the objects returned by their parent fields:
+    the path of a field is the one of the field that returned its root
+    (or the index of the root in its list) followed by its response key.
+    '''
+
+    def __init__(self):
+        self.start_time = datetime.utcnow()
+        self.start = timer()
+        self.paths = {}
+        self.resolvers = []
+
+    def get_path(self, root, info):
+        field_ast = info.field_asts[0]
+        key = field_ast.alias.value if field_ast.alias else info.field_name
+        return self.paths.get(id(root), []) + [key]
+
+    def add_paths(self, value, path):
+        if isinstance(value, (list, tuple)):
+            for index, item in enumerate(value):
+                self.add_paths(item, path + [index])
+        elif value is not None:
+            self.paths[id(value)] = path
+
+    def add_resolver(self, path, info, start, end):
+        self.resolvers.append({
+            'path': path,
+            'parentType': str(info.parent_type),
+            'fieldName': info.field_name,
+            'returnType': str(info.return_type),
+            'startOffset': to_nanoseconds(start - self.start),
+            'duration': to_nanoseconds(end - start),
+        })
+
+    def get_extension(self):
+        duration = timer() - self.start
+        return {
+            'version': 1,
+            'startTime': format_datetime(self.start_time),
+            'endTime': format_datetime(self.start_time + timedelta(seconds=duration)),
+            'duration': to_nanoseconds(duration),
+            'execution': {
+                'resolvers': self.resolvers,
+            },
+        }
+
+
+class TracingMiddleware(object):
+    '''
+    Middleware recording the start offset and duration of the resolvers,
+    returned in the ``tracing`` extension of the result following the
+    Apollo tracing format.
+
+    Only a ``sample_rate`` of the executions are traced, the rest just
+    pay for a lookup in their scope per field.
+
+    The middleware keeps no state between executions, so the same one
+    can be given to the schema and shared by all of them.
+    '''
+
+    extension_name = 'tracing'
+
+    def __init__(self, sample_rate=1.0):
+        assert 0 <= sample_rate <= 1, 'The sample_rate must be between 0 and 1, received {}.'.format(
+            sample_rate
+        )
+        self.sample_rate = sample_rate
+
+    def should_sample(self):
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def get_trace(self):
+        scope = get_current_scope()
+        if scope is None:
+            return None
+        try:
+            return scope.extensions[self.extension_name]
+        except KeyError:
+            pass
+        # The executions are sampled on the first resolver they run
+        with scope.lock:
+            if self.extension_name not in scope.extensions:
+                scope.extensions[self.extension_name] = Trace() if self.should_sample() else None
+            return scope.extensions[self.extension_name]
+
+    def resolve(self, next, root, args, context, info):
+        trace = self.get_trace()
+        if trace is None:
+            return next(root, args, context, info)
+
+        path = trace.get_path(root, info)
+        is_leaf = is_leaf_type(get_named_type(info.return_type))
+        start = timer()
+        try:
+            promise = next(root, args, context, info)
+        except Exception:
+            trace.add_resolver(path, info, start, timer())
+            raise
+        if not isinstance(promise, Promise):
+            # The middleware after this one can return plain values
+            promise = Promise.resolve(promise)
+
+        def on_resolve(value):
+            trace.add_resolver(path, info, start, timer())
+            if not is_leaf:
+                trace.add_paths(value, path)
+            return value
+
+        def on_reject(error):
+            trace.add_resolver(path, info, start, timer())
+            raise error
+
+        # The resolvers of the fields are done once their promise is
+        # resolved, which happens right away unless they are deferred
+        if promise.is_fulfilled:
+            on_resolve(promise.value)
+            return promise
+        if promise.is_rejected:
+            trace.add_resolver(path, info, start, timer())
+            return promise
+        return promise.then(on_resolve, on_reject)
@@ -1,6 +1,6 @@
 from .node import Node, is_node, GlobalID
 from .mutation import ClientIDMutation
-from .connection import Connection, ConnectionField, PageInfo
+from .connection import Connection, ConnectionField, PageInfo, KeysetConnection, KeysetConnectionField
 
 __all__ = [
     'Node',
@@ -10,4 +10,6 @@ __all__ = [
     'Connection',
     'ConnectionField',
     'PageInfo',
+    'KeysetConnection',
+    'KeysetConnectionField',
 ]
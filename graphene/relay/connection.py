@@ -1,11 +1,18 @@
+import datetime
+import json
 import re
-from collections import Iterable, OrderedDict
+from bisect import bisect_left, bisect_right
+from collections import Iterable, Mapping, OrderedDict, Sequence, deque
+from decimal import Decimal
 from functools import partial
+from uuid import UUID
 
 import six
 
 from graphql_relay import connection_from_list
-from promise import Promise
+from graphql_relay.utils import base64, unbase64
+from graphql_relay.connection.arrayconnection import (get_offset_with_default,
+                                                      offset_to_cursor)
 
 from ..types import (AbstractType, Boolean, Enum, Int, Interface, List, NonNull, Scalar, String,
                      Union)
@@ -14,8 +21,160 @@ from ..types.objecttype import ObjectType, ObjectTypeMeta
 from ..types.options import Options
 from ..utils.is_base_type import is_base_type
 from ..utils.props import props
+from ..utils.thenables import maybe_thenable
 from .node import is_node
 
+try:
+    from .connection_async import connection_from_async_iterator
+except SyntaxError:  # pragma: no cover
+    # Async iterators need Python 3.5+
+    connection_from_async_iterator = None
+
+
+def is_sliceable(value):
+    return hasattr(value, '__getitem__') and not isinstance(value, (Mapping, ) + six.string_types)
+
+
+def count_sliceable(value):
+    if isinstance(value, Sequence):
+        return len(value)
+    count = getattr(value, 'count', None)
+    if callable(count):
+        # Like querysets, that would fetch all the rows for knowing its length
+        return count()
+    return len(value)
+
+
+def connection_from_sliceable(sliceable, args, connection_type, edge_type, pageinfo_type):
+    '''
+    Returns the connection of a lazily sliceable source (like a queryset),
+    slicing from it only the nodes of the page, plus one more to know if
+    there is a next one when paginating forwards.
+
+    The source is only counted when paginating backwards without a
+    ``before`` cursor.
+    '''
+    first = args.get('first')
+    last = args.get('last')
+    after_offset = get_offset_with_default(args.get('after'), -1)
+    end_offset = get_offset_with_default(args.get('before'), None)
+    start_offset = lower_bound = max(after_offset, -1) + 1
+    has_next_page = False
+
+    if isinstance(first, int):
+        first = max(first, 0)
+        stop = start_offset + first + 1
+        if end_offset is not None:
+            stop = min(stop, end_offset)
+        nodes = list(sliceable[start_offset:max(stop, start_offset)])
+        has_next_page = len(nodes) > first
+        nodes = nodes[:first]
+    elif isinstance(last, int):
+        if end_offset is None:
+            end_offset = count_sliceable(sliceable)
+        start_offset = max(start_offset, end_offset - max(last, 0))
+        nodes = list(sliceable[start_offset:max(end_offset, start_offset)])
+    elif end_offset is None:
+        nodes = list(sliceable[start_offset:])
+    else:
+        nodes = list(sliceable[start_offset:max(end_offset, start_offset)])
+
+    if isinstance(last, int) and isinstance(first, int) and len(nodes) > last:
+        start_offset += len(nodes) - max(last, 0)
+        nodes = nodes[len(nodes) - max(last, 0):]
+
+    edges = [
+        edge_type(node=node, cursor=offset_to_cursor(start_offset + i))
+        for i, node in enumerate(nodes)
+    ]
+    return connection_type(
+        edges=edges,
+        page_info=pageinfo_type(
+            start_cursor=edges[0].cursor if edges else None,
+            end_cursor=edges[-1].cursor if edges else None,
+            has_previous_page=isinstance(last, int) and start_offset > lower_bound,
+            has_next_page=has_next_page
+        )
+    )
+
+
+class StreamedPage(object):
+    '''
+    Collects the page of a connection from a forward-only source (like a
+    generator or a database cursor), keeping only the nodes of the page,
+    plus one more to know if there is a next or previous page.
+    '''
+
+    def __init__(self, args):
+        self.first = args.get('first')
+        self.last = args.get('last')
+        after_offset = get_offset_with_default(args.get('after'), -1)
+        self.start_offset = max(after_offset, -1) + 1
+        self.end_offset = get_offset_with_default(args.get('before'), None)
+        self.offset = 0
+        if isinstance(self.first, int):
+            self.first = max(self.first, 0)
+            self.nodes = []
+        elif isinstance(self.last, int):
+            # Only the last nodes seen (and one more) are kept
+            self.nodes = deque(maxlen=max(self.last, 0) + 1)
+        else:
+            self.nodes = []
+
+    def add(self, node):
+        '''
+        Adds the next node of the source, returning False once
+        the rest of the nodes are not needed.
+        '''
+        offset = self.offset
+        if self.end_offset is not None and offset >= self.end_offset:
+            return False
+        self.offset += 1
+        if offset < self.start_offset:
+            return True
+        self.nodes.append(node)
+        return not isinstance(self.first, int) or len(self.nodes) <= self.first
+
+    def get_connection(self, connection_type, edge_type, pageinfo_type):
+        nodes = list(self.nodes)
+        start_offset = self.start_offset
+        has_previous_page = has_next_page = False
+        if isinstance(self.first, int):
+            has_next_page = len(nodes) > self.first
+            nodes = nodes[:self.first]
+        else:
+            start_offset = max(self.offset, start_offset) - len(nodes)
+        if isinstance(self.last, int) and len(nodes) > self.last:
+            has_previous_page = True
+            start_offset += len(nodes) - max(self.last, 0)
+            nodes = nodes[len(nodes) - max(self.last, 0):]
+
+        edges = [
+            edge_type(node=node, cursor=offset_to_cursor(start_offset + i))
+            for i, node in enumerate(nodes)
+        ]
+        return connection_type(
+            edges=edges,
+            page_info=pageinfo_type(
+                start_cursor=edges[0].cursor if edges else None,
+                end_cursor=edges[-1].cursor if edges else None,
+                has_previous_page=has_previous_page,
+                has_next_page=has_next_page
+            )
+        )
+
+
+def connection_from_iterator(iterator, args, connection_type, edge_type, pageinfo_type):
+    '''
+    Returns the connection of a forward-only source, consuming it only
+    until the end of the page.
+    '''
+    page = StreamedPage(args)
+    for node in iterator:
+        if not page.add(node):
+            break
+    return page.get_connection(connection_type, edge_type, pageinfo_type)
+
 
 class PageInfo(ObjectType):
     has_next_page = Boolean(
@@ -100,6 +259,8 @@ class IterableConnectionField(Field):
         kwargs.setdefault('after', String())
         kwargs.setdefault('first', Int())
         kwargs.setdefault('last', Int())
+        # The cost of the selection of a connection grows with its page size
+        kwargs.setdefault('multipliers', ('first', 'last'))
         super(IterableConnectionField, self).__init__(
             type,
             *args,
@@ -123,17 +284,47 @@ class IterableConnectionField(Field):
         if isinstance(resolved, connection_type):
             return resolved
 
-        assert isinstance(resolved, Iterable), (
+        if connection_from_async_iterator and hasattr(resolved, '__aiter__'):
+            # The connection is resolved once the page is consumed
+            return connection_from_async_iterator(
+                resolved,
+                StreamedPage(args),
+                connection_type=connection_type,
+                edge_type=connection_type.Edge,
+                pageinfo_type=PageInfo
+            )
+
+        sliceable = not isinstance(resolved, (list, tuple)) and is_sliceable(resolved)
+        assert sliceable or isinstance(resolved, Iterable), (
             'Resolved value from the connection field have to be iterable or instance of {}. '
             'Received "{}"'
         ).format(connection_type, resolved)
-        connection = connection_from_list(
-            resolved,
-            args,
-            connection_type=connection_type,
-            edge_type=connection_type.Edge,
-            pageinfo_type=PageInfo
-        )
+        if sliceable:
+            # Lazy sources are only sliced, without materializing them
+            connection = connection_from_sliceable(
+                resolved,
+                args,
+                connection_type=connection_type,
+                edge_type=connection_type.Edge,
+                pageinfo_type=PageInfo
+            )
+        elif not isinstance(resolved, (list, tuple)):
+            # Forward-only sources are consumed until the end of the page
+            connection = connection_from_iterator(
+                resolved,
+                args,
+                connection_type=connection_type,
+                edge_type=connection_type.Edge,
+                pageinfo_type=PageInfo
+            )
+        else:
+            connection = connection_from_list(
+                resolved,
+                args,
+                connection_type=connection_type,
+                edge_type=connection_type.Edge,
+                pageinfo_type=PageInfo
+            )
         connection.iterable = resolved
         return connection
 
@@ -142,13 +333,275 @@ class IterableConnectionField(Field):
         resolved = resolver(root, args, context, info)
 
         on_resolve = partial(cls.resolve_connection, connection_type, args)
-        if isinstance(resolved, Promise):
-            return resolved.then(on_resolve)
-
-        return on_resolve(resolved)
+        return maybe_thenable(resolved, on_resolve)
 
     def get_resolver(self, parent_resolver):
         resolver = super(IterableConnectionField, self).get_resolver(parent_resolver)
         return partial(self.connection_resolver, resolver, self.type)
 
 ConnectionField = IterableConnectionField
+
+
+KEYSET_PREFIX = 'keyset:'
+
+
+class UTC(datetime.tzinfo):
+
+    def utcoffset(self, dt):
+        return datetime.timedelta(0)
+
+    def dst(self, dt):
+        return datetime.timedelta(0)
+
+    def tzname(self, dt):
+        return 'UTC'
+
+
+try:
+    utc = datetime.timezone.utc
+except AttributeError:  # pragma: no cover
+    # Python 2
+    utc = UTC()
+
+
+def parse_iso_datetime(value):
+    return datetime.datetime.strptime(
+        value, '%Y-%m-%dT%H:%M:%S.%f' if '.' in value else '%Y-%m-%dT%H:%M:%S'
+    )
+
+
+def serialize_sort_key(value):
+    '''
+    Returns the sort key as a JSON value, tagging the types JSON can't
+    represent (datetimes, dates, times, decimals and uuids) so they are
+    parsed back by ``parse_sort_key``.
+    '''
+    if isinstance(value, datetime.datetime):
+        offset = value.utcoffset()
+        if offset is None:
+            return {'datetime': value.isoformat()}
+        # The aware datetimes are compared by their instant
+        return {'datetime': (value.replace(tzinfo=None) - offset).isoformat(), 'utc': True}
+    if isinstance(value, datetime.date):
+        return {'date': value.isoformat()}
+    if isinstance(value, datetime.time):
+        assert value.utcoffset() is None, 'The time sort keys can not be aware, received "{}".'.format(value)
+        return {'time': value.isoformat()}
+    if isinstance(value, Decimal):
+        return {'decimal': str(value)}
+    if isinstance(value, UUID):
+        return {'uuid': str(value)}
+    return value
+
+
+def parse_sort_key(value):
+    if not isinstance(value, dict):
+        return value
+    if 'datetime' in value:
+        parsed = parse_iso_datetime(value['datetime'])
+        return parsed.replace(tzinfo=utc) if value.get('utc') else parsed
+    if 'date' in value:
+        return datetime.datetime.strptime(value['date'], '%Y-%m-%d').date()
+    if 'time' in value:
+        return parse_iso_datetime('1900-01-01T' + value['time']).time()
+    if 'decimal' in value:
+        return Decimal(value['decimal'])
+    if 'uuid' in value:
+        return UUID(value['uuid'])
+    raise ValueError('Unknown sort key "{}".'.format(value))
+
+
+def keys_to_cursor(keys):
+    return base64(KEYSET_PREFIX + json.dumps(list(keys), separators=(',', ':')))
+
+
+def cursor_to_keys(cursor):
+    if not isinstance(cursor, six.string_types):
+        return None
+    try:
+        keys = unbase64(cursor)
+    except Exception:
+        return None
+    if not keys.startswith(KEYSET_PREFIX):
+        return None
+    try:
+        return tuple(json.loads(keys[len(KEYSET_PREFIX):]))
+    except (TypeError, ValueError):
+        return None
+
+
+class KeysetListSource(object):
+    '''
+    A keyset source for a list of nodes already sorted by their keys.
+    '''
+
+    def __init__(self, nodes, get_keys):
+        self.nodes = nodes
+        self.keys = [tuple(get_keys(node)) for node in nodes]
+
+    def get_page(self, after=None, before=None, limit=None, reverse=False):
+        start = 0 if after is None else bisect_right(self.keys, after)
+        end = len(self.keys) if before is None else bisect_left(self.keys, before)
+        if end <= start:
+            return []
+        if reverse:
+            if limit is not None:
+                start = max(start, end - limit)
+            return self.nodes[start:end][::-1]
+        if limit is not None:
+            end = min(end, start + limit)
+        return self.nodes[start:end]
+
+
+def connection_from_keyset_source(source, args, connection_type, edge_type, pageinfo_type):
+    '''
+    Returns the connection of a keyset source, that is asked for the
+    nodes after or before the keys of the cursors instead of skipping
+    an offset.
+
+    A keyset source has a ``get_page(after, before, limit, reverse)``
+    method returning up to ``limit`` nodes sorted by their keys, with
+    keys greater than ``after`` and lower than ``before`` (if they are
+    not None), starting from the greatest ones if ``reverse`` is True.
+    '''
+    first = args.get('first')
+    last = args.get('last')
+    after = connection_type.get_cursor_keys(args.get('after'))
+    before = connection_type.get_cursor_keys(args.get('before'))
+    has_previous_page = has_next_page = False
+
+    if isinstance(first, int):
+        first = max(first, 0)
+        nodes = list(source.get_page(after=after, before=before, limit=first + 1))
+        has_next_page = len(nodes) > first
+        nodes = nodes[:first]
+        if isinstance(last, int) and len(nodes) > last:
+            has_previous_page = True
+            nodes = nodes[len(nodes) - max(last, 0):]
+    elif isinstance(last, int):
+        last = max(last, 0)
+        nodes = list(source.get_page(after=after, before=before, limit=last + 1, reverse=True))
+        has_previous_page = len(nodes) > last
+        nodes = nodes[:last]
+        nodes.reverse()
+    else:
+        nodes = list(source.get_page(after=after, before=before))
+
+    edges = [
+        edge_type(node=node, cursor=connection_type.get_cursor(node))
+        for node in nodes
+    ]
+    return connection_type(
+        edges=edges,
+        page_info=pageinfo_type(
+            start_cursor=edges[0].cursor if edges else None,
+            end_cursor=edges[-1].cursor if edges else None,
+            has_previous_page=has_previous_page,
+            has_next_page=has_next_page
+        )
+    )
+
+
+class KeysetConnectionMeta(ConnectionMeta):
+
+    def __new__(cls, name, bases, attrs):
+        if not is_base_type(bases, KeysetConnectionMeta):
+            return type.__new__(cls, name, bases, attrs)
+
+        meta = attrs.get('Meta')
+        meta_attrs = props(meta) if meta else {}
+        sort_keys = meta_attrs.pop('sort_keys', ('id', ))
+        assert sort_keys and not isinstance(sort_keys, six.string_types), (
+            'The sort_keys of {} have to be a list of attribute names, received "{}".'
+        ).format(name, sort_keys)
+        if meta:
+            attrs['Meta'] = type('Meta', (object, ), meta_attrs)
+
+        cls = ConnectionMeta.__new__(cls, name, bases, attrs)
+        cls._meta.sort_keys = tuple(sort_keys)
+        return cls
+
+
+class KeysetConnection(six.with_metaclass(KeysetConnectionMeta, Connection)):
+    '''
+    A connection whose cursors encode the sort keys of the nodes (the
+    ``sort_keys`` attributes in its Meta, ``id`` by default), so deep
+    pages are fetched with range scans instead of offsets.
+
+    The sort keys are encoded in the cursors as JSON values, returned by
+    ``serialize_sort_key(name, value)`` and decoded by
+    ``parse_sort_key(name, value)``. Datetimes, dates, times, decimals
+    and uuids are supported by default, and these methods can be
+    overridden for other values JSON can't represent.
+    '''
+
+    @classmethod
+    def get_sort_keys(cls, node):
+        return tuple(getattr(node, key) for key in cls._meta.sort_keys)
+
+    @classmethod
+    def serialize_sort_key(cls, name, value):
+        return serialize_sort_key(value)
+
+    @classmethod
+    def parse_sort_key(cls, name, value):
+        return parse_sort_key(value)
+
+    @classmethod
+    def get_cursor(cls, node):
+        return keys_to_cursor(
+            cls.serialize_sort_key(name, value)
+            for name, value in zip(cls._meta.sort_keys, cls.get_sort_keys(node))
+        )
+
+    @classmethod
+    def get_cursor_keys(cls, cursor):
+        '''
+        Returns the sort keys of the cursor, or None if it's not valid.
+        '''
+        keys = cursor_to_keys(cursor)
+        if keys is None or len(keys) != len(cls._meta.sort_keys):
+            return None
+        try:
+            return tuple(cls.parse_sort_key(name, value) for name, value in zip(cls._meta.sort_keys, keys))
+        except Exception:
+            return None
+
+
+class KeysetConnectionField(IterableConnectionField):
+    '''
+    A connection field for a ``KeysetConnection``.
+
+    The resolver returns a keyset source (see ``connection_from_keyset_source``)
+    or a list of nodes sorted by their keys.
+    '''
+
+    @property
+    def type(self):
+        connection_type = super(KeysetConnectionField, self).type
+        assert issubclass(connection_type, KeysetConnection), (
+            '{} type have to be a subclass of KeysetConnection. Received "{}".'
+        ).format(str(self), connection_type)
+        return connection_type
+
+    @classmethod
+    def resolve_connection(cls, connection_type, args, resolved):
+        if isinstance(resolved, connection_type):
+            return resolved
+
+        source = resolved
+        if not callable(getattr(source, 'get_page', None)):
+            assert isinstance(resolved, Iterable), (
+                'Resolved value from the connection field have to be a keyset source, '
+                'iterable or instance of {}. Received "{}"'
+            ).format(connection_type, resolved)
+            source = KeysetListSource(list(resolved), connection_type.get_sort_keys)
+        connection = connection_from_keyset_source(
+            source,
+            args,
+            connection_type=connection_type,
+            edge_type=connection_type.Edge,
+            pageinfo_type=PageInfo
+        )
+        connection.iterable = resolved
+        return connection
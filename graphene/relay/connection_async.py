@@ -0,0 +1,9 @@
+async def connection_from_async_iterator(iterator, page, connection_type, edge_type, pageinfo_type):
+    '''
+    Returns the connection of an async iterator, consuming it only
+    until the end of the page.
+    '''
+    async for node in iterator:
+        if not page.add(node):
+            break
+    return page.get_connection(connection_type, edge_type, pageinfo_type)
@@ -3,12 +3,11 @@ from functools import partial
 
 import six
 
-from promise import Promise
-
 from ..types import AbstractType, Argument, Field, InputObjectType, String
 from ..types.objecttype import ObjectType, ObjectTypeMeta
 from ..utils.is_base_type import is_base_type
 from ..utils.props import props
+from ..utils.thenables import maybe_thenable
 
 
 class ClientIDMutationMeta(ObjectTypeMeta):
@@ -59,6 +58,7 @@ class ClientIDMutation(six.with_metaclass(ClientIDMutationMeta, ObjectType)):
                 ).format(repr(payload)))
             return payload
 
-        return Promise.resolve(
-            cls.mutate_and_get_payload(input, context, info)
-        ).then(on_resolve)
+        return maybe_thenable(
+            cls.mutate_and_get_payload(input, context, info),
+            on_resolve
+        )
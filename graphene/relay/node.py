@@ -4,8 +4,10 @@ import six
 
 from graphql_relay import from_global_id, to_global_id
 
-from ..types import ID, Field, Interface, ObjectType
+from ..dataloader import DataLoader, get_loader
+from ..types import ID, Field, Interface, List, NonNull, ObjectType
 from ..types.interface import InterfaceMeta
+from ..utils.thenables import maybe_thenable
 
 
 def is_node(objecttype):
@@ -42,7 +44,7 @@ class GlobalID(Field):
     @staticmethod
     def id_resolver(parent_resolver, node, root, args, context, info):
         id = parent_resolver(root, args, context, info)
-        return node.to_global_id(info.parent_type.name, id)  # root._meta.name
+        return maybe_thenable(id, partial(node.to_global_id, info.parent_type.name))  # root._meta.name
 
     def get_resolver(self, parent_resolver):
         return partial(self.id_resolver, parent_resolver, self.node)
@@ -70,6 +72,38 @@ class NodeField(Field):
         )
 
 
+class NodesField(Field):
+
+    def __init__(self, node, type=False, deprecation_reason=None,
+                 name=None, **kwargs):
+        assert issubclass(node, Node), 'NodesField can only operate in Nodes'
+        type = type or node
+        super(NodesField, self).__init__(
+            List(type),
+            description='The objects with the given IDs',
+            ids=NonNull(List(NonNull(ID))),
+            resolver=node.nodes_resolver
+        )
+
+
+class NodeLoader(DataLoader):
+    '''
+    Loads the nodes of a type in batches with its ``get_nodes``.
+
+    The loader is shared by all the fields loading nodes of the type in
+    an execution, so ``get_nodes`` receives the ``info`` of the first one.
+    '''
+
+    def __init__(self, graphene_type, context, info):
+        super(NodeLoader, self).__init__()
+        self.graphene_type = graphene_type
+        self.context = context
+        self.info = info
+
+    def batch_load_fn(self, ids):
+        return self.graphene_type.get_nodes(ids, self.context, self.info)
+
+
 class Node(six.with_metaclass(NodeMeta, Interface)):
     '''An object with an ID'''
 
@@ -77,10 +111,19 @@ class Node(six.with_metaclass(NodeMeta, Interface)):
     def Field(cls, *args, **kwargs):  # noqa: N802
         return NodeField(cls, *args, **kwargs)
 
+    @classmethod
+    def NodesField(cls, *args, **kwargs):  # noqa: N802
+        return NodesField(cls, *args, **kwargs)
+
     @classmethod
     def node_resolver(cls, root, args, context, info):
         return cls.get_node_from_global_id(args.get('id'), context, info)
 
+    @classmethod
+    def nodes_resolver(cls, root, args, context, info):
+        # The nodes of the types with get_nodes are loaded with one call per type
+        return [cls.get_node_from_global_id(global_id, context, info) for global_id in args.get('ids')]
+
     @classmethod
     def get_node_from_global_id(cls, global_id, context, info):
         try:
@@ -90,6 +133,10 @@ class Node(six.with_metaclass(NodeMeta, Interface)):
             assert cls in graphene_type._meta.interfaces
         except:
             return None
+        if getattr(graphene_type, 'get_nodes', None):
+            # The info is left out of the key, so the ids of every field
+            # are loaded together
+            return get_loader(NodeLoader, graphene_type, context=context, info=info).load(_id)
         get_node = getattr(graphene_type, 'get_node', None)
         if get_node:
             return get_node(_id, context, info)
@@ -0,0 +1,84 @@
+import pytest
+
+from ...types import ObjectType, Schema, String
+from ..connection import Connection, ConnectionField
+
+asyncio = pytest.importorskip('asyncio')
+if not hasattr(asyncio, 'ensure_future'):
+    pytest.skip('Async iterators need Python 3.5+', allow_module_level=True)
+
+from graphql.execution.executors.asyncio import AsyncioExecutor  # noqa: E402
+
+
+class Letter(ObjectType):
+    letter = String()
+
+
+class LetterConnection(Connection):
+
+    class Meta:
+        node = Letter
+
+
+class AsyncLetters(object):
+    '''
+    An async iterator, like the cursor of an async database driver.
+    '''
+
+    def __init__(self, letters):
+        self.letters = iter(letters)
+        self.consumed = 0
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        try:
+            letter = next(self.letters)
+        except StopIteration:
+            raise StopAsyncIteration  # noqa: F821
+        self.consumed += 1
+        return asyncio.sleep(0, result=Letter(letter=letter))
+
+
+class Query(ObjectType):
+    letters = ConnectionField(LetterConnection)
+
+    def resolve_letters(self, args, context, info):
+        return context['letters']
+
+
+schema = Schema(query=Query)
+
+
+def execute(args, letters):
+    loop = asyncio.new_event_loop()
+    try:
+        return schema.execute(
+            '{ letters(%s) { edges { node { letter } } pageInfo { hasPreviousPage hasNextPage } } }' % args,
+            context_value={'letters': letters},
+            executor=AsyncioExecutor(loop=loop)
+        )
+    finally:
+        loop.close()
+
+
+def test_async_iterator_is_consumed_until_the_end_of_the_page():
+    letters = AsyncLetters('ABCDE')
+    result = execute('first: 2', letters)
+    assert not result.errors
+    assert result.data == {'letters': {
+        'edges': [{'node': {'letter': 'A'}}, {'node': {'letter': 'B'}}],
+        'pageInfo': {'hasPreviousPage': False, 'hasNextPage': True},
+    }}
+    assert letters.consumed == 3
+
+
+def test_async_iterator_last_page():
+    letters = AsyncLetters('ABCDE')
+    result = execute('last: 2', letters)
+    assert not result.errors
+    assert result.data == {'letters': {
+        'edges': [{'node': {'letter': 'D'}}, {'node': {'letter': 'E'}}],
+        'pageInfo': {'hasPreviousPage': True, 'hasNextPage': False},
+    }}
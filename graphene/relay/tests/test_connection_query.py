@@ -18,8 +18,61 @@ class Letter(ObjectType):
     letter = String()
 
 
+class LazyLetters(object):
+    '''
+    A sliceable source that can only be counted with count(), like a queryset.
+    '''
+
+    def __init__(self, letters):
+        self.letters = letters
+        self.slices = []
+        self.counted = False
+
+    def __getitem__(self, index):
+        assert isinstance(index, slice) and index.step is None
+        self.slices.append((index.start, index.stop))
+        return self.letters[index]
+
+    def count(self):
+        self.counted = True
+        return len(self.letters)
+
+
+class SizedLetters(object):
+    '''
+    A sliceable source with a length but no count(), not registered as a Sequence.
+    '''
+
+    def __init__(self, letters):
+        self.letters = letters
+
+    def __getitem__(self, index):
+        return self.letters[index]
+
+    def __len__(self):
+        return len(self.letters)
+
+
+class StreamedLetters(object):
+    '''
+    A forward-only source, like a database cursor.
+    '''
+
+    def __init__(self, letters):
+        self.letters = letters
+        self.consumed = 0
+
+    def __iter__(self):
+        for letter in self.letters:
+            self.consumed += 1
+            yield letter
+
+
 class Query(ObjectType):
     letters = ConnectionField(Letter)
+    lazy_letters = ConnectionField(Letter)
+    sized_letters = ConnectionField(Letter)
+    streamed_letters = ConnectionField(Letter)
     connection_letters = ConnectionField(Letter)
     promise_letters = ConnectionField(Letter)
 
@@ -28,6 +81,15 @@ class Query(ObjectType):
     def resolve_letters(self, args, context, info):
         return list(letters.values())
 
+    def resolve_lazy_letters(self, args, context, info):
+        return context.setdefault('lazy_letters', LazyLetters(list(letters.values())))
+
+    def resolve_sized_letters(self, args, context, info):
+        return SizedLetters(list(letters.values()))
+
+    def resolve_streamed_letters(self, args, context, info):
+        return iter(context.setdefault('streamed_letters', StreamedLetters(list(letters.values()))))
+
     def resolve_promise_letters(self, args, context, info):
         return Promise.resolve(list(letters.values()))
 
@@ -72,13 +134,13 @@ def cursor_for(ltr):
     return base64('arrayconnection:%s' % l.id)
 
 
-def execute(args=''):
+def execute(args='', field='letters', context_value=None):
     if args:
         args = '(' + args + ')'
 
     return schema.execute('''
     {
-        letters%s {
+        %s%s {
             edges {
                 node {
                     id
@@ -94,11 +156,10 @@ def execute(args=''):
             }
         }
     }
-    ''' % args)
+    ''' % (field, args), context_value=context_value)
 
 
 def check(args, letters, has_previous_page=False, has_next_page=False):
-    result = execute(args)
     expected_edges = edges(letters)
     expected_page_info = {
         'hasPreviousPage': has_previous_page,
@@ -107,13 +168,16 @@ def check(args, letters, has_previous_page=False, has_next_page=False):
         'startCursor': expected_edges[0]['cursor'] if expected_edges else None
     }
 
-    assert not result.errors
-    assert result.data == {
-        'letters': {
-            'edges': expected_edges,
-            'pageInfo': expected_page_info
+    # Lazy and forward-only sources are paginated the same as lists
+    for field in ('letters', 'lazyLetters', 'sizedLetters', 'streamedLetters'):
+        result = execute(args, field, context_value={})
+        assert not result.errors
+        assert result.data == {
+            field: {
+                'edges': expected_edges,
+                'pageInfo': expected_page_info
+            }
         }
-    }
 
 
 def test_returns_all_elements_without_filters():
@@ -268,3 +332,43 @@ def test_connection_promise():
             }
         }
     }
+
+
+def test_lazy_source_is_only_sliced_for_the_page():
+    context = {}
+    result = execute('first: 2, after: "{}"'.format(cursor_for('A')), 'lazyLetters', context)
+    assert not result.errors
+    assert context['lazy_letters'].slices == [(1, 4)]
+    assert not context['lazy_letters'].counted
+
+
+def test_lazy_source_is_counted_for_the_last_page():
+    context = {}
+    result = execute('last: 2', 'lazyLetters', context)
+    assert not result.errors
+    assert context['lazy_letters'].slices == [(3, 5)]
+    assert context['lazy_letters'].counted
+
+
+def test_lazy_source_is_not_counted_before_a_cursor():
+    context = {}
+    result = execute('last: 2, before: "{}"'.format(cursor_for('D')), 'lazyLetters', context)
+    assert not result.errors
+    assert context['lazy_letters'].slices == [(1, 3)]
+    assert not context['lazy_letters'].counted
+
+
+def test_forward_only_source_is_consumed_until_the_end_of_the_page():
+    context = {}
+    result = execute('first: 2, after: "{}"'.format(cursor_for('A')), 'streamedLetters', context)
+    assert not result.errors
+    assert [edge['node']['letter'] for edge in result.data['streamedLetters']['edges']] == ['B', 'C']
+    assert context['streamed_letters'].consumed == 4
+
+
+def test_forward_only_source_is_consumed_until_the_before_cursor():
+    context = {}
+    result = execute('last: 1, before: "{}"'.format(cursor_for('C')), 'streamedLetters', context)
+    assert not result.errors
+    assert [edge['node']['letter'] for edge in result.data['streamedLetters']['edges']] == ['B']
+    assert context['streamed_letters'].consumed == 3
@@ -0,0 +1,312 @@
+import datetime
+from decimal import Decimal
+from functools import partial
+from itertools import islice
+from uuid import UUID
+
+import pytest
+from graphql_relay.connection.arrayconnection import offset_to_cursor
+
+from ...types import Int, ObjectType, Schema, String
+from ..connection import (Connection, ConnectionField, KeysetConnection,
+                          KeysetConnectionField, KeysetListSource,
+                          cursor_to_keys, keys_to_cursor, parse_sort_key,
+                          serialize_sort_key, utc)
+from ..node import Node
+
+
+class Letter(ObjectType):
+    letter = String()
+    rank = Int()
+
+
+class LetterConnection(KeysetConnection):
+
+    class Meta:
+        node = Letter
+        sort_keys = ('rank', 'letter')
+
+
+letters = [Letter(letter=letter, rank=i // 2) for i, letter in enumerate('ABCDE')]
+
+
+class RecordingSource(KeysetListSource):
+
+    def get_page(self, **kwargs):
+        self.pages.append(kwargs)
+        return super(RecordingSource, self).get_page(**kwargs)
+
+
+class Query(ObjectType):
+    letters = KeysetConnectionField(LetterConnection)
+    source_letters = KeysetConnectionField(LetterConnection)
+
+    def resolve_letters(self, args, context, info):
+        return letters
+
+    def resolve_source_letters(self, args, context, info):
+        source = RecordingSource(letters, LetterConnection.get_sort_keys)
+        source.pages = context['pages']
+        return source
+
+
+schema = Schema(query=Query)
+
+
+def cursor_for(letter):
+    letter = letters['ABCDE'.index(letter)]
+    return keys_to_cursor((letter.rank, letter.letter))
+
+
+def check(args, expected, has_previous_page=False, has_next_page=False):
+    for field in ('letters', 'sourceLetters'):
+        result = schema.execute('''
+            {
+                %s%s {
+                    edges { node { letter } cursor }
+                    pageInfo { hasPreviousPage hasNextPage startCursor endCursor }
+                }
+            }
+        ''' % (field, '({})'.format(args) if args else ''), context_value={'pages': []})
+        assert not result.errors
+        edges = [{'node': {'letter': letter}, 'cursor': cursor_for(letter)} for letter in expected]
+        assert result.data[field] == {
+            'edges': edges,
+            'pageInfo': {
+                'hasPreviousPage': has_previous_page,
+                'hasNextPage': has_next_page,
+                'startCursor': edges[0]['cursor'] if edges else None,
+                'endCursor': edges[-1]['cursor'] if edges else None,
+            }
+        }
+
+
+def test_cursor_encodes_the_sort_keys():
+    cursor = keys_to_cursor((1, 'C'))
+    assert cursor_to_keys(cursor) == (1, 'C')
+    assert cursor_to_keys('invalid') is None
+    assert cursor_to_keys(None) is None
+
+
+def test_returns_all_elements_without_filters():
+    check('', 'ABCDE')
+
+
+def test_respects_first():
+    check('first: 2', 'AB', has_next_page=True)
+
+
+def test_respects_an_overly_large_first():
+    check('first: 10', 'ABCDE')
+
+
+def test_respects_first_and_after():
+    check('first: 2, after: "{}"'.format(cursor_for('B')), 'CD', has_next_page=True)
+
+
+def test_respects_last():
+    check('last: 2', 'DE', has_previous_page=True)
+
+
+def test_respects_last_and_before():
+    check('last: 2, before: "{}"'.format(cursor_for('D')), 'BC', has_previous_page=True)
+
+
+def test_respects_first_after_and_before():
+    check('first: 4, after: "{}", before: "{}"'.format(cursor_for('A'), cursor_for('E')), 'BCD')
+
+
+def test_returns_no_elements_if_first_is_0():
+    check('first: 0', '', has_next_page=True)
+
+
+def test_returns_all_elements_if_cursors_are_invalid():
+    check('before: "invalid" after: "invalid"', 'ABCDE')
+
+
+def test_returns_no_elements_if_cursors_cross():
+    check('before: "{}" after: "{}"'.format(cursor_for('B'), cursor_for('D')), '')
+
+
+def test_source_receives_the_keys_of_the_cursors():
+    pages = []
+    result = schema.execute(
+        '{ sourceLetters(last: 1, before: "%s") { edges { node { letter } } } }' % cursor_for('C'),
+        context_value={'pages': pages}
+    )
+    assert not result.errors
+    assert pages == [{'after': None, 'before': (1, 'C'), 'limit': 2, 'reverse': True}]
+
+
+def test_keyset_connection_default_sort_keys():
+    class NodeLetter(ObjectType):
+
+        class Meta:
+            interfaces = (Node, )
+
+    class NodeLetterConnection(KeysetConnection):
+
+        class Meta:
+            node = NodeLetter
+
+    assert NodeLetterConnection._meta.sort_keys == ('id', )
+    assert NodeLetterConnection._meta.name == 'NodeLetterConnection'
+    assert NodeLetterConnection.get_sort_keys(NodeLetter(id=3)) == (3, )
+
+
+class Event(ObjectType):
+    name = String()
+    created = String()
+    day = Int()
+
+    def resolve_created(self, args, context, info):
+        return self.created.isoformat()
+
+
+class EventConnection(KeysetConnection):
+
+    class Meta:
+        node = Event
+        sort_keys = ('created', 'name')
+
+
+class DayEventConnection(KeysetConnection):
+
+    class Meta:
+        node = Event
+        sort_keys = ('day', )
+
+    @classmethod
+    def serialize_sort_key(cls, name, value):
+        return value.toordinal()
+
+    @classmethod
+    def parse_sort_key(cls, name, value):
+        return datetime.date.fromordinal(value)
+
+
+events = [
+    Event(name=str(i), created=datetime.datetime(2017, 1, 1, 12, 0, i), day=datetime.date(2017, 1, i + 1))
+    for i in range(4)
+]
+
+
+class EventsQuery(ObjectType):
+    events = KeysetConnectionField(EventConnection)
+    day_events = KeysetConnectionField(DayEventConnection)
+
+    def resolve_events(self, args, context, info):
+        return events
+
+    def resolve_day_events(self, args, context, info):
+        return events
+
+
+events_schema = Schema(query=EventsQuery)
+
+
+def test_sort_keys_json_cant_represent():
+    for value in (
+        datetime.datetime(2017, 1, 1, 12, 0, 0),
+        datetime.datetime(2017, 1, 1, 12, 0, 0, 5),
+        datetime.datetime(2017, 1, 1, 12, 0, 0, tzinfo=utc),
+        datetime.date(2017, 1, 1),
+        datetime.time(12, 30),
+        Decimal('1.50'),
+        UUID('12345678-1234-5678-1234-567812345678'),
+        'string',
+        1,
+    ):
+        key = parse_sort_key(serialize_sort_key(value))
+        assert key == value
+        assert type(key) == type(value)
+
+
+def test_keyset_connection_with_datetime_keys():
+    for field, connection_type in (('events', EventConnection), ('dayEvents', DayEventConnection)):
+        result = events_schema.execute('{ %s(first: 1, after: "%s") { edges { node { name } cursor } } }' % (
+            field, connection_type.get_cursor(events[1])
+        ))
+        assert not result.errors
+        assert result.data[field]['edges'] == [
+            {'node': {'name': '2'}, 'cursor': connection_type.get_cursor(events[2])}
+        ]
+    assert EventConnection.get_cursor_keys(EventConnection.get_cursor(events[1])) == (
+        datetime.datetime(2017, 1, 1, 12, 0, 1), '1'
+    )
+    assert EventConnection.get_cursor_keys(keys_to_cursor(({'date': 'invalid'}, '1'))) is None
+    assert EventConnection.get_cursor_keys(keys_to_cursor(('1', ))) is None
+
+
+def test_keyset_connection_field_needs_a_keyset_connection():
+    field = KeysetConnectionField(Letter)
+    with pytest.raises(AssertionError):
+        field.type
+
+
+class Row(ObjectType):
+    id = Int()
+
+
+class RowConnection(KeysetConnection):
+
+    class Meta:
+        node = Row
+
+
+class OffsetRowConnection(Connection):
+
+    class Meta:
+        node = Row
+
+
+class ScanningRows(object):
+    '''
+    A source that skips the rows before an offset one by one,
+    like the OFFSET of a database does.
+    '''
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __getitem__(self, index):
+        return list(islice(iter(self.rows), index.start, index.stop))
+
+    def count(self):
+        return len(self.rows)
+
+
+rows = [Row(id=i) for i in range(100000)]
+row_source = KeysetListSource(rows, RowConnection.get_sort_keys)
+
+
+class RowsQuery(ObjectType):
+    rows = ConnectionField(OffsetRowConnection)
+    keyset_rows = KeysetConnectionField(RowConnection)
+
+    def resolve_rows(self, args, context, info):
+        return ScanningRows(rows)
+
+    def resolve_keyset_rows(self, args, context, info):
+        return row_source
+
+
+rows_schema = Schema(query=RowsQuery)
+
+
+def get_deep_page(field, cursor):
+    result = rows_schema.execute(
+        '{ %s(first: 10, after: "%s") { edges { node { id } } } }' % (field, cursor)
+    )
+    assert not result.errors
+    assert result.data[field]['edges'][0] == {'node': {'id': 90001}}
+
+
+@pytest.mark.benchmark(group='deep_page')
+def test_deep_page_connection_benchmark(benchmark):
+    benchmark(partial(get_deep_page, 'rows', offset_to_cursor(90000)))
+
+
+@pytest.mark.benchmark(group='deep_page')
+def test_deep_page_keyset_connection_benchmark(benchmark):
+    benchmark(partial(get_deep_page, 'keysetRows', keys_to_cursor((90000, ))))
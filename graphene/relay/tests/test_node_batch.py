@@ -0,0 +1,125 @@
+from graphql_relay import to_global_id
+
+from ...types import ObjectType, Schema, String
+from ..node import Node
+
+fetched = []
+
+photos = {'1': 'Photo 1', '2': 'Photo 2', '3': 'Photo 3'}
+
+
+class Photo(ObjectType):
+
+    class Meta:
+        interfaces = (Node, )
+
+    title = String()
+
+    @classmethod
+    def get_nodes(cls, ids, context, info):
+        fetched.append(('Photo', list(ids)))
+        return [Photo(id=id, title=photos[id]) if id in photos else None for id in ids]
+
+
+class User(ObjectType):
+
+    class Meta:
+        interfaces = (Node, )
+
+    name = String()
+
+    @classmethod
+    def get_nodes(cls, ids, context, info):
+        fetched.append(('User', list(ids)))
+        return [User(id=id, name='User {}'.format(id)) for id in ids]
+
+
+class Comment(ObjectType):
+
+    class Meta:
+        interfaces = (Node, )
+
+    text = String()
+
+    @classmethod
+    def get_node(cls, id, context, info):
+        fetched.append(('Comment', id))
+        return Comment(id=id, text='Comment {}'.format(id))
+
+
+class RootQuery(ObjectType):
+    node = Node.Field()
+    nodes = Node.NodesField()
+
+
+schema = Schema(query=RootQuery, types=[Photo, User, Comment])
+
+fragments = '''
+    fragment Fields on Node {
+        id
+        ... on Photo { title }
+        ... on User { name }
+        ... on Comment { text }
+    }
+'''
+
+
+def setup_function(function):
+    del fetched[:]
+
+
+def test_nodes_query_groups_the_ids_by_type():
+    ids = [
+        to_global_id('Photo', 2),
+        to_global_id('User', 1),
+        to_global_id('Photo', 4),
+        to_global_id('Comment', 7),
+        'invalid',
+        to_global_id('Photo', 1),
+        to_global_id('User', 1),
+    ]
+    executed = schema.execute(
+        'query ($ids: [ID!]!) { nodes(ids: $ids) { ...Fields } }' + fragments,
+        variable_values={'ids': ids}
+    )
+    assert not executed.errors
+    assert executed.data == {'nodes': [
+        {'id': ids[0], 'title': 'Photo 2'},
+        {'id': ids[1], 'name': 'User 1'},
+        None,
+        {'id': ids[3], 'text': 'Comment 7'},
+        None,
+        {'id': ids[5], 'title': 'Photo 1'},
+        {'id': ids[1], 'name': 'User 1'},
+    ]}
+    assert fetched == [('Comment', '7'), ('Photo', ['2', '4', '1']), ('User', ['1'])]
+
+
+def test_aliased_node_fields_are_loaded_together():
+    executed = schema.execute('''
+        {
+            a: node(id: "%s") { ...Fields }
+            b: node(id: "%s") { ...Fields }
+            c: node(id: "%s") { ...Fields }
+        }
+    ''' % (to_global_id('Photo', 1), to_global_id('User', 3), to_global_id('Photo', 3)) + fragments)
+    assert not executed.errors
+    assert executed.data['a']['title'] == 'Photo 1'
+    assert executed.data['b']['name'] == 'User 3'
+    assert executed.data['c']['title'] == 'Photo 3'
+    assert fetched == [('Photo', ['1', '3']), ('User', ['3'])]
+
+
+def test_get_node_from_global_id_outside_of_an_execution():
+    class Info(object):
+        pass
+
+    info = Info()
+    info.schema = schema
+    promise = Node.get_node_from_global_id(to_global_id('Photo', 2), None, info)
+    assert promise.get().title == 'Photo 2'
+    assert fetched == [('Photo', ['2'])]
+
+
+def test_str_schema_nodes_field():
+    assert '  nodes(ids: [ID!]!): [Node]\n' in str(schema)
@@ -0,0 +1,74 @@
+import pytest
+
+from ...types import ObjectType, Schema, String
+from ..connection import ConnectionField
+from ..mutation import ClientIDMutation
+from ..node import Node
+
+asyncio = pytest.importorskip('asyncio')
+if not hasattr(asyncio, 'ensure_future'):
+    pytest.skip('Awaitables need Python 3.5+', allow_module_level=True)
+
+
+class Letter(ObjectType):
+
+    class Meta:
+        interfaces = (Node, )
+
+    letter = String()
+
+    def resolve_id(self, args, context, info):
+        return asyncio.sleep(0, result=self.letter)
+
+
+class AddLetter(ClientIDMutation):
+
+    class Input:
+        letter = String()
+
+    letter = String()
+
+    @staticmethod
+    def mutate_and_get_payload(args, context, info):
+        return asyncio.sleep(0, result=AddLetter(letter=args.get('letter')))
+
+
+class Query(ObjectType):
+    letters = ConnectionField(Letter)
+
+    def resolve_letters(self, args, context, info):
+        return asyncio.sleep(0, result=[Letter(letter=letter) for letter in 'ABC'])
+
+
+class Mutation(ObjectType):
+    add_letter = AddLetter.Field()
+
+
+schema = Schema(query=Query, mutation=Mutation)
+
+
+def execute(query):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(schema.execute_async(query, loop=loop))
+    finally:
+        loop.close()
+
+
+def test_connection_field_resolves_awaitables():
+    result = execute('{ letters(first: 2) { edges { node { id letter } } pageInfo { hasNextPage } } }')
+    assert not result.errors
+    assert result.data == {'letters': {
+        'edges': [
+            {'node': {'id': 'TGV0dGVyOkE=', 'letter': 'A'}},
+            {'node': {'id': 'TGV0dGVyOkI=', 'letter': 'B'}},
+        ],
+        'pageInfo': {'hasNextPage': True},
+    }}
+
+
+def test_mutation_resolves_awaitables():
+    result = execute('mutation { addLetter(input: {letter: "D", clientMutationId: "1"}) '
+                     '{ letter clientMutationId } }')
+    assert not result.errors
+    assert result.data == {'addLetter': {'letter': 'D', 'clientMutationId': '1'}}
@@ -0,0 +1,167 @@
+from promise import Promise
+
+from ..dataloader import DataLoader, get_loader
+from ..relay import Node
+from ..types import Field, Int, List, ObjectType, Schema, String
+from ..utils.lru_cache import LRUCache
+
+loaded = []
+
+
+def load_users(keys):
+    loaded.append(list(keys))
+    return [User(id=key, name='User {}'.format(key)) if key > 0 else ValueError('No user')
+            for key in keys]
+
+
+class UserLoader(DataLoader):
+    max_batch_size = 3
+
+    def batch_load_fn(self, keys):
+        return Promise.resolve(load_users(keys))
+
+
+class User(ObjectType):
+
+    class Meta:
+        interfaces = (Node, )
+
+    name = String()
+    best_friend = Field(lambda: User)
+    friends = List(lambda: User)
+
+    def resolve_best_friend(self, args, context, info):
+        return get_loader(load_users).load(self.id + 1)
+
+    def resolve_friends(self, args, context, info):
+        return get_loader(load_users).load_many([self.id + 1, self.id + 2])
+
+    @classmethod
+    def get_node(cls, id, context, info):
+        return get_loader(UserLoader).load(int(id))
+
+
+class Query(ObjectType):
+    node = Node.Field()
+    users = List(User, ids=List(Int))
+
+    def resolve_users(self, args, context, info):
+        return get_loader(load_users).load_many(args['ids'])
+
+
+schema = Schema(query=Query, types=[User])
+
+
+def setup_function(function):
+    del loaded[:]
+
+
+def test_dataloader_load():
+    loader = DataLoader(load_users)
+    user = loader.load(1).get()
+    assert user.name == 'User 1'
+    assert loaded == [[1]]
+    # The values are cached
+    assert loader.load(1).get() is user
+    assert loaded == [[1]]
+
+
+def test_dataloader_load_many():
+    loader = DataLoader(load_users, max_batch_size=2)
+    users = loader.load_many([1, 2, 3, 2]).get()
+    assert [user.name for user in users] == ['User 1', 'User 2', 'User 3', 'User 2']
+    assert loaded == [[1, 2], [3]]
+
+
+def test_dataloader_without_cache():
+    loader = DataLoader(load_users, cache=False)
+    loader.load_many([1, 1]).get()
+    loader.load(1).get()
+    assert loaded == [[1, 1], [1]]
+
+
+def test_dataloader_without_batch():
+    loader = DataLoader(load_users, batch=False)
+    loader.load_many([1, 2]).get()
+    assert loaded == [[1], [2]]
+
+
+def test_dataloader_errors_are_not_cached():
+    loader = DataLoader(load_users)
+    assert loader.load(0).is_rejected
+    assert loader.load(0).is_rejected
+    assert loaded == [[0], [0]]
+
+
+def test_dataloader_wrong_number_of_values():
+    loader = DataLoader(lambda keys: keys[1:])
+    promise = loader.load_many([1, 2])
+    assert promise.is_rejected
+    assert str(promise.reason) == (
+        'DataLoader must be constructed with a function which accepts a list of keys '
+        'and returns a list of values of the same length, received 1 values for 2 keys.'
+    )
+
+
+def test_dataloader_prime_and_clear():
+    loader = DataLoader(load_users)
+    loader.prime(1, 'primed')
+    assert loader.load(1).get() == 'primed'
+    loader.clear(1)
+    assert loader.load(1).get().name == 'User 1'
+    loader.clear_all()
+    loader.load(1).get()
+    assert loaded == [[1], [1]]
+
+
+def test_dataloader_cache_map():
+    cache_map = LRUCache(max_entries=1)
+    loader = DataLoader(load_users, cache_map=cache_map)
+    loader.load(1).get()
+    loader.load(2).get()
+    loader.load(1).get()
+    assert loaded == [[1], [2], [1]]
+    assert len(cache_map) == 1
+
+
+def test_dataloader_coalesces_the_loads_of_an_execution():
+    result = schema.execute('{ users(ids: [1, 2]) { name bestFriend { name friends { name } } } }')
+    assert not result.errors
+    assert result.data['users'][1] == {
+        'name': 'User 2',
+        'bestFriend': {
+            'name': 'User 3',
+            'friends': [{'name': 'User 4'}, {'name': 'User 5'}],
+        },
+    }
+    # The loader of the execution caches the users already loaded
+    assert loaded == [[1, 2], [3, 4], [5]]
+
+
+def test_dataloader_cache_lasts_for_an_execution():
+    schema.execute('{ users(ids: [1]) { name } }')
+    schema.execute('{ users(ids: [1]) { name } }')
+    assert loaded == [[1], [1]]
+
+
+def test_dataloader_nodes():
+    query = '''
+        {
+            a: node(id: "VXNlcjox") { ... on User { name } }
+            b: node(id: "VXNlcjoy") { ... on User { name } }
+            c: node(id: "VXNlcjoz") { ... on User { name } }
+            d: node(id: "VXNlcjo0") { ... on User { name } }
+            e: node(id: "VXNlcjow") { ... on User { name } }
+        }
+    '''
+    result = schema.execute(query)
+    assert result.data == {
+        'a': {'name': 'User 1'},
+        'b': {'name': 'User 2'},
+        'c': {'name': 'User 3'},
+        'd': {'name': 'User 4'},
+        'e': None,
+    }
+    assert [str(error) for error in result.errors] == ['No user']
+    # The batches have up to max_batch_size keys
+    assert loaded == [[1, 2, 3], [4, 0]]
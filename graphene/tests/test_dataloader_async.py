@@ -0,0 +1,74 @@
+import types
+
+import pytest
+
+from ..dataloader import get_loader
+from ..types import Int, List, ObjectType, Schema, String
+
+asyncio = pytest.importorskip('asyncio')
+if not hasattr(asyncio, 'ensure_future'):
+    pytest.skip('Awaitables need Python 3.5+', allow_module_level=True)
+
+loaded = []
+
+
+def load_names(keys):
+    loaded.append(list(keys))
+    return ['Item {}'.format(key) for key in keys]
+
+
+@types.coroutine
+def load_name(key):
+    # Like an async def resolver awaiting something before the loader
+    for signal in asyncio.sleep(0).__await__():
+        yield signal
+    promise = get_loader(load_names).load(key)
+    for signal in promise.__await__():
+        yield signal
+    return promise.get()
+
+
+class Item(ObjectType):
+    id = Int()
+    name = String()
+
+    def resolve_name(self, args, context, info):
+        return load_name(self.id)
+
+
+class Query(ObjectType):
+    items = List(Item)
+
+    def resolve_items(self, args, context, info):
+        return [Item(id=i) for i in range(3)]
+
+
+schema = Schema(query=Query)
+
+
+@pytest.fixture
+def loop():
+    del loaded[:]
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    asyncio.set_event_loop(None)
+    loop.close()
+
+
+def test_coroutines_share_the_loaders_of_their_execution(loop):
+    result = loop.run_until_complete(schema.execute_async('{ items { name } }', loop=loop))
+    assert not result.errors
+    assert result.data == {'items': [{'name': 'Item 0'}, {'name': 'Item 1'}, {'name': 'Item 2'}]}
+    assert loaded == [[0, 1, 2]]
+
+
+def test_concurrent_executions_dont_share_their_loaders(loop):
+    results = loop.run_until_complete(asyncio.gather(
+        schema.execute_async('{ items { name } }', loop=loop),
+        schema.execute_async('{ items { name } }', loop=loop),
+    ))
+    assert [result.data for result in results] == [
+        {'items': [{'name': 'Item 0'}, {'name': 'Item 1'}, {'name': 'Item 2'}]}
+    ] * 2
+    assert loaded == [[0, 1, 2], [0, 1, 2]]
@@ -1,4 +1,4 @@
-from graphql import (GraphQLEnumType, GraphQLInputObjectType,
+from graphql import (GraphQLEnumType, GraphQLField, GraphQLInputObjectType,
                      GraphQLInterfaceType, GraphQLObjectType,
                      GraphQLScalarType, GraphQLUnionType)
 
@@ -36,3 +36,18 @@ class GrapheneEnumType(GrapheneGraphQLType, GraphQLEnumType):
 
 class GrapheneInputObjectType(GrapheneGraphQLType, GraphQLInputObjectType):
     pass
+
+
+class GrapheneGraphQLField(GraphQLField):
+    '''
+    A GraphQLField carrying the cache and cost hints of the graphene Field
+    '''
+
+    __slots__ = 'max_age', 'cache_scope', 'cost', 'multipliers'
+
+    def __init__(self, *args, **kwargs):
+        self.max_age = kwargs.pop('max_age', None)
+        self.cache_scope = kwargs.pop('cache_scope', None)
+        self.cost = kwargs.pop('cost', None)
+        self.multipliers = kwargs.pop('multipliers', ())
+        super(GrapheneGraphQLField, self).__init__(*args, **kwargs)
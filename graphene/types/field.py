@@ -2,6 +2,10 @@ import inspect
 from collections import Mapping, OrderedDict
 from functools import partial
 
+from ..execution.batching import BatchResolver
+from ..execution.cache import CachedResolver
+from ..execution.cache_control import CACHE_SCOPES
+from ..execution.offload import OffloadResolver
 from ..utils.orderedtype import OrderedType
 from .argument import Argument, to_arguments
 from .structures import NonNull
@@ -23,7 +27,8 @@ class Field(OrderedType):
     def __init__(self, type, args=None, resolver=None, source=None,
                  deprecation_reason=None, name=None, description=None,
                  required=False, _creation_counter=None, default_value=None,
-                 **extra_args):
+                 batch=False, offload=None, project=None, cache=None, max_age=None,
+                 cache_scope=None, cost=None, multipliers=None, **extra_args):
         super(Field, self).__init__(_creation_counter=_creation_counter)
         assert not args or isinstance(args, Mapping), (
             'Arguments in a field have to be a mapping, received "{}".'
@@ -48,6 +53,55 @@ class Field(OrderedType):
             extra_args['source'] = source
             source = None
 
+        # Check if batch is actually an argument of the field
+        if isinstance(batch, (Argument, UnmountedType)):
+            extra_args['batch'] = batch
+            batch = False
+        assert not (source and batch), (
+            'A Field cannot have a source and be batched at the same time.'
+        )
+
+        # Check if cost and multipliers are actually arguments of the field
+        if isinstance(cost, (Argument, UnmountedType)):
+            extra_args['cost'] = cost
+            cost = None
+        if isinstance(multipliers, (Argument, UnmountedType)):
+            extra_args['multipliers'] = multipliers
+            multipliers = None
+
+        # Check if max_age and cache_scope are actually arguments of the field
+        if isinstance(max_age, (Argument, UnmountedType)):
+            extra_args['max_age'] = max_age
+            max_age = None
+        if isinstance(cache_scope, (Argument, UnmountedType)):
+            extra_args['cache_scope'] = cache_scope
+            cache_scope = None
+        assert cache_scope is None or cache_scope in CACHE_SCOPES, (
+            'The cache scope has to be one of {}, received "{}".'
+        ).format(', '.join(CACHE_SCOPES), cache_scope)
+
+        # Check if cache is actually an argument of the field
+        if isinstance(cache, (Argument, UnmountedType)):
+            extra_args['cache'] = cache
+            cache = None
+        assert not (cache and batch), (
+            'A Field cannot be cached and batched at the same time.'
+        )
+
+        # Check if offload and project are actually arguments of the field
+        if isinstance(offload, (Argument, UnmountedType)):
+            extra_args['offload'] = offload
+            offload = None
+        if isinstance(project, (Argument, UnmountedType)):
+            extra_args['project'] = project
+            project = None
+        assert not (offload and batch), (
+            'A Field cannot be offloaded and batched at the same time.'
+        )
+        assert not (project and not offload), (
+            'A Field can only project its root when it is offloaded.'
+        )
+
         self.name = name
         self._type = type
         self.args = to_arguments(args or OrderedDict(), extra_args)
@@ -57,6 +111,14 @@ class Field(OrderedType):
         self.deprecation_reason = deprecation_reason
         self.description = description
         self.default_value = default_value
+        self.batch = batch
+        self.offload = offload
+        self.project = project
+        self.cache = cache
+        self.max_age = max_age
+        self.cache_scope = cache_scope
+        self.cost = cost
+        self.multipliers = tuple(multipliers or ())
 
     @property
     def type(self):
@@ -65,4 +127,13 @@ class Field(OrderedType):
         return self._type
 
     def get_resolver(self, parent_resolver):
-        return self.resolver or parent_resolver
+        resolver = self.resolver or parent_resolver
+        if self.batch and not isinstance(resolver, BatchResolver):
+            # The resolver receives the list of roots instead of one
+            return BatchResolver(resolver)
+        if self.offload and not isinstance(resolver, OffloadResolver):
+            # The resolver is called in another process
+            resolver = OffloadResolver(resolver, self.offload, self.project)
+        if self.cache and not isinstance(resolver, CachedResolver):
+            resolver = CachedResolver(resolver, self.cache)
+        return resolver
@@ -20,6 +20,8 @@ class InterfaceMeta(AbstractTypeMeta):
             name=name,
             description=attrs.get('__doc__'),
             local_fields=None,
+            max_age=None,
+            cache_scope=None,
         )
 
         options.base_fields = get_base_fields(bases, _as=Field)
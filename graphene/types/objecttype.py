@@ -25,6 +25,9 @@ class ObjectTypeMeta(AbstractTypeMeta):
             description=attrs.get('__doc__'),
             interfaces=(),
             local_fields=OrderedDict(),
+            default_resolver=None,
+            max_age=None,
+            cache_scope=None,
         )
         options.base_fields = get_base_fields(bases, _as=Field)
 
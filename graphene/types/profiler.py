@@ -0,0 +1,173 @@
+import argparse
+import sys
+import time
+from functools import wraps
+from importlib import import_module
+from threading import local
+
+try:
+    import tracemalloc
+except ImportError:  # pragma: no cover
+    # Tracing the allocations needs Python 3.4+
+    tracemalloc = None
+
+# The most precise clock available (perf_counter needs Python 3.3+)
+timer = getattr(time, 'perf_counter', time.time)
+
+_state = local()
+
+PROFILED_METHODS = ('graphene_reducer', 'construct_objecttype', 'construct_fields_for_type')
+
+
+def get_build_profiler():
+    '''
+    Returns the profiler recording the schemas built in this thread,
+    if any.
+    '''
+    return getattr(_state, 'profiler', None)
+
+
+class BuildProfiler(object):
+    '''
+    Records the time spent (and memory allocated, with ``trace_memory``)
+    building each graphene type of the schemas built while it is active:
+
+        with BuildProfiler() as profiler:
+            schema = Schema(query=Query)
+        print(profiler.report())
+
+    The cost of a type doesn't include the one of the types it refers to,
+    which are built meanwhile. Outside of a profiler the typemaps are not
+    instrumented at all.
+    '''
+
+    def __init__(self, trace_memory=True):
+        self.trace_memory = trace_memory and tracemalloc is not None
+        self.started_tracing = False
+        self.stats = {}
+        self.stack = []
+        self.total_time = 0
+        self.total_memory = 0
+        self.previous = None
+
+    def __enter__(self):
+        self.previous = get_build_profiler()
+        _state.profiler = self
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _state.profiler = self.previous
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+
+    def get_memory(self):
+        if not self.trace_memory:
+            return 0
+        return tracemalloc.get_traced_memory()[0]
+
+    def instrument(self, typemap):
+        for name in PROFILED_METHODS:
+            setattr(typemap, name, self.wrap(getattr(typemap, name)))
+
+    def wrap(self, method):
+        @wraps(method)
+        def profiled(map, type, *args, **kwargs):
+            meta = getattr(type, '_meta', None)
+            if meta is None:
+                # Lists and non nulls, reduced to the type they wrap
+                return method(map, type, *args, **kwargs)
+            frame = [0, 0]
+            self.stack.append(frame)
+            start, start_memory = timer(), self.get_memory()
+            try:
+                return method(map, type, *args, **kwargs)
+            finally:
+                spent, allocated = timer() - start, self.get_memory() - start_memory
+                self.stack.pop()
+                self.add(meta.name, spent - frame[0], allocated - frame[1])
+                if self.stack:
+                    # The parent types don't count the time spent here
+                    self.stack[-1][0] += spent
+                    self.stack[-1][1] += allocated
+                else:
+                    self.total_time += spent
+                    self.total_memory += allocated
+        return profiled
+
+    def add(self, name, spent, allocated):
+        stats = self.stats.get(name)
+        if stats is None:
+            stats = self.stats[name] = [0, 0]
+        stats[0] += spent
+        stats[1] += allocated
+
+    def get_slowest(self, limit=None):
+        '''
+        Returns the name, time and memory of the types that took the
+        longest to build.
+        '''
+        slowest = sorted(
+            ((name, spent, allocated) for name, (spent, allocated) in self.stats.items()),
+            key=lambda stats: stats[1],
+            reverse=True
+        )
+        return slowest[:limit] if limit else slowest
+
+    def report(self, limit=20):
+        lines = ['Built {} types in {:.3f}s{}'.format(
+            len(self.stats),
+            self.total_time,
+            ', allocating {:.1f} KiB'.format(self.total_memory / 1024.) if self.trace_memory else ''
+        ), '']
+        lines.append('{:<40} {:>12} {:>14}'.format('Type', 'Time (ms)', 'Memory (KiB)'))
+        for name, spent, allocated in self.get_slowest(limit):
+            lines.append('{:<40} {:>12.3f} {:>14}'.format(
+                name,
+                spent * 1000,
+                '{:.1f}'.format(allocated / 1024.) if self.trace_memory else '-'
+            ))
+        return '\n'.join(lines)
+
+
+def import_string(path):
+    '''
+    Imports the object at the given path, like ``myapp.schema:schema``
+    or ``myapp.schema.schema``.
+    '''
+    if ':' in path:
+        module_name, name = path.split(':', 1)
+    else:
+        module_name, _, name = path.rpartition('.')
+    return getattr(import_module(module_name), name)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Prints the types of a graphene schema that take the longest to build.'
+    )
+    parser.add_argument('schema', help='import path of the schema, like myapp.schema:schema')
+    parser.add_argument('--limit', type=int, default=20, help='number of types to print')
+    parser.add_argument('--no-memory', action='store_true', help="don't trace the memory allocated")
+    options = parser.parse_args(argv)
+
+    if '' not in sys.path:
+        # Like python -m, the schema can be imported from the current directory
+        sys.path.insert(0, '')
+    start = timer()
+    schema = import_string(options.schema)
+    print('Imported {} in {:.3f}s'.format(options.schema, timer() - start))
+
+    with BuildProfiler(trace_memory=not options.no_memory) as profiler:
+        schema.build_typemap()
+    print(profiler.report(options.limit))
+
+
+if __name__ == '__main__':
+    # Run as a script this module is not the one the typemaps look
+    # the profiler up in
+    from graphene.types import profiler
+    profiler.main()
@@ -0,0 +1,47 @@
+from functools import partial
+
+
+def attr_resolver(attname, default_value, root, args, context, info):
+    return getattr(root, attname, default_value)
+
+
+def dict_resolver(attname, default_value, root, args, context, info):
+    return root.get(attname, default_value)
+
+
+class AttributeResolver(partial):
+    '''
+    Default resolver for the fields without a ``resolve_*`` method,
+    returning the attribute of the same name of the root object.
+
+    It calls the plain resolver function directly, and as it can be
+    recognized, compiled queries read the attribute without any call.
+    '''
+
+    __slots__ = ()
+    resolver = staticmethod(attr_resolver)
+
+    def __new__(cls, attname, default_value=None):
+        return super(AttributeResolver, cls).__new__(cls, cls.resolver, attname, default_value)
+
+    @property
+    def attname(self):
+        return self.args[0]
+
+    @property
+    def default_value(self):
+        return self.args[1]
+
+
+class DictResolver(AttributeResolver):
+    '''
+    Default resolver returning the key of the same name as the field
+    when the root objects are dicts.
+
+    >>> class MyObjectType(ObjectType):
+    >>>     class Meta:
+    >>>         default_resolver = DictResolver
+    '''
+
+    __slots__ = ()
+    resolver = staticmethod(dict_resolver)
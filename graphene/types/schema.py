@@ -1,11 +1,27 @@
 
-from graphql import GraphQLSchema, graphql, is_type
+import gc
+import warnings
+
+from graphql import GraphQLError, GraphQLSchema, is_type, validate
+from graphql.execution import execute
+from graphql.execution.middleware import MiddlewareManager
+from graphql.language.ast import Document
 from graphql.type.directives import (GraphQLDirective, GraphQLIncludeDirective,
                                      GraphQLSkipDirective)
 from graphql.type.introspection import IntrospectionSchema
 from graphql.utils.introspection_query import introspection_query
 from graphql.utils.schema_printer import print_schema
+from graphql.validation.rules import specified_rules
 
+from ..execution.cache_control import CacheControl
+from ..execution.compiler import CompiledQuery
+from ..execution.cost import CostAnalysis
+from ..execution.document_cache import DocumentCache, parse_and_validate
+from ..execution.persisted import PersistedQueryRegistry
+from ..execution.result import ExecutionResult
+from ..execution.scope import ExecutionScope
+from ..utils.thenables import maybe_thenable, result_to_future
+from .snapshot import load_type_map, save_type_map
 from .typemap import TypeMap, is_graphene_type
 
 
@@ -15,10 +31,36 @@ class Schema(GraphQLSchema):
 
     A Schema is created by supplying the root types of each type of operation,
     query and mutation (optional).
+
+    The parsed and validated documents of the last ``document_cache_size``
+    executed queries (up to ``document_cache_max_bytes`` of query text) are
+    kept in ``schema.document_cache``, so repeated queries are not parsed
+    again. Setting ``document_cache_size`` to 0 disables the cache.
+
+    Queries registered in ``schema.persisted_queries`` can be executed by
+    their sha256 hash with ``execute_persisted``.
+
+    The queries are executed with the given ``executor`` unless another
+    one is passed to ``execute``, like a ``ThreadPoolExecutor`` to resolve
+    the blocking resolvers of sibling fields in parallel.
+
+    With ``cache_control``, the cache hints of the queries (computed from
+    the ``max_age`` and ``cache_scope`` of their fields and types, or
+    ``default_max_age``) are returned in the ``extensions`` of the results.
+
+    The queries whose cost (see ``CostAnalysis``) is above ``max_cost``
+    are rejected before executing them.
+
+    The queries are validated with the given ``validation_rules`` (like
+    ``query_limits``) besides the ones of the specification.
     '''
 
     def __init__(self, query=None, mutation=None, subscription=None,
-                 directives=None, types=None, auto_camelcase=True):
+                 directives=None, types=None, auto_camelcase=True,
+                 document_cache_size=1000, document_cache_max_bytes=None, executor=None,
+                 cache_control=False, default_max_age=0, max_cost=None, default_multiplier=1,
+                 validation_rules=None, middleware=None, snapshot=None,
+                 lazy=False, freeze=False):
         self._query = query
         self._mutation = mutation
         self._subscription = subscription
@@ -35,7 +77,28 @@ class Schema(GraphQLSchema):
                 directives
         )
         self._directives = directives
+        self.document_cache = None
+        if document_cache_size:
+            self.document_cache = DocumentCache(
+                max_entries=document_cache_size,
+                max_bytes=document_cache_max_bytes
+            )
+        self.persisted_queries = PersistedQueryRegistry(self)
+        self.executor = executor
+        self.cache_control = None
+        if cache_control:
+            self.cache_control = CacheControl(self, default_max_age)
+        self.cost_analysis = CostAnalysis(self, max_cost, default_multiplier=default_multiplier)
+        self.validation_rules = specified_rules + list(validation_rules or [])
+        self.middleware = list(middleware or [])
+        # Keeps the middleware chains of the resolvers between executions
+        self.middleware_manager = MiddlewareManager(*self.middleware) if self.middleware else None
+        self.snapshot = snapshot
+        self.lazy_fields = lazy
+        self.frozen = False
         self.build_typemap()
+        if freeze:
+            self.freeze()
 
     def get_query_type(self):
         return self.get_graphql_type(self._query)
@@ -58,11 +121,123 @@ class Schema(GraphQLSchema):
             return graphql_type
         raise Exception("{} is not a valid GraphQL type.".format(_type))
 
-    def execute(self, *args, **kwargs):
-        return graphql(self, *args, **kwargs)
+    def execute(self, request_string='', root_value=None, context_value=None,
+                variable_values=None, operation_name=None, executor=None,
+                return_promise=False, middleware=None):
+        try:
+            document_ast, errors = self.get_document(request_string)
+        except Exception as e:
+            return ExecutionResult(errors=[e], invalid=True)
+        if errors:
+            return ExecutionResult(errors=errors, invalid=True)
+        return self._execute(
+            document_ast, root_value, context_value, variable_values,
+            operation_name, executor, return_promise, middleware
+        )
+
+    def execute_async(self, request_string='', root_value=None, context_value=None,
+                      variable_values=None, operation_name=None, middleware=None, loop=None):
+        '''
+        Executes the query in an asyncio loop (the current one by default),
+        returning a future of the result.
+
+        The resolvers can return awaitables, that run concurrently in the
+        loop with the ones of the sibling fields and list items.
+        '''
+        assert result_to_future, 'Executing queries asynchronously requires Python 3.5+.'
+        from graphql.execution.executors.asyncio import AsyncioExecutor
+        executor = AsyncioExecutor(loop=loop)
+        result = self.execute(
+            request_string, root_value, context_value, variable_values, operation_name,
+            executor=executor, return_promise=True, middleware=middleware
+        )
+        return result_to_future(result, executor.loop)
+
+    def execute_persisted(self, query_hash, variable_values=None, root_value=None,
+                          context_value=None, operation_name=None, executor=None,
+                          return_promise=False, middleware=None):
+        '''
+        Executes the persisted query registered with the given hash,
+        without parsing or validating it again.
+        '''
+        document_ast = self.persisted_queries.get(query_hash)
+        if document_ast is None:
+            return ExecutionResult(
+                errors=[GraphQLError('Persisted query "{}" not found.'.format(query_hash))],
+                invalid=True
+            )
+        return self._execute(
+            document_ast, root_value, context_value, variable_values,
+            operation_name, executor, return_promise, middleware
+        )
+
+    def _execute(self, document_ast, root_value, context_value, variable_values,
+                 operation_name, executor, return_promise, middleware):
+        errors = self.cost_analysis.check(document_ast, operation_name, variable_values)
+        if errors:
+            return ExecutionResult(errors=errors, invalid=True)
+        if not middleware:
+            middleware = self.middleware_manager
+        elif self.middleware:
+            middleware = self.middleware + list(getattr(middleware, 'middlewares', middleware))
+        scope = ExecutionScope(executor or self.executor)
+        try:
+            with scope:
+                result = execute(
+                    self,
+                    document_ast,
+                    root_value,
+                    context_value,
+                    operation_name=operation_name,
+                    variable_values=variable_values or {},
+                    executor=scope,
+                    return_promise=return_promise,
+                    middleware=middleware,
+                )
+        except Exception as e:
+            return ExecutionResult(errors=[e], invalid=True)
+        if return_promise:
+            # Nobody waits for the execution, so the deferred work
+            # is dispatched as soon as possible from now on
+            scope.dispatch_eagerly()
+        result = maybe_thenable(result, scope.add_extensions)
+        if self.cache_control is not None:
+            result = self.cache_control.add_hints(result, document_ast, operation_name)
+        return result
+
+    def compile(self, request_string, operation_name=None):
+        '''
+        Compiles the operation into a ``CompiledQuery``, that can be executed
+        many times without walking the document again.
+        '''
+        document_ast, errors = self.get_document(request_string)
+        if errors:
+            raise Exception(
+                'The query is not valid: {}'.format(' '.join(error.message for error in errors))
+            )
+        return CompiledQuery(self, document_ast, operation_name)
+
+    def get_document(self, request_string):
+        '''
+        Returns the parsed document of the request along with
+        its validation errors.
+        '''
+        if isinstance(request_string, Document):
+            return request_string, validate(self, request_string, self.validation_rules)
+        if self.document_cache is None:
+            return parse_and_validate(self, request_string)
+        return self.document_cache.get_document(self, request_string)
 
     def register(self, object_type):
-        self.types.append(object_type)
+        '''
+        Adds the type to the schema, building only it and the types it
+        refers to that the schema doesn't have yet.
+        '''
+        self._type_map.register(object_type)
+        self.types = list(self.types or []) + [object_type]
+        self.clear_caches()
+        if self.frozen:
+            self.freeze()
 
     def introspect(self):
         return self.execute(introspection_query).data
@@ -73,6 +248,36 @@ class Schema(GraphQLSchema):
     def lazy(self, _type):
         return lambda: self.get_type(_type)
 
+    def save_snapshot(self, path):
+        '''
+        Saves the types of the schema, with the resolvers of their fields
+        referenced by import path, to be loaded by the schemas created
+        with the same ``snapshot`` path.
+        '''
+        self.warm()
+        save_type_map(self, path)
+
+    def freeze(self):
+        '''
+        Finishes building the schema, so the executions don't change its
+        types, and moves all the objects tracked by the garbage collector
+        into a generation it ignores (with ``gc.freeze``, in Python 3.7+).
+
+        Meant to be called before forking the workers of a server, for
+        them to keep sharing the memory of the schema.
+        '''
+        self._type_map.finalize()
+        self.frozen = True
+        if hasattr(gc, 'freeze'):
+            gc.collect()
+            gc.freeze()
+
+    def warm(self):
+        '''
+        Builds the fields of all the types of a ``lazy`` schema.
+        '''
+        self._type_map.warm()
+
     def build_typemap(self):
         initial_types = [
             self._query,
@@ -82,4 +287,27 @@ class Schema(GraphQLSchema):
         ]
         if self.types:
             initial_types += self.types
-        self._type_map = TypeMap(initial_types, auto_camelcase=self.auto_camelcase)
+        self._type_map = None
+        if self.snapshot:
+            self._type_map = load_type_map(self, self.snapshot)
+        if self._type_map is None:
+            self._type_map = TypeMap(initial_types, auto_camelcase=self.auto_camelcase, lazy=self.lazy_fields)
+            if self.snapshot:
+                try:
+                    self.save_snapshot(self.snapshot)
+                except Exception as e:
+                    # Like the schemas with resolvers that can't be pickled
+                    warnings.warn('The schema snapshot could not be saved: {}'.format(e))
+        self.clear_caches()
+        if self.frozen:
+            self.freeze()
+
+    def clear_caches(self):
+        '''
+        Clears what the schema keeps about the queries it executed, once
+        its types change.
+        '''
+        if self.document_cache is not None:
+            self.document_cache.clear()
+        if self.cache_control is not None:
+            self.cache_control.hints.clear()
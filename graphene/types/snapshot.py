@@ -0,0 +1,206 @@
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+from importlib import import_module
+
+from graphql.type import GraphQLDirective, GraphQLField
+from graphql.type.definition import GraphQLType
+
+# The types and directives of graphql-core are pickled by reference
+# to their modules, so the rehydrated schemas keep using the same ones
+GRAPHQL_MODULES = ('graphql.type.scalars', 'graphql.type.introspection', 'graphql.type.directives')
+
+
+def get_graphql_definitions():
+    definitions = {}
+    for module_name in GRAPHQL_MODULES:
+        module = import_module(module_name)
+        for name, value in vars(module).items():
+            if isinstance(value, (GraphQLType, GraphQLDirective, GraphQLField)):
+                definitions[id(value)] = (module_name, name)
+    return definitions
+
+
+def get_graphene_definitions(type_map):
+    '''
+    Returns the module and attribute path of the graphene types of the
+    type map, including the ones created on the fly as attributes of
+    other types (like the ``Connection`` of the nodes and its ``Edge``).
+    '''
+    types = set(
+        _type.graphene_type
+        for _type in type_map.values()
+        if getattr(_type, 'graphene_type', None) is not None
+    )
+    definitions = {}
+    for _type in types:
+        path = getattr(_type, '__qualname__', _type.__name__)
+        if get_attribute(_type.__module__, path) is _type:
+            definitions[id(_type)] = (_type.__module__, path)
+    found = list(types)
+    while found:
+        owners, found = found, []
+        for owner in owners:
+            if id(owner) not in definitions:
+                continue
+            module_name, path = definitions[id(owner)]
+            for name, value in vars(owner).items():
+                if isinstance(value, type) and value in types and id(value) not in definitions:
+                    definitions[id(value)] = (module_name, '{}.{}'.format(path, name))
+                    found.append(value)
+    return definitions
+
+
+def get_attribute(module_name, path):
+    value = sys.modules.get(module_name) or import_module(module_name)
+    for name in path.split('.'):
+        value = getattr(value, name, None)
+    return value
+
+
+def get_type_name(_type):
+    if not _type:
+        return None
+    return '{}.{}'.format(_type.__module__, _type.__name__)
+
+
+def get_module_source(module_name):
+    filename = getattr(sys.modules.get(module_name), '__file__', None)
+    if not filename:
+        return b''
+    if filename.endswith(('.pyc', '.pyo')):
+        filename = filename[:-1]
+    try:
+        with open(filename, 'rb') as f:
+            return f.read()
+    except (IOError, OSError):
+        return b''
+
+
+def get_checksum(schema, modules):
+    '''
+    Returns the checksum of the source of the given modules (those
+    defining the types of the schema and their resolvers), the root types
+    and options of the schema and the versions of Python and graphene.
+    '''
+    from .. import __version__
+    checksum = hashlib.sha256()
+    checksum.update(repr((
+        __version__,
+        tuple(sys.version_info[:2]),
+        get_type_name(schema._query),
+        get_type_name(schema._mutation),
+        get_type_name(schema._subscription),
+        [get_type_name(_type) for _type in schema.types or ()],
+        schema.auto_camelcase,
+    )).encode('utf-8'))
+    for module_name in sorted(modules):
+        checksum.update(module_name.encode('utf-8'))
+        checksum.update(hashlib.sha256(get_module_source(module_name)).digest())
+    return checksum.hexdigest()
+
+
+# The attributes of the resolvers wrapping other ones (like the partials,
+# batched, cached and offloaded resolvers)
+WRAPPED_RESOLVER_ATTRIBUTES = ('func', 'batch_fn', 'resolver', '__wrapped__', '__func__')
+
+# The modules of the builtin resolvers and of the partials (since Python
+# 3.10), that can't change without changing the Python version
+IGNORED_RESOLVER_MODULES = frozenset(sys.builtin_module_names) | frozenset(['functools'])
+
+
+def get_resolver_modules(resolver):
+    modules = set()
+    found = [resolver]
+    seen = set()
+    while found:
+        resolver = found.pop()
+        if resolver is None or id(resolver) in seen:
+            continue
+        seen.add(id(resolver))
+        module_name = getattr(resolver, '__module__', None)
+        if module_name and module_name not in IGNORED_RESOLVER_MODULES:
+            modules.add(module_name)
+        found.extend(getattr(resolver, name, None) for name in WRAPPED_RESOLVER_ATTRIBUTES)
+    return modules
+
+
+def get_type_modules(type_map):
+    '''
+    Returns the modules whose changes could change the type map: the
+    ones of the graphene types, of their base classes and mixins, and of
+    the resolvers of their fields.
+    '''
+    modules = set()
+    for _type in type_map.values():
+        graphene_type = getattr(_type, 'graphene_type', None)
+        if graphene_type is None:
+            continue
+        modules.update(cls.__module__ for cls in getattr(graphene_type, '__mro__', ()))
+        fields = getattr(_type, 'fields', None)
+        for field in (fields.values() if isinstance(fields, dict) else ()):
+            modules.update(get_resolver_modules(getattr(field, 'resolver', None)))
+    return sorted(module_name for module_name in modules if module_name in sys.modules)
+
+
+class SnapshotPickler(pickle.Pickler, object):
+
+    def __init__(self, file, type_map):
+        super(SnapshotPickler, self).__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.definitions = get_graphql_definitions()
+        self.definitions.update(get_graphene_definitions(type_map))
+
+    def persistent_id(self, obj):
+        return self.definitions.get(id(obj))
+
+
+class SnapshotUnpickler(pickle.Unpickler, object):
+
+    def persistent_load(self, pid):
+        value = get_attribute(*pid)
+        if value is None:
+            raise pickle.UnpicklingError('{} not found in {}.'.format(pid[1], pid[0]))
+        return value
+
+
+def save_type_map(schema, path):
+    '''
+    Writes the type map of the schema to the file at the given path,
+    along with the checksum needed to load it.
+    '''
+    type_map = schema._type_map
+    modules = get_type_modules(type_map)
+    directory = os.path.dirname(os.path.abspath(path))
+    # Written to a temporary file first, as other processes could
+    # be loading the snapshot meanwhile
+    with tempfile.NamedTemporaryFile(dir=directory, delete=False) as f:
+        try:
+            pickler = SnapshotPickler(f, type_map)
+            pickler.dump((get_checksum(schema, modules), modules))
+            pickler.dump(type_map)
+        except Exception:
+            f.close()
+            os.remove(f.name)
+            raise
+    getattr(os, 'replace', os.rename)(f.name, path)
+
+
+def load_type_map(schema, path):
+    '''
+    Returns the type map saved at the given path, or None if there is
+    none or the definitions of its types changed since it was saved.
+    '''
+    try:
+        with open(path, 'rb') as f:
+            unpickler = SnapshotUnpickler(f)
+            checksum, modules = unpickler.load()
+            for module_name in modules:
+                import_module(module_name)
+            if checksum != get_checksum(schema, modules):
+                return None
+            return unpickler.load()
+    except Exception:
+        # Missing, or saved by another version and unreadable
+        return None
@@ -0,0 +1,120 @@
+'''
+Measures the private memory of the workers forked from a process with
+a large generated schema, like the ones of a pre-fork server:
+
+    python -m graphene.types.tests.fork_memory --types 2000 --freeze
+
+The memory shared with the parent process becomes private to a worker
+as soon as it writes to it (copy on write), even just by changing the
+reference count of an object or collecting the garbage.
+'''
+import argparse
+import gc
+import json
+import os
+
+from ..field import Field
+from ..interface import Interface
+from ..objecttype import ObjectType
+from ..scalars import Int, String
+from ..schema import Schema
+from ..structures import List
+
+
+def get_private_memory():
+    '''
+    Returns the bytes of memory private to the current process (Linux only).
+    '''
+    private = 0
+    with open('/proc/self/smaps') as f:
+        for line in f:
+            if line.startswith(('Private_Clean:', 'Private_Dirty:')):
+                private += int(line.split()[1]) * 1024
+    return private
+
+
+class Named(Interface):
+    name = String()
+
+
+def generate_schema(types=1000, fields=10, **kwargs):
+    query_fields = {}
+    for i in range(types):
+        attrs = {
+            'f{}'.format(j): String(arg=Int(), description='Field {}'.format(j))
+            for j in range(fields)
+        }
+        attrs['Meta'] = type('Meta', (), {'interfaces': (Named, )})
+        object_type = type('Type{}'.format(i), (ObjectType, ), attrs)
+        query_fields['t{}'.format(i)] = List(object_type)
+        query_fields['resolve_t{}'.format(i)] = (
+            lambda object_type: lambda *_: [object_type(name='Name')]
+        )(object_type)
+    query_fields['named'] = Field(Named)
+    query = type('Query', (ObjectType, ), query_fields)
+    return Schema(query=query, **kwargs)
+
+
+def generate_query(types=1000, fields=10):
+    selections = ' '.join('f{}'.format(j) for j in range(fields))
+    return '{{ {} }}'.format(' '.join(
+        't{} {{ name {} }}'.format(i, selections) for i in range(types)
+    ))
+
+
+def measure(types=1000, fields=10, selected=20, workers=2, freeze=False, lazy=False):
+    '''
+    Returns the private memory of each worker forked after building the
+    schema, once they execute a query selecting ``selected`` of its types
+    and collect the garbage.
+    '''
+    schema = generate_schema(types, fields, freeze=freeze, lazy=lazy)
+    query = generate_query(selected, fields)
+    results = []
+    for i in range(workers):
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover
+            status = 1
+            try:
+                os.close(read)
+                before = get_private_memory()
+                result = schema.execute(query)
+                assert not result.errors, result.errors
+                gc.collect()
+                os.write(write, json.dumps(get_private_memory() - before).encode('utf-8'))
+                status = 0
+            finally:
+                os._exit(status)
+        os.close(write)
+        with os.fdopen(read) as f:
+            output = f.read()
+        os.waitpid(pid, 0)
+        results.append(json.loads(output))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Measures the private memory of the workers forked after building a large schema.'
+    )
+    parser.add_argument('--types', type=int, default=1000)
+    parser.add_argument('--fields', type=int, default=10)
+    parser.add_argument('--selected', type=int, default=20, help='types selected by the query of the workers')
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--freeze', action='store_true')
+    parser.add_argument('--lazy', action='store_true')
+    parser.add_argument('--json', action='store_true', help='print the bytes of each worker as JSON')
+    options = parser.parse_args(argv)
+    results = measure(
+        options.types, options.fields, options.selected, options.workers, options.freeze, options.lazy
+    )
+    if options.json:
+        print(json.dumps(results))
+    else:
+        for i, private in enumerate(results):
+            print('Worker {}: {:.1f} MiB private'.format(i, private / 1024. / 1024.))
+
+
+if __name__ == '__main__':
+    main()
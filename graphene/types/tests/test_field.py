@@ -3,7 +3,7 @@ import pytest
 from ..argument import Argument
 from ..field import Field
 from ..structures import NonNull
-from ..scalars import String
+from ..scalars import Boolean, Int, String
 
 
 class MyInstance(object):
@@ -90,6 +90,42 @@ def test_field_name_as_argument():
     assert field.args['name'].type == String
 
 
+def test_field_cost_and_multipliers_as_arguments():
+    MyType = object()
+    field = Field(MyType, cost=Int(), multipliers=Argument(Int))
+    assert list(field.args.keys()) == ['cost', 'multipliers']
+    assert field.args['cost'].type == Int
+    assert field.args['multipliers'].type == Int
+    assert field.cost is None
+    assert field.multipliers == ()
+
+
+def test_field_cache_as_argument():
+    MyType = object()
+    field = Field(MyType, cache=String())
+    assert 'cache' in field.args
+    assert field.args['cache'].type == String
+    assert field.cache is None
+
+
+def test_field_cache_hints_as_arguments():
+    MyType = object()
+    field = Field(MyType, max_age=Int(), cache_scope=String())
+    assert list(field.args.keys()) == ['max_age', 'cache_scope']
+    assert field.args['max_age'].type == Int
+    assert field.args['cache_scope'].type == String
+    assert field.max_age is None
+    assert field.cache_scope is None
+
+
+def test_field_batch_as_argument():
+    MyType = object()
+    field = Field(MyType, batch=Boolean())
+    assert 'batch' in field.args
+    assert field.args['batch'].type == Boolean
+    assert not field.batch
+
+
 def test_field_source_argument_as_kw():
     MyType = object()
     field = Field(MyType, b=NonNull(True), c=Argument(None), a=NonNull(False))
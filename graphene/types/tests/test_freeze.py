@@ -0,0 +1,85 @@
+import gc
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from ..enum import Enum
+from ..field import Field
+from ..interface import Interface
+from ..objecttype import ObjectType
+from ..scalars import String
+from ..schema import Schema
+from ..typemap import LazyFields
+
+
+def teardown_function(function):
+    if hasattr(gc, 'unfreeze'):
+        gc.unfreeze()
+
+
+class Episode(Enum):
+    NEWHOPE = 4
+    EMPIRE = 5
+
+
+class Named(Interface):
+    name = String()
+
+
+class Person(ObjectType):
+
+    class Meta:
+        interfaces = (Named, )
+
+    episode = Field(Episode)
+
+    def resolve_episode(self, args, context, info):
+        return Episode.EMPIRE.value
+
+
+class Query(ObjectType):
+    named = Field(Named)
+
+    def resolve_named(self, args, context, info):
+        return Person(name='Luke')
+
+
+def get_state(schema):
+    return dict(
+        (name, sorted(getattr(_type, '__dict__', ())))
+        for name, _type in schema.get_type_map().items()
+    ), dict(schema.get_type_map()._possible_type_map)
+
+
+def test_frozen_schemas_are_not_changed_by_the_executions():
+    schema = Schema(query=Query, types=[Person], lazy=True, freeze=True)
+    assert schema.frozen
+    assert not isinstance(schema.get_type('Person')._fields, LazyFields)
+    state = get_state(schema)
+    result = schema.execute('{ named { name ... on Person { episode } } }')
+    assert result.data == {'named': {'name': 'Luke', 'episode': 'EMPIRE'}}
+    assert get_state(schema) == state
+
+
+def test_frozen_schemas_are_frozen_again_when_rebuilt():
+    schema = Schema(query=Query, types=[Person], lazy=True)
+    schema.freeze()
+    schema.build_typemap()
+    assert not isinstance(schema.get_type('Person')._fields, LazyFields)
+
+
+@pytest.mark.skipif(
+    not hasattr(gc, 'freeze') or not hasattr(os, 'fork') or not os.path.exists('/proc/self/smaps'),
+    reason='Measuring the memory of forked workers needs Linux and Python 3.7+'
+)
+def test_frozen_schemas_keep_the_memory_of_forked_workers_shared():
+    def measure(*args):
+        output = subprocess.check_output([
+            sys.executable, '-m', 'graphene.types.tests.fork_memory', '--types', '200', '--json'
+        ] + list(args))
+        return json.loads(output.decode('utf-8'))
+
+    assert max(measure('--freeze')) < min(measure())
@@ -0,0 +1,59 @@
+from ..field import Field
+from ..inputobjecttype import InputObjectType
+from ..objecttype import ObjectType
+from ..profiler import BuildProfiler, get_build_profiler, main
+from ..scalars import String
+from ..schema import Schema
+from ..structures import List
+
+
+class Filter(InputObjectType):
+    name = String()
+
+
+class Person(ObjectType):
+    name = String()
+    friends = List(lambda: Person)
+
+
+class Query(ObjectType):
+    people = List(Person, filter=Filter())
+    me = Field(Person)
+
+
+schema = Schema(query=Query)
+
+
+def test_build_profiler():
+    with BuildProfiler() as profiler:
+        assert get_build_profiler() is profiler
+        Schema(query=Query)
+    assert get_build_profiler() is None
+    assert set(profiler.stats) == {'Query', 'Person', 'Filter', 'String'}
+    assert profiler.total_time > 0
+    assert profiler.total_memory > 0
+    assert profiler.total_time >= sum(spent for name, spent, allocated in profiler.get_slowest())
+    assert len(profiler.get_slowest(2)) == 2
+
+    report = profiler.report()
+    assert report.startswith('Built 4 types in ')
+    assert 'Person' in report
+
+
+def test_typemaps_are_only_instrumented_within_a_profiler():
+    assert 'graphene_reducer' not in vars(Schema(query=Query)._type_map)
+
+
+def test_build_profiler_without_memory():
+    with BuildProfiler(trace_memory=False) as profiler:
+        Schema(query=Query)
+    assert profiler.total_memory == 0
+    assert 'allocating' not in profiler.report()
+
+
+def test_command_line(capsys):
+    main(['graphene.types.tests.test_profiler:schema', '--limit', '1'])
+    out = capsys.readouterr()[0]
+    assert out.startswith('Imported graphene.types.tests.test_profiler:schema in ')
+    assert 'Built 4 types in ' in out
+    assert len(out.strip().split('\n')) == 5
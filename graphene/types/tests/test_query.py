@@ -307,3 +307,26 @@ def test_big_list_of_containers_multiple_fields_custom_resolvers_query_benchmark
     result = benchmark(big_list_query)
     assert not result.errors
     assert result.data == {'allContainers': [{'x': c.x, 'y': c.y, 'z': c.z, 'o': c.o} for c in big_container_list]}
+
+
+def test_big_list_of_containers_multiple_fields_compiled_query_benchmark(benchmark):
+    class Container(ObjectType):
+        x = Int()
+        y = Int()
+        z = Int()
+        o = Int()
+
+    big_container_list = [Container(x=x, y=x, z=x, o=x) for x in range(1000)]
+
+    class Query(ObjectType):
+        all_containers = List(Container)
+
+        def resolve_all_containers(self, args, context, info):
+            return big_container_list
+
+    hello_schema = Schema(Query)
+
+    big_list_query = hello_schema.compile('{ allContainers { x, y, z, o } }')
+    result = benchmark(big_list_query)
+    assert not result.errors
+    assert result.data == {'allContainers': [{'x': c.x, 'y': c.y, 'z': c.z, 'o': c.o} for c in big_container_list]}
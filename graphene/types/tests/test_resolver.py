@@ -0,0 +1,150 @@
+from functools import partial
+
+import pytest
+
+from ..field import Field
+from ..objecttype import ObjectType
+from ..resolver import (AttributeResolver, DictResolver, attr_resolver,
+                        dict_resolver)
+from ..scalars import Int, String
+from ..schema import Schema
+from ..structures import List
+
+args = {}
+context = None
+info = None
+
+demo_dict = {
+    'attr': 'value'
+}
+
+
+class demo_obj(object):
+    attr = 'value'
+
+
+def test_attr_resolver():
+    resolved = attr_resolver('attr', None, demo_obj(), args, context, info)
+    assert resolved == 'value'
+
+
+def test_attr_resolver_default_value():
+    resolved = attr_resolver('attr2', 'default', demo_obj(), args, context, info)
+    assert resolved == 'default'
+
+
+def test_dict_resolver():
+    resolved = dict_resolver('attr', None, demo_dict, args, context, info)
+    assert resolved == 'value'
+
+
+def test_dict_resolver_default_value():
+    resolved = dict_resolver('attr2', 'default', demo_dict, args, context, info)
+    assert resolved == 'default'
+
+
+def test_attribute_resolver():
+    resolver = AttributeResolver('attr', 'default')
+    assert resolver.attname == 'attr'
+    assert resolver.default_value == 'default'
+    assert resolver.func is attr_resolver
+    assert resolver(demo_obj(), args, context, info) == 'value'
+    assert AttributeResolver('attr2', 'default')(demo_obj(), args, context, info) == 'default'
+
+
+def test_dict_resolver_object():
+    resolver = DictResolver('attr')
+    assert resolver.func is dict_resolver
+    assert resolver(demo_dict, args, context, info) == 'value'
+    assert resolver({}, args, context, info) is None
+
+
+def test_objecttype_default_resolver():
+    class MyType(ObjectType):
+        field = String()
+
+    class Query(ObjectType):
+        my_type = Field(MyType)
+
+    schema = Schema(Query)
+    field = schema.get_type('MyType').fields['field']
+    assert isinstance(field.resolver, AttributeResolver)
+    assert field.resolver.attname == 'field'
+
+
+def test_objecttype_dict_resolver():
+    class MyType(ObjectType):
+        field = String()
+        other = String(default_value='other')
+
+        class Meta:
+            default_resolver = DictResolver
+
+    class Query(ObjectType):
+        my_type = Field(MyType)
+
+        def resolve_my_type(self, args, context, info):
+            return {'field': 'value'}
+
+    schema = Schema(Query)
+    query = '{ myType { field other } }'
+    executed = schema.execute(query)
+    assert not executed.errors
+    assert executed.data == {'myType': {'field': 'value', 'other': 'other'}}
+    assert schema.compile(query)().data == executed.data
+
+
+fields = ['field{}'.format(i) for i in range(10)]
+
+
+class Row(object):
+
+    def __init__(self, value):
+        for name in fields:
+            setattr(self, name, value)
+
+
+big_list_query = '{{ allRows {{ {} }} }}'.format(' '.join(fields))
+
+
+class PartialResolver(object):
+    # How the default resolver was built before AttributeResolver
+
+    def default_resolver(self, attname, default_value, root, *_):
+        return getattr(root, attname, default_value)
+
+
+def create_big_list_schema(get_field):
+    big_row_list = [Row(i) for i in range(100000)]
+    RowType = type('Row', (ObjectType, ), {name: get_field(name) for name in fields})
+
+    class Query(ObjectType):
+        all_rows = List(RowType)
+
+        def resolve_all_rows(self, args, context, info):
+            return big_row_list
+
+    return Schema(Query)
+
+
+@pytest.mark.benchmark(group='default_resolver')
+def test_big_list_default_resolver_benchmark(benchmark):
+    schema = create_big_list_schema(lambda name: Int())
+    compiled = schema.compile(big_list_query)
+
+    result = benchmark.pedantic(compiled, rounds=2)
+    assert not result.errors
+    assert len(result.data['allRows']) == 100000
+
+
+@pytest.mark.benchmark(group='default_resolver')
+def test_big_list_partial_resolver_benchmark(benchmark):
+    resolver = PartialResolver()
+    schema = create_big_list_schema(
+        lambda name: Int(resolver=partial(resolver.default_resolver, name, None))
+    )
+    compiled = schema.compile(big_list_query)
+
+    result = benchmark.pedantic(compiled, rounds=2)
+    assert not result.errors
+    assert len(result.data['allRows']) == 100000
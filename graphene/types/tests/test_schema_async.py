@@ -0,0 +1,104 @@
+import time
+
+import pytest
+
+from ..field import Field
+from ..objecttype import ObjectType
+from ..scalars import Int, String
+from ..schema import Schema
+from ..structures import List
+
+asyncio = pytest.importorskip('asyncio')
+if not hasattr(asyncio, 'ensure_future'):
+    pytest.skip('Awaitables need Python 3.5+', allow_module_level=True)
+
+DELAY = 0.1
+
+
+def sleep(result):
+    return asyncio.sleep(DELAY, result=result)
+
+
+class Item(ObjectType):
+    value = Int()
+    name = String()
+
+    def resolve_name(self, args, context, info):
+        return sleep('Item {}'.format(self.value))
+
+
+class Query(ObjectType):
+    a = String()
+    b = String()
+    c = String()
+    item = Field(Item)
+    items = List(Item)
+    error = String()
+
+    def resolve_a(self, args, context, info):
+        return sleep('a')
+
+    def resolve_b(self, args, context, info):
+        return sleep('b')
+
+    def resolve_c(self, args, context, info):
+        return 'c'
+
+    def resolve_item(self, args, context, info):
+        return sleep(Item(value=0))
+
+    def resolve_items(self, args, context, info):
+        return [sleep(Item(value=i)) for i in range(3)]
+
+    def resolve_error(self, args, context, info):
+        future = asyncio.Future()
+        future.set_exception(Exception('Failed'))
+        return future
+
+
+schema = Schema(query=Query)
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    yield loop
+    asyncio.set_event_loop(None)
+    loop.close()
+
+
+def test_execute_async_returns_a_future_of_the_result(loop):
+    future = schema.execute_async('{ a c item { value name } }', loop=loop)
+    assert isinstance(future, asyncio.Future)
+    result = loop.run_until_complete(future)
+    assert not result.errors
+    assert result.data == {'a': 'a', 'c': 'c', 'item': {'value': 0, 'name': 'Item 0'}}
+
+
+def test_execute_async_resolves_siblings_concurrently(loop):
+    start = time.time()
+    result = loop.run_until_complete(schema.execute_async('{ a b }', loop=loop))
+    assert not result.errors
+    assert result.data == {'a': 'a', 'b': 'b'}
+    assert time.time() - start < DELAY * 2
+
+
+def test_execute_async_resolves_list_items_concurrently(loop):
+    start = time.time()
+    result = loop.run_until_complete(schema.execute_async('{ items { name } }', loop=loop))
+    assert not result.errors
+    assert result.data == {'items': [{'name': 'Item 0'}, {'name': 'Item 1'}, {'name': 'Item 2'}]}
+    # The items and then their names are resolved together
+    assert time.time() - start < DELAY * 3
+
+
+def test_execute_async_errors(loop):
+    result = loop.run_until_complete(schema.execute_async('{ a error }', loop=loop))
+    assert result.data == {'a': 'a', 'error': None}
+    assert [str(error) for error in result.errors] == ['Failed']
+
+
+def test_execute_async_invalid_query(loop):
+    result = loop.run_until_complete(schema.execute_async('{ unknown }', loop=loop))
+    assert result.invalid
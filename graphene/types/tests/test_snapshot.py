@@ -0,0 +1,164 @@
+from functools import partial
+
+import pytest
+from graphql.type import GraphQLString
+from graphql.utils.introspection_query import introspection_query
+
+from ...execution.batching import BatchResolver
+from ...relay import Connection, ConnectionField, Node
+from ...utils.get_unbound_function import get_unbound_function
+from .. import snapshot
+from ..enum import Enum
+from ..field import Field
+from ..objecttype import ObjectType
+from ..profiler import BuildProfiler
+from ..scalars import Int, String
+from ..schema import Schema
+from ..union import Union
+
+
+class Episode(Enum):
+    NEWHOPE = 4
+    EMPIRE = 5
+
+
+class Ship(ObjectType):
+
+    class Meta:
+        interfaces = (Node, )
+
+    name = String()
+
+    @classmethod
+    def get_node(cls, id, context, info):
+        return Ship(id=id, name='Ship {}'.format(id))
+
+
+class ShipConnection(Connection):
+
+    class Meta:
+        node = Ship
+
+
+class Droid(ObjectType):
+    name = String()
+
+
+class Character(Union):
+
+    class Meta:
+        types = (Ship, Droid)
+
+    @classmethod
+    def resolve_type(cls, instance, context, info):
+        return type(instance)
+
+
+class Query(ObjectType):
+    node = Node.Field()
+    ships = ConnectionField(ShipConnection, min_size=Int())
+    episode = Field(Episode)
+    character = Field(Character)
+
+    def resolve_ships(self, args, context, info):
+        return [Ship(id=i, name='Ship {}'.format(i)) for i in range(3)]
+
+    def resolve_episode(self, args, context, info):
+        return Episode.EMPIRE.value
+
+    def resolve_character(self, args, context, info):
+        return Droid(name='R2-D2')
+
+
+query = '''{
+    ships(first: 2) { edges { node { id name } } }
+    node(id: "U2hpcDox") { ... on Ship { name } }
+    episode
+    character { ... on Droid { name } }
+}'''
+
+
+def build(path):
+    with BuildProfiler(trace_memory=False) as profiler:
+        schema = Schema(query=Query, snapshot=str(path))
+    return schema, profiler.stats
+
+
+def test_schemas_are_loaded_from_their_snapshot(tmpdir):
+    path = tmpdir.join('schema.pickle')
+    built, stats = build(path)
+    assert stats
+    assert path.check()
+
+    loaded, stats = build(path)
+    assert not stats
+    assert loaded.get_type('String') is GraphQLString
+    assert loaded.get_type('Ship').graphene_type is Ship
+    assert loaded.execute(introspection_query).data == built.execute(introspection_query).data
+    result = loaded.execute(query)
+    assert not result.errors
+    assert result.data == built.execute(query).data
+
+
+def test_snapshots_are_rebuilt_when_the_types_change(tmpdir, monkeypatch):
+    path = tmpdir.join('schema.pickle')
+    build(path)
+    get_module_source = snapshot.get_module_source
+    monkeypatch.setattr(snapshot, 'get_module_source', lambda name: get_module_source(name) + b'\n')
+    schema, stats = build(path)
+    assert stats
+    # The snapshot is saved again with the new definitions
+    schema, stats = build(path)
+    assert not stats
+
+
+def test_snapshots_are_rebuilt_when_the_mixins_change(tmpdir, monkeypatch):
+    # The mixin is defined in another module than the type using it
+    mixins = tmpdir.join('snapshot_mixins.py')
+    mixins.write('import graphene\n\n\nclass Timestamped(graphene.AbstractType):\n    created = graphene.String()\n')
+    tmpdir.join('snapshot_articles.py').write(
+        'import graphene\nfrom snapshot_mixins import Timestamped\n\n\n'
+        'class Article(Timestamped, graphene.ObjectType):\n    title = graphene.String()\n'
+    )
+    monkeypatch.syspath_prepend(str(tmpdir))
+    from snapshot_articles import Article
+    path = tmpdir.join('schema.pickle')
+
+    def build():
+        with BuildProfiler(trace_memory=False) as profiler:
+            Schema(query=Query, types=[Article], snapshot=str(path))
+        return profiler.stats
+
+    assert build()
+    assert not build()
+    mixins.write('    updated = graphene.String()\n', mode='a')
+    assert build()
+
+
+def test_the_modules_of_the_wrapped_resolvers_are_checked():
+    resolver = BatchResolver(partial(get_unbound_function, None))
+    assert snapshot.get_resolver_modules(resolver) == set([
+        'graphene.execution.batching', 'graphene.utils.get_unbound_function'
+    ])
+    assert snapshot.get_resolver_modules(partial(getattr, None)) == set()
+
+
+def test_invalid_snapshots_are_rebuilt(tmpdir):
+    path = tmpdir.join('schema.pickle')
+    path.write('invalid')
+    schema, stats = build(path)
+    assert stats
+    assert schema.execute('{ episode }').data == {'episode': 'EMPIRE'}
+
+
+def test_schemas_that_cant_be_pickled(tmpdir):
+    path = tmpdir.join('schema.pickle')
+
+    class LocalQuery(ObjectType):
+        hello = String(resolver=lambda *_: 'World')
+
+    with pytest.warns(UserWarning):
+        schema = Schema(query=LocalQuery, snapshot=str(path))
+    assert schema.execute('{ hello }').data == {'hello': 'World'}
+    assert not path.check()
+    assert not tmpdir.listdir()
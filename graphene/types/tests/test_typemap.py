@@ -1,4 +1,8 @@
 
+from functools import partial
+from threading import Thread
+
+import pytest
 from graphql.type import (GraphQLArgument, GraphQLEnumType, GraphQLEnumValue,
                           GraphQLField, GraphQLInputObjectField,
                           GraphQLInputObjectType, GraphQLInterfaceType,
@@ -11,8 +15,9 @@ from ..inputfield import InputField
 from ..inputobjecttype import InputObjectType
 from ..interface import Interface
 from ..objecttype import ObjectType
-from ..scalars import String
-from ..typemap import TypeMap
+from ..scalars import Int, String
+from ..schema import Schema
+from ..typemap import LazyFields, TypeMap
 
 
 def test_enum():
@@ -183,3 +188,210 @@ def test_objecttype_camelcase_disabled():
     assert foo_field.args == {
         'bar_foo': GraphQLArgument(GraphQLString, out_name='bar_foo')
     }
+
+
+def test_lazy_objecttype():
+    class Role(InputObjectType):
+        name = String()
+
+    class Admin(ObjectType):
+        secret = String(role=Role())
+        dynamic = Dynamic(lambda: Field(Int))
+
+    class Query(ObjectType):
+        admin = Field(Admin)
+
+    typemap = TypeMap([Query], lazy=True)
+    assert list(typemap) == ['Query', 'Admin', 'String', 'Role', 'Int']
+    graphql_type = typemap['Admin']
+    assert isinstance(graphql_type._fields, LazyFields)
+
+    fields = graphql_type.fields
+    assert list(fields.keys()) == ['secret', 'dynamic']
+    assert fields['secret'].args['role'].type == typemap['Role']
+    assert fields['dynamic'].type == typemap['Int']
+    assert graphql_type._fields == fields
+
+
+def test_lazy_fields_are_built_once():
+    class MyObjectType(ObjectType):
+        foo = String()
+
+    typemap = TypeMap([MyObjectType], lazy=True)
+    built = []
+    construct_fields_for_type = typemap.construct_fields_for_type
+
+    def counted(*args):
+        built.append(args)
+        return construct_fields_for_type(*args)
+
+    typemap.construct_fields_for_type = counted
+    graphql_type = typemap['MyObjectType']
+    graphql_type._fields.build = partial(counted, typemap, MyObjectType)
+    threads = [Thread(target=lambda: graphql_type.fields) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(built) == 1
+
+
+def test_lazy_schema():
+    class MyInterface(Interface):
+        foo = String()
+
+    class Admin(ObjectType):
+
+        class Meta:
+            interfaces = (MyInterface, )
+
+        foo = String()
+
+        def resolve_foo(self, args, context, info):
+            return 'foo'
+
+    class Query(ObjectType):
+        admin = Field(Admin)
+        hello = String()
+
+        def resolve_admin(self, args, context, info):
+            return Admin()
+
+        def resolve_hello(self, args, context, info):
+            return 'World'
+
+    schema = Schema(query=Query, lazy=True)
+    assert schema.execute('{ hello }').data == {'hello': 'World'}
+    assert isinstance(schema.get_type('Admin')._fields, LazyFields)
+    assert schema.execute('{ admin { foo } }').data == {'admin': {'foo': 'foo'}}
+    assert not isinstance(schema.get_type('Admin')._fields, LazyFields)
+    schema.warm()
+    assert str(schema) == str(Schema(query=Query))
+
+
+def test_lazy_schema_checks_the_interfaces_on_warm():
+    class MyInterface(Interface):
+        foo = String()
+
+    class Admin(ObjectType):
+
+        class Meta:
+            interfaces = (MyInterface, )
+
+        foo = Int()
+
+    class Query(ObjectType):
+        admin = Field(Admin)
+
+    with pytest.raises(AssertionError):
+        Schema(query=Query)
+    schema = Schema(query=Query, lazy=True)
+    with pytest.raises(AssertionError) as excinfo:
+        schema.warm()
+    assert str(excinfo.value) == 'MyInterface.foo expects type "String" but Admin.foo provides type "Int".'
+
+
+def test_lazy_schema_keeps_the_lazy_method():
+    class Query(ObjectType):
+        hello = String()
+
+    schema = Schema(query=Query, lazy=True)
+    assert schema.lazy_fields
+    assert schema.lazy('Query')() is schema.get_type('Query')
+
+
+def test_register_builds_only_the_new_types():
+    class Named(Interface):
+        name = String()
+
+        @classmethod
+        def resolve_type(cls, instance, context, info):
+            return type(instance)
+
+    class Person(ObjectType):
+
+        class Meta:
+            interfaces = (Named, )
+
+    class Query(ObjectType):
+        named = Field(Named)
+
+        def resolve_named(self, args, context, info):
+            return Plugin(name='Plugin', version=1)
+
+    schema = Schema(query=Query, types=[Person])
+    query = '{ named { name ... on Plugin { version } } }'
+    assert schema.execute(query).errors
+    person = schema.get_type('Person')
+
+    class Version(ObjectType):
+        number = Int()
+
+    class Plugin(ObjectType):
+
+        class Meta:
+            interfaces = (Named, )
+
+        version = Int()
+        versions = Field(Version)
+
+    built = []
+    construct_objecttype = schema._type_map.construct_objecttype
+    schema._type_map.construct_objecttype = lambda map, type: built.append(type) or construct_objecttype(map, type)
+    schema.register(Plugin)
+    assert built == [Plugin, Version]
+    assert schema.types == [Person, Plugin]
+    assert schema.get_type('Person') is person
+    assert schema.get_possible_types(schema.get_type('Named')) == [person, schema.get_type('Plugin')]
+    assert schema.execute(query).data == {'named': {'name': 'Plugin', 'version': 1}}
+
+    # Registering them again changes nothing
+    schema.register(Plugin)
+    assert built == [Plugin, Version]
+
+
+def test_register_types_with_clashing_names():
+    class Query(ObjectType):
+        hello = String()
+
+    schema = Schema(query=Query)
+    OtherQuery = type('Query', (ObjectType, ), {'bye': String()})
+    with pytest.raises(AssertionError):
+        schema.register(OtherQuery)
+    assert schema.get_type('Query').graphene_type is Query
+    assert not schema.types
+
+
+def test_register_types_not_implementing_their_interfaces():
+    class Named(Interface):
+        name = String()
+
+    class Query(ObjectType):
+        named = Field(Named)
+
+    class Plugin(ObjectType):
+
+        class Meta:
+            interfaces = (Named, )
+
+        name = Int()
+
+    schema = Schema(query=Query)
+    with pytest.raises(AssertionError):
+        schema.register(Plugin)
+    assert 'Plugin' not in schema.get_type_map()
+    assert not schema.get_type_map()._implementations.get('Named')
+
+
+def test_register_into_lazy_schemas():
+    class Query(ObjectType):
+        hello = String()
+
+    class Plugin(ObjectType):
+        name = String()
+        other = Field(lambda: Plugin)
+
+    schema = Schema(query=Query, lazy=True)
+    schema.register(Plugin)
+    assert isinstance(schema.get_type('Plugin')._fields, LazyFields)
+    assert schema.get_type('Plugin').fields['other'].type is schema.get_type('Plugin')
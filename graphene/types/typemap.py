@@ -1,22 +1,30 @@
 import inspect
 from collections import OrderedDict
 from functools import partial
+from threading import Lock
 
-from graphql import (GraphQLArgument, GraphQLBoolean, GraphQLField,
+from graphql import (GraphQLArgument, GraphQLBoolean, GraphQLEnumType,
                      GraphQLFloat, GraphQLID, GraphQLInputObjectField,
-                     GraphQLInt, GraphQLList, GraphQLNonNull, GraphQLString)
+                     GraphQLInputObjectType, GraphQLInt, GraphQLInterfaceType,
+                     GraphQLList, GraphQLNonNull, GraphQLObjectType,
+                     GraphQLString, GraphQLUnionType)
 from graphql.type import GraphQLEnumValue
+from graphql.type.definition import get_named_type
 from graphql.execution.executor import get_default_resolve_type_fn
 from graphql.type.typemap import GraphQLTypeMap
+from six.moves import copyreg
 
+from ..execution.batching import BatchResolver, resolve_each
 from ..utils.str_converters import to_camel_case
 from ..utils.get_unbound_function import get_unbound_function
+from .definitions import GrapheneGraphQLType
 from .dynamic import Dynamic
 from .enum import Enum
 from .field import Field
 from .inputobjecttype import InputObjectType
 from .interface import Interface
 from .objecttype import ObjectType
+from .resolver import AttributeResolver
 from .scalars import ID, Boolean, Float, Int, Scalar, String
 from .structures import List, NonNull
 from .union import Union
@@ -45,12 +53,50 @@ def resolve_type(resolve_type_func, map, root, context, info):
     return _type
 
 
+class LazyFields(object):
+    '''
+    Builds the fields of a type the first time they are needed, only
+    once even if many threads need them at the same time.
+    '''
+
+    def __init__(self, build, graphql_type):
+        self.build = build
+        self.graphql_type = graphql_type
+        self.lock = Lock()
+        self.fields = None
+
+    def __call__(self):
+        with self.lock:
+            if self.fields is None:
+                self.fields = self.build()
+                self.graphql_type._fields = self.fields
+        return self.fields
+
+
 class TypeMap(GraphQLTypeMap):
+    '''
+    The GraphQL types of the given graphene types and the ones they
+    refer to.
 
-    def __init__(self, types, auto_camelcase=True):
+    When ``lazy``, the fields of the object types are built the first
+    time they are needed, instead of all at once.
+    '''
+
+    def __init__(self, types, auto_camelcase=True, lazy=False):
+        from .profiler import get_build_profiler
         self.auto_camelcase = auto_camelcase
+        self.lazy = lazy
+        profiler = get_build_profiler()
+        if profiler is not None:
+            profiler.instrument(self)
         super(TypeMap, self).__init__(types)
 
+    def __reduce__(self):
+        # Unpickled without building the types again (see snapshot.py),
+        # leaving out the methods instrumented by a BuildProfiler
+        state = dict((name, value) for name, value in vars(self).items() if not callable(value))
+        return copyreg.__newobj__, (type(self), ), state, None, iter(self.items())
+
     def reducer(self, map, type):
         if not type:
             return map
@@ -65,8 +111,10 @@ class TypeMap(GraphQLTypeMap):
             return self.reducer(map, type.of_type)
         if type._meta.name in map:
             _type = map[type._meta.name]
-            if is_graphene_type(_type):
-                assert _type.graphene_type == type
+            if isinstance(_type, GrapheneGraphQLType):
+                assert _type.graphene_type == type, (
+                    'Found different types with the same name in the schema: {}, {}.'
+                ).format(_type.graphene_type, type)
             return map
         if issubclass(type, ObjectType):
             return self.construct_objecttype(map, type)
@@ -127,8 +175,10 @@ class TypeMap(GraphQLTypeMap):
         from .definitions import GrapheneObjectType
         if type._meta.name in map:
             _type = map[type._meta.name]
-            if is_graphene_type(_type):
-                assert _type.graphene_type == type
+            if isinstance(_type, GrapheneGraphQLType):
+                assert _type.graphene_type == type, (
+                    'Found different types with the same name in the schema: {}, {}.'
+                ).format(_type.graphene_type, type)
             return map
         map[type._meta.name] = GrapheneObjectType(
             graphene_type=type,
@@ -143,6 +193,15 @@ class TypeMap(GraphQLTypeMap):
             map = self.reducer(map, i)
             interfaces.append(map[i._meta.name])
         map[type._meta.name]._provided_interfaces = interfaces
+        if self.lazy:
+            # The types of the fields are still needed in the map. Once
+            # the fields are needed, the map has all the types.
+            map = self.reduce_field_types(map, type)
+            map[type._meta.name]._fields = LazyFields(
+                partial(self.construct_fields_for_type, self, type),
+                map[type._meta.name]
+            )
+            return map
         map[type._meta.name]._fields = self.construct_fields_for_type(map, type)
         # self.reducer(map, map[type._meta.name])
         return map
@@ -151,7 +210,8 @@ class TypeMap(GraphQLTypeMap):
         from .definitions import GrapheneInterfaceType
         _resolve_type = None
         if type.resolve_type:
-            _resolve_type = partial(resolve_type, type.resolve_type, map)
+            # Resolved in the type map itself, that has the registered types too
+            _resolve_type = partial(resolve_type, type.resolve_type, self)
         map[type._meta.name] = GrapheneInterfaceType(
             graphene_type=type,
             name=type._meta.name,
@@ -178,7 +238,8 @@ class TypeMap(GraphQLTypeMap):
         from .definitions import GrapheneUnionType
         _resolve_type = None
         if type.resolve_type:
-            _resolve_type = partial(resolve_type, type.resolve_type, map)
+            # Resolved in the type map itself, that has the registered types too
+            _resolve_type = partial(resolve_type, type.resolve_type, self)
         types = []
         for i in type._meta.types:
             map = self.construct_objecttype(map, i)
@@ -192,15 +253,90 @@ class TypeMap(GraphQLTypeMap):
         map[type._meta.name].types = types
         return map
 
+    def reduce_field_types(self, map, type):
+        for name, field in type._meta.fields.items():
+            if isinstance(field, Dynamic):
+                field = get_field_as(field.get_type(), _as=Field)
+                if not field:
+                    continue
+            map = self.reducer(map, field.type)
+            for arg in field.args.values():
+                map = self.reducer(map, arg.type)
+        return map
+
+    def assert_object_implements_interface(self, schema, object, interface):
+        # The lazy objects are checked once their fields are built (on warm)
+        if not self.lazy:
+            GraphQLTypeMap.assert_object_implements_interface(schema, object, interface)
+
+    def warm(self):
+        '''
+        Builds the fields of all the types, checking that the objects
+        implement their interfaces.
+        '''
+        for type in self.values():
+            if isinstance(type, GraphQLObjectType):
+                type.fields
+                if not self.lazy:
+                    continue
+                for interface in type.interfaces:
+                    GraphQLTypeMap.assert_object_implements_interface(self, type, interface)
+
+    def register(self, type):
+        '''
+        Adds the given type to the map, building only the types that are
+        not in it yet. Returns the new types.
+        '''
+        reduced = self.reducer(OrderedDict(self), type)
+        new_types = [_type for name, _type in reduced.items() if name not in self]
+        implementations = dict((name, list(types)) for name, types in self._implementations.items())
+        self.update(reduced)
+        for _type in new_types:
+            if isinstance(_type, GraphQLObjectType):
+                for interface in _type.interfaces:
+                    self._implementations.setdefault(interface.name, []).append(_type)
+                    self._possible_type_map.pop(interface.name, None)
+        try:
+            for _type in new_types:
+                if isinstance(_type, GraphQLObjectType):
+                    for interface in _type.interfaces:
+                        self.assert_object_implements_interface(self, _type, interface)
+        except AssertionError:
+            for _type in new_types:
+                del self[_type.name]
+            self._implementations = implementations
+            self._possible_type_map.clear()
+            raise
+        return new_types
+
+    def finalize(self):
+        '''
+        Computes the state of the types that is otherwise computed (and
+        stored in them) the first time an execution needs it.
+        '''
+        self.warm()
+        for type in self.values():
+            if isinstance(type, GraphQLObjectType):
+                type.interfaces
+            if isinstance(type, (GraphQLInterfaceType, GraphQLInputObjectType)):
+                type.fields
+            if isinstance(type, GraphQLEnumType):
+                type._value_lookup
+                type._name_lookup
+            if isinstance(type, (GraphQLInterfaceType, GraphQLUnionType)):
+                possible_types = self.get_possible_types(type)
+                if possible_types:
+                    self._possible_type_map[type.name].update(
+                        possible_type.name for possible_type in possible_types
+                    )
+
     def get_name(self, name):
         if self.auto_camelcase:
             return to_camel_case(name)
         return name
 
-    def default_resolver(self, attname, default_value, root, *_):
-        return getattr(root, attname, default_value)
-
     def construct_fields_for_type(self, map, type, is_input_type=False):
+        from .definitions import GrapheneGraphQLField
         fields = OrderedDict()
         for name, field in type._meta.fields.items():
             if isinstance(field, Dynamic):
@@ -228,21 +364,58 @@ class TypeMap(GraphQLTypeMap):
                         description=arg.description,
                         default_value=arg.default_value
                     )
-                _field = GraphQLField(
+                max_age, cache_scope = self.get_cache_hints(field, field_type)
+                _field = GrapheneGraphQLField(
                     field_type,
                     args=args,
-                    resolver=field.get_resolver(self.get_resolver_for_type(type, name, field.default_value)),
+                    resolver=field.get_resolver(
+                        self.get_resolver_for_type(type, name, field.default_value, field.batch)
+                    ),
                     deprecation_reason=field.deprecation_reason,
-                    description=field.description
+                    description=field.description,
+                    max_age=max_age,
+                    cache_scope=cache_scope,
+                    cost=field.cost,
+                    multipliers=tuple(
+                        field.args[arg_name].name or self.get_name(arg_name)
+                        for arg_name in field.multipliers
+                    )
                 )
             field_name = field.name or self.get_name(name)
             fields[field_name] = _field
         return fields
 
-    def get_resolver_for_type(self, type, name, default_value):
+    def get_cache_hints(self, field, field_type):
+        # The fields without hints take the ones of the type they return
+        type_meta = getattr(getattr(get_named_type(field_type), 'graphene_type', None), '_meta', None)
+        max_age = field.max_age
+        if max_age is None:
+            max_age = getattr(type_meta, 'max_age', None)
+        return max_age, field.cache_scope or getattr(type_meta, 'cache_scope', None)
+
+    def get_resolver_for_type(self, type, name, default_value, batch=False):
         if not issubclass(type, ObjectType):
             return
-        resolver = getattr(type, 'resolve_{}'.format(name), None)
+        resolver = self.get_type_resolver(type, 'resolve_{}'.format(name), name)
+        if resolver:
+            return resolver
+
+        batch_name = '{}_batch'.format(name)
+        # Unless it is the resolver of a sibling field named like that
+        if batch_name not in type._meta.fields:
+            batch_resolver = self.get_type_resolver(type, 'resolve_{}'.format(batch_name), name)
+            if batch_resolver:
+                return BatchResolver(batch_resolver)
+
+        default_resolver = getattr(type._meta, 'default_resolver', None) or AttributeResolver
+        resolver = default_resolver(name, default_value)
+        if batch:
+            # The default resolvers receive a single root
+            return BatchResolver(partial(resolve_each, resolver))
+        return resolver
+
+    def get_type_resolver(self, type, attname, name):
+        resolver = getattr(type, attname, None)
         if not resolver:
             # If we don't find the resolver in the ObjectType class, then try to
             # find it in each of the interfaces
@@ -250,7 +423,7 @@ class TypeMap(GraphQLTypeMap):
             for interface in type._meta.interfaces:
                 if name not in interface._meta.fields:
                     continue
-                interface_resolver = getattr(interface, 'resolve_{}'.format(name), None)
+                interface_resolver = getattr(interface, attname, None)
                 if interface_resolver:
                     break
             resolver = interface_resolver
@@ -259,8 +432,6 @@ class TypeMap(GraphQLTypeMap):
         if resolver:
             return get_unbound_function(resolver)
 
-        return partial(self.default_resolver, name, default_value)
-
     def get_field_type(self, map, type):
         if isinstance(type, List):
             return GraphQLList(self.get_field_type(map, type.of_type))
@@ -0,0 +1,91 @@
+from collections import OrderedDict, namedtuple
+from threading import Lock
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'entries', 'size'])
+
+
+class LRUCache(object):
+    '''
+    A thread safe mapping that keeps at most ``max_entries`` items,
+    discarding the least recently used ones first.
+
+    If ``max_size`` is given, the entries are also evicted when the sum
+    of their sizes (as returned by ``get_size``) goes over it.
+    '''
+
+    def __init__(self, max_entries=128, max_size=None):
+        assert max_entries > 0, 'The cache needs room for at least one entry.'
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def get_size(self, key, value):
+        return 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                entry = self._entries.pop(key)
+            except KeyError:
+                self.misses += 1
+                return default
+            # Reinserting the entry marks it as the most recently used one
+            self._entries[key] = entry
+            self.hits += 1
+            return entry[0]
+
+    def set(self, key, value):
+        size = self.get_size(key, value)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= previous[1]
+            if self.max_size is not None and size > self.max_size:
+                # The value would evict everything else, so we don't keep it
+                return value
+            self._entries[key] = (value, size)
+            self.size += size
+            while len(self._entries) > self.max_entries or (
+                    self.max_size is not None and self.size > self.max_size):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.size -= evicted_size
+                self.evictions += 1
+        return value
+
+    def delete(self, key):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.size -= entry[1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def cache_info(self):
+        return CacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            entries=len(self._entries),
+            size=self.size,
+        )
+
+    def __setitem__(self, key, value):
+        self.set(key, value)
+
+    def __delitem__(self, key):
+        self.delete(key)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
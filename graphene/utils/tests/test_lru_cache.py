@@ -0,0 +1,90 @@
+from ..lru_cache import CacheInfo, LRUCache
+
+
+class SizedLRUCache(LRUCache):
+
+    def get_size(self, key, value):
+        return len(value)
+
+
+def test_lru_cache_get_set():
+    cache = LRUCache()
+    assert cache.get('a') is None
+    assert cache.get('a', 'default') == 'default'
+    assert cache.set('a', 1) == 1
+    assert cache.get('a') == 1
+    assert 'a' in cache
+    assert len(cache) == 1
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(max_entries=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    # Touching a makes b the least recently used entry
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert 'a' in cache
+    assert 'b' not in cache
+    assert 'c' in cache
+    assert cache.evictions == 1
+
+
+def test_lru_cache_evicts_by_size():
+    cache = SizedLRUCache(max_entries=10, max_size=5)
+    cache.set('a', 'aa')
+    cache.set('b', 'bb')
+    cache.set('c', 'cc')
+
+    assert 'a' not in cache
+    assert cache.size == 4
+
+
+def test_lru_cache_ignores_values_bigger_than_max_size():
+    cache = SizedLRUCache(max_entries=10, max_size=5)
+    cache.set('a', 'a')
+    assert cache.set('b', 'bbbbbb') == 'bbbbbb'
+
+    assert 'a' in cache
+    assert 'b' not in cache
+
+
+def test_lru_cache_replaces_value_size():
+    cache = SizedLRUCache(max_entries=10, max_size=5)
+    cache.set('a', 'aaaa')
+    cache.set('a', 'a')
+    assert cache.size == 1
+
+
+def test_lru_cache_delete_and_clear():
+    cache = SizedLRUCache()
+    cache.set('a', 'aa')
+    cache.set('b', 'bb')
+    cache.delete('a')
+    cache.delete('missing')
+    assert 'a' not in cache
+    assert cache.size == 2
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_lru_cache_info():
+    cache = SizedLRUCache(max_entries=1)
+    cache.get('a')
+    cache.set('a', 'aa')
+    cache.get('a')
+    cache.set('b', 'b')
+
+    assert cache.cache_info() == CacheInfo(hits=1, misses=1, evictions=1, entries=1, size=1)
+
+
+def test_lru_cache_item_assignment():
+    cache = LRUCache()
+    cache['a'] = 1
+    assert cache.get('a') == 1
+    del cache['a']
+    del cache['b']
+    assert 'a' not in cache
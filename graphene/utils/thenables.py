@@ -0,0 +1,26 @@
+from promise import Promise
+
+try:
+    from inspect import isawaitable
+    from .thenables_asyncio import await_and_execute, is_coroutine, result_to_future, run_within
+except (ImportError, SyntaxError):  # pragma: no cover
+    # Awaitables need Python 3.5+
+    def isawaitable(value):
+        return False
+
+    def is_coroutine(value):
+        return False
+
+    await_and_execute = result_to_future = run_within = None
+
+
+def maybe_thenable(value, on_resolve):
+    '''
+    Calls on_resolve with the value, once resolved if it is a promise
+    or an awaitable (returning a promise or a coroutine, respectively).
+    '''
+    if isinstance(value, Promise):
+        return value.then(on_resolve)
+    if isawaitable(value):
+        return await_and_execute(value, on_resolve)
+    return on_resolve(value)
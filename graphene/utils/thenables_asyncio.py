@@ -0,0 +1,76 @@
+from inspect import CO_ITERABLE_COROUTINE, iscoroutine, isgenerator
+
+from promise import Promise
+
+
+async def await_and_execute(value, on_resolve):
+    return on_resolve(await value)
+
+
+def is_coroutine(value):
+    '''
+    Returns whether the value is a coroutine, including the generator
+    based ones (decorated with ``types.coroutine``).
+    '''
+    return iscoroutine(value) or (
+        isgenerator(value) and bool(value.gi_code.co_flags & CO_ITERABLE_COROUTINE)
+    )
+
+
+class StepsWithin(object):
+    '''
+    Awaitable running each step of a coroutine within a context manager,
+    so its code runs within it even when the loop interleaves it with
+    other coroutines.
+    '''
+
+    __slots__ = ('context', 'coroutine')
+
+    def __init__(self, context, coroutine):
+        self.context = context
+        self.coroutine = coroutine
+
+    def __await__(self):
+        iterator = getattr(self.coroutine, '__await__', None)
+        iterator = iterator() if iterator else self.coroutine
+        send, value = iterator.send, None
+        while True:
+            with self.context:
+                try:
+                    signal = send(value)
+                except StopIteration as e:
+                    return e.value
+            try:
+                value = yield signal
+            except GeneratorExit:
+                iterator.close()
+                raise
+            except BaseException as e:
+                send, value = iterator.throw, e
+            else:
+                send = iterator.send
+
+
+async def run_within(context, coroutine):
+    return await StepsWithin(context, coroutine)
+
+
+def result_to_future(result, loop):
+    '''
+    Returns an asyncio future of the result, that can be a promise.
+    '''
+    future = loop.create_future()
+    if not isinstance(result, Promise):
+        future.set_result(result)
+        return future
+
+    def set_result(value):
+        if not future.done():
+            future.set_result(value)
+
+    def set_exception(error):
+        if not future.done():
+            future.set_exception(error)
+
+    result.then(set_result, set_exception)
+    return future
@@ -89,5 +89,10 @@ setup(
             'graphene-sqlalchemy',
         ]
     },
+    entry_points={
+        'console_scripts': [
+            'graphene-build-profile = graphene.types.profiler:main',
+        ],
+    },
     cmdclass={'test': PyTest},
 )